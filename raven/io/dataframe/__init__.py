@@ -15,5 +15,6 @@
 
 __all__ = [
     "dataframes",
-    "csvfiles"
+    "csvfiles",
+    "parquetfiles"
     ]
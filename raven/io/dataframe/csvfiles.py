@@ -37,12 +37,23 @@ See the write() function for more arguments.
 
 import re as regex_matcher
 
+import numpy as np
+
 import raven.struct.dataframe.core as dataframe
 import raven.struct.dataframe.stringcolumn as stringcolumn
-import raven.struct.dataframe._dataframeutils as dataframeutils
 
 # pylint: disable=C0103, R0911, R0912, R0914, R0915, R1705
 
+# The numpy dtypes of all numeric Columns by type name
+_NUMERIC_DTYPES = {
+    "byte": np.int8,
+    "short": np.int16,
+    "int": np.int32,
+    "long": np.int64,
+    "float": np.float32,
+    "double": np.float64
+}
+
 def read(filepath, separator=",", header=True, encoding="utf-8", types=None):
     """Reads the CSV-file denoted by the specified file path and returns a DataFrame
     representing its content.
@@ -164,8 +175,6 @@ def _to_csv_format(df, separator, header, encoding):
     buffer = bytearray()
     separator_enc = separator.encode(encoding)
     nl = "\n".encode(encoding)
-    nullvalue = "null".encode(encoding)
-    cols = df.columns() #cache
 
     # add header if available and requested
     if df.has_column_names() and header:
@@ -177,22 +186,40 @@ def _to_csv_format(df, separator, header, encoding):
 
         buffer.extend(nl)
 
-    # add rows
-    for i in range(df.rows()):
-        row = df.get_row(i)
-        for j, elem in enumerate(row):
-            if elem is not None:
-                buffer.extend(_escape(str(elem), separator).encode(encoding))
-            else:
-                buffer.extend(nullvalue)
+    # add rows, whose fields are formatted column by column
+    rows = df.rows()
+    if rows > 0:
+        fields = [_format_column(df.get_column(j), rows, separator)
+                  for j in range(df.columns())]
 
-            if j < cols-1:
-                buffer.extend(separator_enc)
-
-        buffer.extend(nl)
+        lines = [separator.join(row) for row in zip(*fields)]
+        lines.append("")
+        buffer.extend("\n".join(lines).encode(encoding))
 
     return buffer
 
+def _format_column(col, rows, separator):
+    """Formats the values of the specified Column as CSV fields."""
+    values = col.as_array()[:rows]
+    if values.dtype == object: # values of nullable, string and binary Columns
+        items = values.tolist()
+        if col.type_name() == "char":
+            items = [None if val is None else chr(val) for val in items]
+
+        return ["null" if val is None else _escape(str(val), separator)
+                for val in items]
+
+    if col.type_name() == "char":
+        fields = [chr(val) for val in values.tolist()]
+    else:
+        # numpy formats all values in the same way as str()
+        fields = values.astype(str).tolist()
+
+    if separator in "".join(fields):
+        fields = [_escape(field, separator) for field in fields]
+
+    return fields
+
 def _df_from_csv_format(buffer, separator, header, types):
     """Internal function for deserializing the content of
     the specified string buffer to a DataFrame."""
@@ -207,41 +234,67 @@ def _df_from_csv_format(buffer, separator, header, types):
             if isinstance(types, tuple):
                 types = list(types)
 
+            kinds = [None] * len(types)
             for i, t in enumerate(types):
                 types[i] = t.lower()
-                df.add_column(_column_from_type(types[i]))
+                kinds[i] = _kind_from_type(types[i])
 
+            names = None
             if header:
                 h = pattern.split(buffer[line_index], 0)
                 for i, elem in enumerate(h):
                     h[i] = _normalize(elem)
 
-                df.set_column_names(h)
+                names = h
                 line_index += 1
 
+            # collect the fields of each column first so
+            # that they can be converted in bulk afterwards
+            fields = [[] for _ in kinds]
+            line_numbers = []
             for _ in range(line_index, len(buffer), 1):
                 if not buffer[line_index]: # skip empty lines
                     line_index += 1
                     continue
 
-                blocks = pattern.split(_process(buffer[line_index], separator), 0)
-                converted = [None] * len(blocks)
-                for i, block in enumerate(blocks):
-                    try:
-                        converted[i] = _convert_type(types[i], _normalize(block))
-                    except (ValueError, TypeError) as ex:
+                line = buffer[line_index]
+                if "\"" in line:
+                    blocks = [_normalize(block) for block
+                              in pattern.split(_process(line, separator), 0)]
+                    blocks = [None if block == "null" else block for block in blocks]
+                else: # no quoted fields, so empty fields are null
+                    blocks = [None if block in ("", "null") else block
+                              for block in line.split(separator)]
+
+                if len(blocks) != len(kinds):
+                    # an invalid field in any preceding row
+                    # or within this row is reported first
+                    _columns_from_fields(kinds, fields, line_numbers)
+                    _parse_fields(kinds, blocks, line_index + 1)
+                    if len(blocks) > len(kinds):
                         raise IOError(
                             ("Improperly formatted CSV "
-                             "file at line: {}").format(line_index + 1)) from ex
+                             "file at line: {}").format(line_index + 1))
 
-                try:
-                    df.add_row(converted)
-                except dataframe.DataFrameException: # null value in row
-                    df = dataframe.DataFrame.convert_to(df, "NullableDataFrame")
-                    df.add_row(converted)
+                    raise dataframe.DataFrameException(
+                        ("Row length does not match number of columns: {} (the DataFrame "
+                         "has {} columns)").format(len(blocks), len(kinds)))
 
+                for i, block in enumerate(blocks):
+                    fields[i].append(block)
+
+                line_numbers.append(line_index + 1)
                 line_index += 1
 
+            columns, nullable = _columns_from_fields(kinds, fields, line_numbers)
+            if nullable:
+                df = dataframe.NullableDataFrame(*columns)
+            else:
+                df = dataframe.DefaultDataFrame(*columns)
+
+            if names is not None:
+                df.set_column_names(names)
+
         else:
             if header:
                 h = pattern.split(buffer[line_index], 0)
@@ -286,39 +339,132 @@ def _df_from_csv_format(buffer, separator, header, types):
 
     return df
 
-def _convert_type(typename, obj):
-    """Converts the specified object to the corresponding type
-    denoted by the specified type name."""
-    if obj == "null":
-        return None
-
-    if typename == "byte":
-        return int(obj)
-    elif typename == "short":
-        return int(obj)
-    elif typename in ("int", "integer"):
-        return int(obj)
-    elif typename == "long":
-        return int(obj)
-    elif typename in ("string", "str"):
-        return obj
-    elif typename == "float":
-        return float(obj)
-    elif typename == "double":
-        return float(obj)
-    elif typename in ("char", "character"):
-        s = str(obj)
-        if len(s) > 1:
-            raise ValueError("Invalid char value: '{}'".format(s))
-
-        return s
-    elif typename in ("boolean", "bool"):
-        return obj.lower() in ("true", "t", "yes", "y", "1")
-    else:
-        return obj
-
-def _column_from_type(typename):
-    """Returns the corresponding Column from the specified type name argument."""
+def _columns_from_fields(kinds, fields, line_numbers):
+    """Constructs the Columns of the specified kinds from the specified lists
+    of field strings of each Column. Returns the list of Columns and a bool
+    indicating whether they are nullable, which is the case if any field
+    is null."""
+    nullable = any(None in values for values in fields)
+    columns = [None] * len(kinds)
+    first_error = None
+    for i, kind in enumerate(kinds):
+        columns[i], error = _column_from_fields(kind, nullable, fields[i], line_numbers)
+        # errors are reported in the order in which the rows are read, where all
+        # fields of a row are parsed before the parsed values are checked
+        if error is not None and (first_error is None or error[:2] < first_error[:2]):
+            first_error = error
+
+    if first_error is not None:
+        raise first_error[2]
+
+    return columns, nullable
+
+def _parse_fields(kinds, fields, line_number):
+    """Parses the specified field strings of a single row with the parsers
+    of the Columns of the specified kinds. Fields exceeding the number of
+    Columns are ignored. Raises an IOError for the first invalid field."""
+    for kind, field in zip(kinds, fields):
+        # pylint: disable=protected-access
+        typename = dataframe._make_column(kind, False).type_name()
+        if field is not None and typename != "string":
+            try:
+                _PARSERS[typename](field)
+            except (ValueError, TypeError) as ex:
+                raise IOError(
+                    ("Improperly formatted CSV "
+                     "file at line: {}").format(line_number)) from ex
+
+def _column_from_fields(kind, nullable, fields, line_numbers):
+    """Constructs a Column of the specified kind from the specified list of
+    field strings. Null fields must be represented by None. Returns the Column
+    and None, or None and a tuple holding the row and phase of the first
+    invalid field and the exception to raise for it."""
+    # pylint: disable=protected-access
+    col = dataframe._make_column(kind, nullable)
+    typename = col.type_name()
+    dtype = _NUMERIC_DTYPES.get(typename)
+    if dtype is not None:
+        present = [f for f in fields if f is not None] if nullable else fields
+        parse = _PARSERS[typename]
+        values = None
+        try:
+            if parse is float:
+                values = np.fromiter(map(parse, present), dtype=np.float64,
+                                     count=len(present))
+            else:
+                values = np.fromiter(map(parse, present), dtype=np.int64,
+                                     count=len(present))
+                info = np.iinfo(dtype)
+                if values.size and (values.min() < info.min or values.max() > info.max):
+                    values = None # let the Column report the invalid value
+
+        except (ValueError, TypeError, OverflowError):
+            values = None # let the conversion below report the invalid field
+
+        if values is not None:
+            if not nullable:
+                return dataframe._make_column(kind, False, None,
+                                              values.astype(dtype, copy=False)), None
+
+            values = iter(values.tolist())
+            return dataframe._make_column(
+                kind, True, None, [None if f is None else next(values) for f in fields]), None
+
+    if typename == "string":
+        # fields are used as is, which keeps any empty strings
+        values = np.empty(len(fields), dtype=object)
+        values[:] = fields
+        col._values = values
+        return col, None
+
+    parse = _PARSERS[typename]
+    values = [None] * len(fields)
+    for i, field in enumerate(fields):
+        if field is not None:
+            try:
+                values[i] = parse(field)
+            except (ValueError, TypeError) as ex:
+                error = IOError(
+                    ("Improperly formatted CSV "
+                     "file at line: {}").format(line_numbers[i]))
+
+                error.__cause__ = ex
+                return None, (i, 0, error)
+
+            try:
+                col._check_type(values[i])
+            except dataframe.DataFrameException as ex:
+                return None, (i, 1, ex)
+
+    return dataframe._make_column(kind, nullable, None, values), None
+
+def _parse_char(field):
+    """Parses the specified field string as a char value."""
+    if len(field) > 1:
+        raise ValueError("Invalid char value: '{}'".format(field))
+
+    return field
+
+def _parse_boolean(field):
+    """Parses the specified field string as a boolean value."""
+    return field.lower() in ("true", "t", "yes", "y", "1")
+
+# The function parsing a non-null field string by Column type name,
+# which is looked up once per Column instead of once per field
+_PARSERS = {
+    "byte": int,
+    "short": int,
+    "int": int,
+    "long": int,
+    "string": str,
+    "float": float,
+    "double": float,
+    "char": _parse_char,
+    "boolean": _parse_boolean
+}
+
+def _kind_from_type(typename):
+    """Returns the corresponding Column kind from the specified type name argument."""
     if not isinstance(typename, str):
         raise ValueError(
             ("Invalid type name argument. "
@@ -329,11 +475,11 @@ def _column_from_type(typename):
             ("Invalid type name argument. "
              "Binary columns are not supported in CSV files"))
 
-    col = dataframeutils.column_from_typename(typename)
-    if col is None:
+    kind = dataframe._KINDS.get(typename) # pylint: disable=protected-access
+    if kind is None:
         raise ValueError("Invalid column type: '{}'".format(typename))
 
-    return col
+    return kind
 
 def _escape(s, separator):
     """Escapes the specified string if it contains
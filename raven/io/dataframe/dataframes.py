@@ -17,14 +17,27 @@ Provides serialization and I/O support for DataFrames.
 """
 
 import os
+import mmap
 import zlib
-import base64
+import concurrent.futures
 
 from struct import pack
 from struct import unpack
 
 import numpy as np
 
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+# Compressed data is always produced by zlib so that serialized
+# DataFrames stay byte-identical. Decompression uses ISA-L if available
+try:
+    from isal.isal_zlib import decompressobj as _zlib_decompressobj
+except ImportError:
+    from zlib import decompressobj as _zlib_decompressobj
+
 import raven.struct.dataframe.core as dataframe
 import raven.struct.dataframe.bytecolumn as bytecolumn
 import raven.struct.dataframe.shortcolumn as shortcolumn
@@ -39,6 +52,18 @@ import raven.struct.dataframe.binarycolumn as binarycolumn
 
 # pylint: disable=C0103, R1702, R0912, R0914, R0915
 
+# The big-endian dtypes of the values of all default Columns
+# whose elements are serialized with a fixed size
+_PAYLOAD_DTYPES = {
+    bytecolumn.ByteColumn.TYPE_CODE: ">i1",
+    shortcolumn.ShortColumn.TYPE_CODE: ">i2",
+    intcolumn.IntColumn.TYPE_CODE: ">i4",
+    longcolumn.LongColumn.TYPE_CODE: ">i8",
+    floatcolumn.FloatColumn.TYPE_CODE: ">f4",
+    doublecolumn.DoubleColumn.TYPE_CODE: ">f8",
+    charcolumn.CharColumn.TYPE_CODE: "u1"
+}
+
 def serialize(df, compress=False):
     """Serializes the given DataFrame to a bytearray.
 
@@ -135,8 +160,20 @@ def write_file(filepath, df):
                     ("Invalid value type. Expected "
                      "DataFrame but found {}").format(type(v)))
 
-            name = k if k.endswith(".df") else k + ".df"
-            _write_file0(os.path.join(filepath, name), v)
+        # DataFrames are serialized in this thread as the same instance
+        # may be mapped more than once, but compression and file output
+        # of all serialized DataFrames run concurrently
+        workers = min(len(df), os.cpu_count() or 1)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+            futures = []
+            for k, v in df.items():
+                name = k if k.endswith(".df") else k + ".df"
+                futures.append(pool.submit(_write_serialized,
+                                           os.path.join(filepath, name),
+                                           serialize(v)))
+
+            for future in futures:
+                future.result()
 
     else:
         if not isinstance(df, dataframe.DataFrame):
@@ -248,10 +285,15 @@ def _read_file0(filepath):
             or the file format is invalid
     """
     with open(filepath, mode="rb") as f:
-        data = f.read()
-        data = bytearray(data)
+        if os.fstat(f.fileno()).st_size == 0:
+            raise dataframe.DataFrameException("Invalid data format")
 
-    return deserialize(_decompress(data))
+        # decompress directly from the mapped file pages
+        # instead of reading the file into memory first
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            data = _decompress(data)
+
+    return deserialize(data)
 
 def _write_file0(filepath, df):
     """Persists the given DataFrame to the specified file.
@@ -267,7 +309,22 @@ def _write_file0(filepath, df):
         DataFrameException: If any errors occur during file persistence
             or if any errors occur during serialization
     """
-    data = _compress(serialize(df))
+    _write_serialized(filepath, serialize(df))
+
+def _write_serialized(filepath, data):
+    """Compresses the given serialized DataFrame and writes it
+    to the specified file.
+
+    Args:
+        filepath: The file to write the DataFrame to. Must be a str representing
+            the path to the file to write
+        data: The serialized DataFrame to persist, as a bytearray
+
+    Raises:
+        PermissionError: If the permission for writing the
+            specified file was denied
+    """
+    data = _compress(data)
     with open(filepath, "wb") as f:
         f.write(data)
 
@@ -287,10 +344,11 @@ def _compress(data):
     return data
 
 def _decompress(data):
-    """Decompresses the given bytearray.
+    """Decompresses the given bytes. The argument is not modified.
 
     Args:
-        data: The bytearray to decompress
+        data: The bytes to decompress, as a bytearray or
+            any other object supporting the buffer protocol
 
     Returns:
         The decompressed bytearray
@@ -305,10 +363,18 @@ def _decompress(data):
                  bytearray(data[0].to_bytes(1, byteorder="big", signed=True)).hex(),
                  bytearray(data[1].to_bytes(1, byteorder="big", signed=True)).hex()))
 
-    data[0] = 0x78
-    data[1] = 0x9c
-    data = zlib.decompress(data)
-    return bytearray(data)
+    # the first two bytes hold the file signature in place of the
+    # zlib header, so the header is fed to the decompressor separately
+    decompressor = _zlib_decompressobj()
+    decompressor.decompress(b"\x78\x9c")
+    with memoryview(data) as view, view[2:] as payload:
+        decompressed = decompressor.decompress(payload)
+
+    if not decompressor.eof:
+        raise dataframe.DataFrameException(
+            "Invalid data format. Compressed data is incomplete")
+
+    return bytearray(decompressed)
 
 def _check_header(data):
     """Validates the first few header bytes of a serialized DataFrame.
@@ -554,21 +620,11 @@ def _serialize_v2(df):
         for col in df:
             type_code = col.type_code()
             val = col.as_array()
-            if type_code == bytecolumn.ByteColumn.TYPE_CODE:
-                for i in range(rows):
-                    buffer.extend(int(val[i]).to_bytes(1, byteorder="big", signed=True))
-
-            elif type_code == shortcolumn.ShortColumn.TYPE_CODE:
-                for i in range(rows):
-                    buffer.extend(int(val[i]).to_bytes(2, byteorder="big", signed=True))
-
-            elif type_code == intcolumn.IntColumn.TYPE_CODE:
-                for i in range(rows):
-                    buffer.extend(int(val[i]).to_bytes(4, byteorder="big", signed=True))
-
-            elif type_code == longcolumn.LongColumn.TYPE_CODE:
-                for i in range(rows):
-                    buffer.extend(int(val[i]).to_bytes(8, byteorder="big", signed=True))
+            dtype = _PAYLOAD_DTYPES.get(type_code)
+            if dtype is not None:
+                # fixed-size values are converted to their
+                # big-endian bytes and written in one block
+                buffer.extend(val[:rows].astype(dtype, copy=False).tobytes())
 
             elif type_code == stringcolumn.StringColumn.TYPE_CODE:
                 for i in range(rows):
@@ -576,26 +632,9 @@ def _serialize_v2(df):
                     # add null character as string delimeter
                     buffer.append(0x00)
 
-            elif type_code == floatcolumn.FloatColumn.TYPE_CODE:
-                for i in range(rows):
-                    buffer.extend(pack(">f", val[i]))
-
-            elif type_code == doublecolumn.DoubleColumn.TYPE_CODE:
-                for i in range(rows):
-                    buffer.extend(pack(">d", val[i]))
-
-            elif type_code == charcolumn.CharColumn.TYPE_CODE:
-                for i in range(rows):
-                    buffer.extend(int(val[i]).to_bytes(1, byteorder="big", signed=True))
-
             elif type_code == booleancolumn.BooleanColumn.TYPE_CODE:
-                bits = BitVector()
-                for i in range(rows):
-                    if val[i]:
-                        bits.add1()
-                    else:
-                        bits.add0()
-                buffer.extend(bits.tobytearray())
+                # same bit order as a BitVector
+                buffer.extend(np.packbits(val[:rows]).tobytes())
 
             elif type_code == binarycolumn.BinaryColumn.TYPE_CODE:
                 for i in range(rows):
@@ -832,34 +871,26 @@ def _deserialize_v2(buffer):
         #PAYLOAD
         for i in range(cols):
             if types[i] == bytecolumn.ByteColumn.TYPE_CODE:
-                val = np.empty(rows, dtype=np.int8)
-                for j in range(rows):
-                    ptr += 1
-                    val[j] = int.from_bytes(buffer[ptr:ptr+1], byteorder="big", signed=True)
+                val = _read_values(buffer, ptr, rows, ">i1")
+                ptr += rows
 
                 columns.append(bytecolumn.ByteColumn(names[i], val))
 
             elif types[i] == shortcolumn.ShortColumn.TYPE_CODE:
-                val = np.empty(rows, dtype=np.int16)
-                for j in range(rows):
-                    ptr += 2
-                    val[j] = int.from_bytes(buffer[ptr-1:ptr+1], byteorder="big", signed=True)
+                val = _read_values(buffer, ptr, rows, ">i2")
+                ptr += rows * 2
 
                 columns.append(shortcolumn.ShortColumn(names[i], val))
 
             elif types[i] == intcolumn.IntColumn.TYPE_CODE:
-                val = np.empty(rows, dtype=np.int32)
-                for j in range(rows):
-                    ptr += 4
-                    val[j] = int.from_bytes(buffer[ptr-3:ptr+1], byteorder="big", signed=True)
+                val = _read_values(buffer, ptr, rows, ">i4")
+                ptr += rows * 4
 
                 columns.append(intcolumn.IntColumn(names[i], val))
 
             elif types[i] == longcolumn.LongColumn.TYPE_CODE:
-                val = np.empty(rows, dtype=np.int64)
-                for j in range(rows):
-                    ptr += 8
-                    val[j] = int.from_bytes(buffer[ptr-7:ptr+1], byteorder="big", signed=True)
+                val = _read_values(buffer, ptr, rows, ">i8")
+                ptr += rows * 8
 
                 columns.append(longcolumn.LongColumn(names[i], val))
 
@@ -879,41 +910,30 @@ def _deserialize_v2(buffer):
                 columns.append(stringcolumn.StringColumn(names[i], val))
 
             elif types[i] == floatcolumn.FloatColumn.TYPE_CODE:
-                val = np.empty(rows, dtype=np.float32)
-                for j in range(rows):
-                    ptr += 4
-                    # since Python does not have float32, we need to do a conversion
-                    # over numpy and str to get the same precision as the original value
-                    val[j] = float(str(np.float32(unpack(">f", buffer[ptr-3:ptr+1])[0])))
+                val = _read_values(buffer, ptr, rows, ">f4")
+                ptr += rows * 4
 
                 columns.append(floatcolumn.FloatColumn(names[i], val))
 
             elif types[i] == doublecolumn.DoubleColumn.TYPE_CODE:
-                val = np.empty(rows, dtype=np.float64)
-                for j in range(rows):
-                    ptr += 8
-                    val[j] = unpack(">d", buffer[ptr-7:ptr+1])[0]
+                val = _read_values(buffer, ptr, rows, ">f8")
+                ptr += rows * 8
 
                 columns.append(doublecolumn.DoubleColumn(names[i], val))
 
             elif types[i] == charcolumn.CharColumn.TYPE_CODE:
-                val = np.empty(rows, dtype=np.uint8)
-                for j in range(rows):
-                    ptr += 1
-                    c = int.from_bytes(buffer[ptr:ptr+1], byteorder="big", signed=False)
-                    val[j] = c
+                val = _read_values(buffer, ptr, rows, "u1")
+                ptr += rows
 
                 columns.append(charcolumn.CharColumn(names[i], val))
 
             elif types[i] == booleancolumn.BooleanColumn.TYPE_CODE:
-                val = np.empty(rows, dtype=bool)
                 length = int(rows/8 if (rows%8 == 0) else ((rows/8) + 1))
-                ptr += 1 # focus on next readable position
-                bits = BitVector(buffer[ptr:ptr+length])
-                for j in range(rows):
-                    val[j] = bits.get(j)
+                # same bit order as a BitVector
+                val = np.unpackbits(
+                    _read_values(buffer, ptr, length, "u1"), count=rows).astype(bool)
 
-                ptr += (length-1)
+                ptr += length
                 columns.append(booleancolumn.BooleanColumn(names[i], val))
 
             elif types[i] == binarycolumn.BinaryColumn.TYPE_CODE:
@@ -943,6 +963,29 @@ def _deserialize_v2(buffer):
 
     return df
 
+def _read_values(buffer, ptr, count, dtype):
+    """Reads the specified number of fixed-size values from the given buffer.
+
+    Args:
+        buffer: The bytearray to read from
+        ptr: The index of the last read byte. Values are
+            read starting at the next byte
+        count: The number of values to read
+        dtype: The big-endian dtype of the values to read
+
+    Returns:
+        A writable numpy array holding the read values in native byte order
+
+    Raises:
+        DataFrameException: If the buffer does not hold enough bytes
+    """
+    dtype = np.dtype(dtype)
+    if ptr + count * dtype.itemsize >= len(buffer):
+        raise dataframe.DataFrameException("Invalid format")
+
+    values = np.frombuffer(buffer, dtype=dtype, count=count, offset=ptr+1)
+    return values.astype(dtype.newbyteorder("="))
+
 class BitVector:
     """Simple bit vector implementation used in serialization routines."""
 
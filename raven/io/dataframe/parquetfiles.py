@@ -0,0 +1,132 @@
+# Copyright (C) 2023 Raven Computing
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Provides support for reading Parquet files.
+
+This module uses DataFrame objects to represent Parquet files in memory.
+A Parquet file can be read into a DataFrame by calling the read() function.
+
+For example:
+
+  >>>> import raven.io.dataframe.parquetfiles as parquet
+  >>>> df = parquet.read("myfile.parquet")
+
+Reading Parquet files requires the optional 'pyarrow' package.
+"""
+
+import raven.struct.dataframe.core as dataframe
+
+# pylint: disable=C0103, R1705
+
+# The Column type names of all supported Arrow types,
+# given by the name of the corresponding pyarrow.types predicate
+_TYPES = (
+    ("is_int8", "byte"),
+    ("is_int16", "short"),
+    ("is_int32", "int"),
+    ("is_int64", "long"),
+    ("is_float32", "float"),
+    ("is_float64", "double"),
+    ("is_string", "string"),
+    ("is_large_string", "string"),
+    ("is_boolean", "boolean"),
+    ("is_binary", "binary"),
+    ("is_large_binary", "binary")
+)
+
+def read(filepath, columns=None):
+    """Reads the Parquet file denoted by the specified file path and returns
+    a DataFrame representing its content.
+
+    Each Column of the returned DataFrame has the name of the corresponding
+    Parquet column. The element type of each Column is derived from the type of
+    the corresponding Parquet column. Supported types are signed integers,
+    floating point numbers, strings, booleans and binary data. If any column
+    in the specified file contains null values, then the returned DataFrame
+    is a NullableDataFrame. Otherwise it is a DefaultDataFrame.
+
+    Args:
+        filepath: The Parquet file to read. Must be a str representing
+            the path to the file to read
+        columns: The names of the columns to read, as a list of str.
+            May be None to read all columns
+
+    Returns:
+        A DataFrame representing the content of the specified Parquet file
+
+    Raises:
+        ImportError: If the 'pyarrow' package is not installed
+        ValueError: If an argument is invalid
+        PermissionError: If the permission for reading the specified
+            file was denied
+        IOError: If any errors occur during reading or if the file
+            contains a column of an unsupported type
+    """
+    if filepath is None:
+        raise ValueError("File argument must not be None")
+
+    try:
+        # pylint: disable=import-outside-toplevel
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as ex:
+        raise ImportError(
+            "Reading Parquet files requires the 'pyarrow' package") from ex
+
+    try:
+        table = pyarrow.parquet.read_table(filepath, columns=columns)
+    except pyarrow.ArrowException as ex:
+        raise IOError("Unable to read Parquet file: {}".format(ex)) from ex
+
+    nullable = any(col.null_count > 0 for col in table.columns)
+    cols = [None] * table.num_columns
+    for i, field in enumerate(table.schema):
+        typename = _typename_of(pyarrow.types, field)
+        values = _values_of(table.column(i), typename, nullable)
+        # pylint: disable=protected-access
+        cols[i] = dataframe._make_column(
+            dataframe._KINDS[typename], nullable, field.name, values)
+
+    if nullable:
+        return dataframe.NullableDataFrame(*cols)
+    else:
+        return dataframe.DefaultDataFrame(*cols)
+
+def _typename_of(types, field):
+    """Returns the Column type name of the specified Arrow field."""
+    for predicate, typename in _TYPES:
+        if getattr(types, predicate)(field.type):
+            return typename
+
+    raise IOError(
+        ("Unsupported type of Parquet column '{}': {}")
+        .format(field.name, field.type))
+
+def _values_of(chunked, typename, nullable):
+    """Returns the values of the specified Arrow column in the
+    representation expected by the Column with the specified type name."""
+    if nullable or typename in ("string", "binary"):
+        values = chunked.to_pylist()
+        if typename == "binary":
+            values = [None if v is None else bytearray(v) for v in values]
+
+        return values
+
+    values = chunked.to_numpy()
+    # arrays backed directly by Arrow memory are read-only
+    # but the values of a Column must remain modifiable
+    if not values.flags.writeable:
+        values = values.copy()
+
+    return values
@@ -16,6 +16,8 @@
 Provides internal utility functions for Column operations.
 """
 
+import numpy as np
+
 import raven.struct.dataframe.bytecolumn as bytecolumn
 import raven.struct.dataframe.shortcolumn as shortcolumn
 import raven.struct.dataframe.intcolumn as intcolumn
@@ -29,6 +31,9 @@ import raven.struct.dataframe.binarycolumn as binarycolumn
 
 # pylint: disable=R0911, R0912
 
+# The conversion tables of all Column classes by class
+_CONVERTERS = {}
+
 def is_numeric_fp(col):
     """Indicates whether the specified Column has a type name
     of float or double.
@@ -318,3 +323,196 @@ def default_value_char_column():
         The default value used by all non-nullable CharColumns
     """
     return charcolumn.CharColumn.DEFAULT_VALUE
+
+def densify(values, dtype):
+    """Splits the specified values of a nullable Column into a null mask
+    and an array in which all null values are replaced by zero.
+
+    Args:
+        values: The values of the nullable Column, as a numpy array
+            with dtype object
+        dtype: The dtype of the returned array of values
+
+    Returns:
+        A tuple holding the boolean mask which is True at all indices
+        of null values, and the array of the values with the specified dtype
+    """
+    mask = np.equal(values, None)
+    if not mask.any():
+        return mask, values.astype(dtype)
+
+    data = values.copy()
+    data[mask] = 0
+    return mask, data.astype(dtype)
+
+def cast_integers(values, data, dtype):
+    """Casts the specified integer or floating point array to the
+    specified integer dtype.
+
+    Floating point values are truncated towards zero. All elements which
+    are out of range of the specified dtype, infinite or NaN are
+    converted individually from the corresponding original value, so that
+    they raise an error or wrap around exactly like a scalar conversion.
+
+    Args:
+        values: The original values of the nullable Column, as a numpy array
+            with dtype object
+        data: The values as returned by densify(), as an integer or
+            floating point numpy array
+        dtype: The integer dtype to cast the values to
+
+    Returns:
+        A numpy array with the specified dtype
+    """
+    info = np.iinfo(dtype)
+    if data.dtype.kind == "f":
+        truncated = np.trunc(data)
+        invalid = ~((truncated >= info.min) & (truncated < float(info.max) + 1))
+        with np.errstate(invalid="ignore"):
+            vals = data.astype(dtype)
+    else:
+        invalid = (data < info.min) | (data > info.max)
+        vals = data.astype(dtype)
+
+    for i in np.flatnonzero(invalid):
+        vals[i] = int(dtype(values[i]))
+
+    return vals
+
+def to_bytearrays(values, dtype):
+    """Converts the specified array to an object array holding the bytes
+    of each value as a bytearray.
+
+    All values are encoded in bulk by casting them to the specified dtype.
+
+    Args:
+        values: The values to convert, as a numpy array
+        dtype: The dtype defining the binary encoding of each value,
+            e.g. '>i4' for big-endian int32 values
+
+    Returns:
+        A numpy array with dtype object holding one bytearray for each value
+    """
+    size = np.dtype(dtype).itemsize
+    data = values.astype(dtype, copy=False).tobytes()
+    vals = np.empty(values.shape[0], dtype=object)
+    for i in range(values.shape[0]):
+        vals[i] = bytearray(data[i*size:(i+1)*size])
+
+    return vals
+
+def is_valid_integers(values, types, dtype):
+    """Indicates whether the specified values can be used by an integer
+    Column without checking each value individually.
+
+    This is the case if the type of each value is one of the specified types
+    and all values other than None are within the range of the specified
+    integer dtype.
+
+    Args:
+        values: The values to check, as a list or numpy array
+        types: The set of valid value types. Includes the type
+            of None if null values are permitted
+        dtype: The integer dtype of the Column
+
+    Returns:
+        True if all values are valid, False if the values
+        have to be checked individually
+    """
+    if not set(map(type, values)) <= types:
+        return False
+
+    if type(None) in types:
+        values = [value for value in values if value is not None]
+
+    if len(values) == 0:
+        return True
+
+    info = np.iinfo(dtype)
+    return min(values) >= info.min and max(values) <= info.max
+
+def converters(cls):
+    """Returns the conversion table of the specified Column class.
+
+    The table maps each type code to the method of the specified class
+    which converts a Column to the Column type with that type code.
+    It is built on first use, as the type codes cannot be resolved
+    while the Column modules are being imported.
+
+    Args:
+        cls: The Column class to get the conversion table for. Must
+            implement a _to_<type>() method for each Column type
+
+    Returns:
+        A dict mapping type codes to conversion methods
+    """
+    table = _CONVERTERS.get(cls)
+    if table is None:
+        # pylint: disable=protected-access
+        table = {
+            type_code_byte_column(): cls._to_byte,
+            type_code_short_column(): cls._to_short,
+            type_code_int_column(): cls._to_int,
+            type_code_long_column(): cls._to_long,
+            type_code_string_column(): cls._to_string,
+            type_code_float_column(): cls._to_float,
+            type_code_double_column(): cls._to_double,
+            type_code_char_column(): cls._to_char,
+            type_code_boolean_column(): cls._to_boolean,
+            type_code_binary_column(): cls._to_binary,
+            type_code_nullable_byte_column(): cls._to_nullable_byte,
+            type_code_nullable_short_column(): cls._to_nullable_short,
+            type_code_nullable_int_column(): cls._to_nullable_int,
+            type_code_nullable_long_column(): cls._to_nullable_long,
+            type_code_nullable_string_column(): cls._to_nullable_string,
+            type_code_nullable_float_column(): cls._to_nullable_float,
+            type_code_nullable_double_column(): cls._to_nullable_double,
+            type_code_nullable_char_column(): cls._to_nullable_char,
+            type_code_nullable_boolean_column(): cls._to_nullable_boolean,
+            type_code_nullable_binary_column(): cls._to_nullable_binary}
+
+        _CONVERTERS[cls] = table
+
+    return table
+
+def to_objects(values):
+    """Copies the specified array into a newly allocated object array,
+    boxing each value as the corresponding Python object.
+
+    Args:
+        values: The values to copy, as a numpy array
+
+    Returns:
+        A numpy array with dtype object holding the specified values
+    """
+    vals = np.empty(values.shape[0], dtype=object)
+    np.copyto(vals, values)
+    return vals
+
+def leading_chars(values):
+    """Computes the first character of the decimal string representation
+    of each of the specified integers.
+
+    The leading digits are computed arithmetically, which is considerably
+    faster than formatting all values as strings.
+
+    Args:
+        values: The integer values, as a numpy array
+
+    Returns:
+        A numpy array with dtype uint8 holding the ASCII code of the
+        first character of the string representation of each value
+    """
+    values = values.astype(np.int64, copy=False)
+    negative = values < 0
+    # the absolute values, computed without overflowing the minimum int64
+    digits = np.where(negative, -(values + 1), values).astype(np.uint64)
+    digits += negative
+    # divide by decreasing powers of ten until only the leading digit is left
+    for exp in (16, 8, 4, 2, 1):
+        divisor = np.uint64(10 ** exp)
+        digits = np.where(digits >= divisor, digits // divisor, digits)
+
+    chars = digits.astype(np.uint8) + ord("0")
+    chars[negative] = ord("-")
+    return chars
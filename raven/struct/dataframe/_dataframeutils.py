@@ -16,8 +16,18 @@
 Provides internal utility functions for DataFrame operations.
 """
 
+import os
+import re
+import threading
+import concurrent.futures
+
 import numpy as np
 
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 import raven.struct.dataframe.core as dataframe
 import raven.struct.dataframe.column as column
 import raven.struct.dataframe.bytecolumn as bytecolumn
@@ -34,6 +44,50 @@ import raven.struct.dataframe._columnutils as columnutils
 
 # pylint: disable=C0103, R1702, R1705, R0911, R0912, R0914, R0915, W0212
 
+# The number of values summed per block in blocked_sum()
+_SUM_BLOCK_SIZE = 8192
+
+# The minimum array length for which blocked_sum() uses blocks
+_SUM_BLOCK_THRESHOLD = 1 << 16
+
+# The minimum number of columns for which work is run in the column pool
+_POOL_MIN_COLUMNS = 4
+
+# The minimum number of rows for which work is run in the column pool
+_POOL_MIN_ROWS = 10000
+
+# The lazily created thread pool for per-column work
+_column_pool = None
+_column_pool_lock = threading.Lock()
+
+# The nullable Column type for each default Column type code
+_NULLABLE_TYPES = {
+    bytecolumn.ByteColumn.TYPE_CODE: bytecolumn.NullableByteColumn,
+    shortcolumn.ShortColumn.TYPE_CODE: shortcolumn.NullableShortColumn,
+    intcolumn.IntColumn.TYPE_CODE: intcolumn.NullableIntColumn,
+    longcolumn.LongColumn.TYPE_CODE: longcolumn.NullableLongColumn,
+    stringcolumn.StringColumn.TYPE_CODE: stringcolumn.NullableStringColumn,
+    floatcolumn.FloatColumn.TYPE_CODE: floatcolumn.NullableFloatColumn,
+    doublecolumn.DoubleColumn.TYPE_CODE: doublecolumn.NullableDoubleColumn,
+    charcolumn.CharColumn.TYPE_CODE: charcolumn.NullableCharColumn,
+    booleancolumn.BooleanColumn.TYPE_CODE: booleancolumn.NullableBooleanColumn,
+    binarycolumn.BinaryColumn.TYPE_CODE: binarycolumn.NullableBinaryColumn
+}
+
+# The default Column type, its dtype and the value replacing null values
+# for each nullable Column type code whose values have a fixed size
+_DEFAULT_TYPES = {
+    bytecolumn.NullableByteColumn.TYPE_CODE: (bytecolumn.ByteColumn, np.int8, 0),
+    shortcolumn.NullableShortColumn.TYPE_CODE: (shortcolumn.ShortColumn, np.int16, 0),
+    intcolumn.NullableIntColumn.TYPE_CODE: (intcolumn.IntColumn, np.int32, 0),
+    longcolumn.NullableLongColumn.TYPE_CODE: (longcolumn.LongColumn, np.int64, 0),
+    floatcolumn.NullableFloatColumn.TYPE_CODE: (floatcolumn.FloatColumn, np.float32, 0.0),
+    doublecolumn.NullableDoubleColumn.TYPE_CODE: (doublecolumn.DoubleColumn, np.float64, 0.0),
+    charcolumn.NullableCharColumn.TYPE_CODE: (charcolumn.CharColumn, np.uint8,
+                                              ord(charcolumn.CharColumn.DEFAULT_VALUE)),
+    booleancolumn.NullableBooleanColumn.TYPE_CODE: (booleancolumn.BooleanColumn, bool, False)
+}
+
 def copy_of(df):
     """Creates and returns a copy of the given DataFrame
 
@@ -76,18 +130,13 @@ def like(df):
                 if df.is_nullable()
                 else dataframe.DefaultDataFrame())
 
-    cols = [None] * col
-    for i in range(col):
-        cols[i] = column.Column.of_type(df.get_column(i).type_code())
-
-    result = (dataframe.NullableDataFrame(cols)
-              if df.is_nullable()
-              else dataframe.DefaultDataFrame(cols))
-
-    if df.has_column_names():
-        result.set_column_names(df.get_column_names())
-
-    return result
+    # the empty Columns are labeled when they are constructed so that
+    # the names are registered directly by the DataFrame constructor
+    names = df.get_column_names() or [None] * col
+    cols = [type(c)(name) for c, name in zip(df._internal_columns(), names)]
+    return (dataframe.NullableDataFrame(cols)
+            if df.is_nullable()
+            else dataframe.DefaultDataFrame(cols))
 
 def is_numeric_fp(col):
     """Indicates whether the specified Column has a type name
@@ -103,6 +152,137 @@ def is_numeric_fp(col):
     """
     return columnutils.is_numeric_fp(col)
 
+def blocked_sum(values):
+    """Computes the sum of all values in the specified numpy array.
+
+    Large arrays are summed in fixed-size blocks. Each block is small
+    enough to stay in cache while it is reduced and the per-block partial
+    sums are then added up in a second pass. The per-block accumulation
+    keeps the accuracy of numpy's pairwise summation. Small arrays and
+    arrays of dtype object are summed directly.
+
+    Args:
+        values: The numpy array to sum up. Must be one-dimensional
+
+    Returns:
+        The sum of all values in the specified array
+    """
+    n = values.shape[0]
+    if n <= _SUM_BLOCK_THRESHOLD or values.dtype == object:
+        return np.sum(values)
+
+    blocks = n // _SUM_BLOCK_SIZE
+    end = blocks * _SUM_BLOCK_SIZE
+    parts = np.sum(values[:end].reshape(blocks, _SUM_BLOCK_SIZE), axis=1)
+    return np.sum(parts) + np.sum(values[end:])
+
+def compile_pattern(regex):
+    """Compiles the specified regular expression for matching Column values.
+
+    If the optional 're2' module is installed, then the pattern is
+    compiled with the RE2 engine, which matches in linear time. Patterns
+    which are not supported by RE2, for example patterns with
+    backreferences, are compiled with the standard 're' module.
+
+    Args:
+        regex: The regular expression to compile, as a str
+
+    Returns:
+        The compiled pattern object providing a fullmatch() method
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(regex)
+        except re2.error:
+            pass
+
+    return re.compile(regex)
+
+def _sort_keys_lengths(values):
+    """Sort keys of binary data, i.e. the length of each bytearray."""
+    return np.fromiter((len(value) for value in values),
+                       dtype=np.int64, count=values.shape[0])
+
+def _sort_keys_int(values):
+    """Sort keys of boxed integer values."""
+    return values.astype(np.int64)
+
+def _sort_keys_float(values):
+    """Sort keys of boxed floating point values."""
+    return values.astype(np.float64)
+
+def _sort_keys_bool(values):
+    """Sort keys of boxed boolean values."""
+    return values.astype(np.bool_)
+
+# Maps Column type codes to the function computing the sort keys
+# for the values of that Column. All other Columns are sorted by value
+_SORT_KEYS = {
+    binarycolumn.BinaryColumn.TYPE_CODE: _sort_keys_lengths,
+    binarycolumn.NullableBinaryColumn.TYPE_CODE: _sort_keys_lengths,
+    bytecolumn.NullableByteColumn.TYPE_CODE: _sort_keys_int,
+    shortcolumn.NullableShortColumn.TYPE_CODE: _sort_keys_int,
+    intcolumn.NullableIntColumn.TYPE_CODE: _sort_keys_int,
+    longcolumn.NullableLongColumn.TYPE_CODE: _sort_keys_int,
+    floatcolumn.NullableFloatColumn.TYPE_CODE: _sort_keys_float,
+    doublecolumn.NullableDoubleColumn.TYPE_CODE: _sort_keys_float,
+    booleancolumn.NullableBooleanColumn.TYPE_CODE: _sort_keys_bool
+}
+
+def sort_keys(col, values):
+    """Computes the keys by which the specified values of
+    the specified Column are sorted.
+
+    Boxed values of nullable numeric and boolean Columns are unboxed
+    into typed arrays. Binary data is sorted by length. The specified
+    values must not contain None values.
+
+    Args:
+        col: The Column the specified values belong to
+        values: The values to compute the sort keys for, as a numpy array
+
+    Returns:
+        The sort keys, as a numpy array of the same length as the values
+    """
+    fn = _SORT_KEYS.get(col.type_code())
+    return fn(values) if fn is not None else values
+
+def column_pool():
+    """Gets the thread pool used to process DataFrame Columns concurrently.
+
+    The thread pool is created on first use and shared by all DataFrames.
+    Numpy releases the GIL in most array operations, so work on
+    independent Columns can overlap.
+
+    Returns:
+        The shared ThreadPoolExecutor
+    """
+    global _column_pool # pylint: disable=W0603
+    if _column_pool is None:
+        with _column_pool_lock:
+            if _column_pool is None:
+                _column_pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=min(8, os.cpu_count() or 1))
+
+    return _column_pool
+
+def use_column_pool(columns, rows):
+    """Indicates whether per-column work should be run in the column pool.
+
+    Small DataFrames are processed sequentially as the overhead of
+    dispatching to the thread pool would outweigh any gain.
+
+    Args:
+        columns: The list of Columns to process
+        rows: The number of rows in each Column
+
+    Returns:
+        True if the work should be run in the column pool, False otherwise
+    """
+    return (columns is not None
+            and len(columns) >= _POOL_MIN_COLUMNS
+            and rows >= _POOL_MIN_ROWS)
+
 def merge(*dataframes):
     """Merges all given DataFrame instances into one DataFrame.
 
@@ -122,11 +302,8 @@ def merge(*dataframes):
     DataFrame arguments are converted to their corresponding
     nullable equivalent.
 
-    If columns should be independent from their origin, then simply pass
-    a clone (copy) of each DataFrame argument to this method.
-
-    Example:
-        merged = DataFrame.merge(DataFrame.copy(df1), DataFrame.copy(df2))
+    If columns should be independent from their origin, then use
+    the merge_copy() function instead.
 
     Args:
         dataframes: The DataFrames to be merged
@@ -134,11 +311,32 @@ def merge(*dataframes):
     Returns:
         A DataFrame composed of all columns of the given DataFrames
     """
+    return _merge(dataframes, False)
+
+def merge_copy(*dataframes):
+    """Merges copies of all given DataFrame instances into one DataFrame.
+
+    This function behaves like merge() except that all columns of the
+    returned DataFrame are independent from their origin. Each column is
+    copied exactly once, directly into the merged DataFrame. Only passing
+    one DataFrame to this function will return a copy of that instance.
+
+    Args:
+        dataframes: The DataFrames to be merged
+
+    Returns:
+        A DataFrame composed of copies of all columns of the given DataFrames
+    """
+    return _merge(dataframes, True)
+
+def _merge(dataframes, copy):
+    """Merges the specified DataFrames, either by referencing
+    or by copying their columns."""
     if dataframes is None or len(dataframes) == 0:
         raise dataframe.DataFrameException("Arg must not be None or empty")
 
     if len(dataframes) == 1:
-        return dataframes[0]
+        return copy_of(dataframes[0]) if copy else dataframes[0]
 
     rows = dataframes[0].rows()
     cols = 0
@@ -198,12 +396,19 @@ def merge(*dataframes):
     k = 0
     for i, df in enumerate(dataframes):
         for j in range(df.columns()):
-            if has_nullable:
-                columns[k] = df.get_column(j).as_nullable()
-                k += 1
+            col = df.get_column(j)
+            if has_nullable and not col.is_nullable():
+                if copy and col.type_code() == binarycolumn.BinaryColumn.TYPE_CODE:
+                    # the converted column would share all bytearrays
+                    col = col.clone()
+
+                columns[k] = _to_nullable_column(col, rows)
+            elif copy:
+                columns[k] = col.clone()
             else:
-                columns[k] = df.get_column(j)
-                k += 1
+                columns[k] = col
+
+            k += 1
 
     merged = None
     if has_nullable:
@@ -256,122 +461,87 @@ def convert(df, target_type):
 
     rows = df.rows()
     converted = None
+    convert_column = None
     # convert from Nullable to Default
     if target_type == "default":
         converted = dataframe.DefaultDataFrame()
-        for col in df:
-            tc = col.type_code()
-            if tc == bytecolumn.NullableByteColumn.TYPE_CODE:
-                vals = np.array([0] * rows, dtype=np.int8)
-                for i in range(rows):
-                    val = col.get_value(i)
-                    vals[i] = 0 if val is None else val
-
-                converted.add_column(bytecolumn.ByteColumn(col.get_name(), vals))
-            elif tc == shortcolumn.NullableShortColumn.TYPE_CODE:
-                vals = np.array([0] * rows, dtype=np.int16)
-                for i in range(rows):
-                    val = col.get_value(i)
-                    vals[i] = 0 if val is None else val
-
-                converted.add_column(shortcolumn.ShortColumn(col.get_name(), vals))
-            elif tc == intcolumn.NullableIntColumn.TYPE_CODE:
-                vals = np.array([0] * rows, dtype=np.int32)
-                for i in range(rows):
-                    val = col.get_value(i)
-                    vals[i] = 0 if val is None else val
-
-                converted.add_column(intcolumn.IntColumn(col.get_name(), vals))
-            elif tc == longcolumn.NullableLongColumn.TYPE_CODE:
-                vals = np.array([0] * rows, dtype=np.int64)
-                for i in range(rows):
-                    val = col.get_value(i)
-                    vals[i] = 0 if val is None else val
-
-                converted.add_column(longcolumn.LongColumn(col.get_name(), vals))
-            elif tc == stringcolumn.NullableStringColumn.TYPE_CODE:
-                vals = np.array([None] * rows, dtype=object)
-                for i in range(rows):
-                    val = col.get_value(i)
-                    vals[i] = (stringcolumn.StringColumn.DEFAULT_VALUE
-                               if val is None or val == ""
-                               else val)
-
-                converted.add_column(stringcolumn.StringColumn(col.get_name(), vals))
-            elif tc == floatcolumn.NullableFloatColumn.TYPE_CODE:
-                vals = np.array([0.0] * rows, dtype=np.float32)
-                for i in range(rows):
-                    val = col.get_value(i)
-                    vals[i] = 0.0 if val is None else val
-
-                converted.add_column(floatcolumn.FloatColumn(col.get_name(), vals))
-            elif tc == doublecolumn.NullableDoubleColumn.TYPE_CODE:
-                vals = np.array([0.0] * rows, dtype=np.float64)
-                for i in range(rows):
-                    val = col.get_value(i)
-                    vals[i] = 0 if val is None else val
-
-                converted.add_column(doublecolumn.DoubleColumn(col.get_name(), vals))
-            elif tc == charcolumn.NullableCharColumn.TYPE_CODE:
-                vals = np.array([0] * rows, dtype=np.uint8)
-                default_val = ord(charcolumn.CharColumn.DEFAULT_VALUE)
-                for i in range(rows):
-                    val = col._values[i]
-                    vals[i] = default_val if val is None else val
-
-                converted.add_column(charcolumn.CharColumn(col.get_name(), vals))
-            elif tc == booleancolumn.NullableBooleanColumn.TYPE_CODE:
-                vals = np.array([False] * rows, dtype=bool)
-                for i in range(rows):
-                    val = col.get_value(i)
-                    vals[i] = False if val is None else val
-
-                converted.add_column(booleancolumn.BooleanColumn(col.get_name(), vals))
-            elif tc == binarycolumn.NullableBinaryColumn.TYPE_CODE:
-                vals = np.array([None] * rows, dtype=object)
-                for i in range(rows):
-                    val = col.get_value(i)
-                    vals[i] = bytearray.fromhex("00") if val is None else val
-
-                converted.add_column(binarycolumn.BinaryColumn(col.get_name(), vals))
-            else: # undefined type
-                raise dataframe.DataFrameException(
-                    ("Unable to convert dataframe. Unrecognized "
-                     "column type {}".format(type(col))))
-
+        convert_column = _to_default_column
     else: # convert from Default to Nullable
         converted = dataframe.NullableDataFrame()
-        for col in df:
-            tc = col.type_code()
-            vals = np.array([None] * rows, dtype=object)
-            for i in range(rows):
-                vals[i] = col.get_value(i)
-
-            if tc == bytecolumn.ByteColumn.TYPE_CODE:
-                converted.add_column(bytecolumn.NullableByteColumn(col.get_name(), vals))
-            elif tc == shortcolumn.ShortColumn.TYPE_CODE:
-                converted.add_column(shortcolumn.NullableShortColumn(col.get_name(), vals))
-            elif tc == intcolumn.IntColumn.TYPE_CODE:
-                converted.add_column(intcolumn.NullableIntColumn(col.get_name(), vals))
-            elif tc == longcolumn.LongColumn.TYPE_CODE:
-                converted.add_column(longcolumn.NullableLongColumn(col.get_name(), vals))
-            elif tc == stringcolumn.StringColumn.TYPE_CODE:
-                converted.add_column(stringcolumn.NullableStringColumn(col.get_name(), vals))
-            elif tc == floatcolumn.FloatColumn.TYPE_CODE:
-                converted.add_column(floatcolumn.NullableFloatColumn(col.get_name(), vals))
-            elif tc == doublecolumn.DoubleColumn.TYPE_CODE:
-                converted.add_column(doublecolumn.NullableDoubleColumn(col.get_name(), vals))
-            elif tc == charcolumn.CharColumn.TYPE_CODE:
-                converted.add_column(charcolumn.NullableCharColumn(col.get_name(), vals))
-            elif tc == booleancolumn.BooleanColumn.TYPE_CODE:
-                converted.add_column(booleancolumn.NullableBooleanColumn(col.get_name(), vals))
-            elif tc == binarycolumn.BinaryColumn.TYPE_CODE:
-                converted.add_column(binarycolumn.NullableBinaryColumn(col.get_name(), vals))
-            else: # undefined type
-                raise dataframe.DataFrameException(
-                    ("Unable to convert dataframe. Unrecognized "
-                     "column type {}".format(type(col))))
+        convert_column = _to_nullable_column
+
+    columns = list(df)
+    if use_column_pool(columns, rows):
+        # Columns are converted independently of each other and
+        # numpy releases the GIL for the bulk casts
+        columns = column_pool().map(convert_column, columns, [rows] * len(columns))
+    else:
+        columns = [convert_column(col, rows) for col in columns]
+
+    for col in columns:
+        converted.add_column(col)
+
+    return converted
+
+def _to_default_column(col, rows):
+    """Converts the specified nullable Column to its default counterpart.
+
+    All null values are replaced by the default value of the Column type.
+    The values of Columns holding fixed-size elements are replaced
+    and cast in bulk.
+    """
+    values = col._values[:rows]
+    tc = col.type_code()
+    if tc in _DEFAULT_TYPES:
+        default_type, dtype, default_val = _DEFAULT_TYPES[tc]
+        vals = values.copy()
+        vals[np.equal(vals, None)] = default_val
+        return default_type(col.get_name(), vals.astype(dtype))
+
+    elif tc == stringcolumn.NullableStringColumn.TYPE_CODE:
+        default_val = stringcolumn.StringColumn.DEFAULT_VALUE
+        vals = np.empty(rows, dtype=object)
+        vals[:] = [default_val if val is None or val == "" else val
+                   for val in values.tolist()]
+
+        return stringcolumn.StringColumn(col.get_name(), vals)
+
+    elif tc == binarycolumn.NullableBinaryColumn.TYPE_CODE:
+        vals = np.empty(rows, dtype=object)
+        for i, val in enumerate(values.tolist()):
+            vals[i] = bytearray.fromhex("00") if val is None else val
+
+        return binarycolumn.BinaryColumn(col.get_name(), vals)
+
+    else: # undefined type
+        raise dataframe.DataFrameException(
+            ("Unable to convert dataframe. Unrecognized "
+             "column type {}".format(type(col))))
+
+def _to_nullable_column(col, rows):
+    """Converts the specified default Column to its nullable counterpart.
+
+    The values of the Column are converted in bulk. Since they already
+    satisfy the type constraints of the Column, they are not checked again
+    by the constructor of the nullable Column.
+    """
+    nullable_type = _NULLABLE_TYPES.get(col.type_code())
+    if nullable_type is None: # undefined type
+        raise dataframe.DataFrameException(
+            ("Unable to convert dataframe. Unrecognized "
+             "column type {}".format(type(col))))
+
+    values = col._values[:rows]
+    if values.dtype == object:
+        vals = values.copy()
+    else:
+        # tolist() yields the same Python objects as get_value()
+        # except for chars, which are kept as their ordinals
+        vals = np.empty(rows, dtype=object)
+        vals[:] = values.tolist()
 
+    converted = nullable_type(col.get_name())
+    converted._values = vals
     return converted
 
 def column_from_typename(typename):
@@ -16,7 +16,7 @@
 Provides an implementation for BinaryColumn and NullableBinaryColumn
 """
 
-from struct import unpack
+from struct import Struct
 
 import numpy as np
 
@@ -24,6 +24,10 @@ import raven.struct.dataframe.core as dataframe
 import raven.struct.dataframe.column as column
 import raven.struct.dataframe._columnutils as utils
 
+# The precompiled big-endian formats of float and double values
+_FLOAT = Struct(">f")
+_DOUBLE = Struct(">d")
+
 class BinaryColumn(column.Column):
     """A Column holding binary values (bytearray).
     This implementation DOES NOT support null values.
@@ -31,6 +35,8 @@ class BinaryColumn(column.Column):
 
     TYPE_CODE = 19
 
+    __slots__ = ()
+
     def __init__(self, name=None, values=None):
         """Constructs a new BinaryColumn.
 
@@ -131,205 +137,212 @@ class BinaryColumn(column.Column):
              (x.hex() if x is not None else None for x in self._values.tolist())
             ))
 
-    # pylint: disable=too-many-branches
-    # pylint: disable=too-many-statements
-    # pylint: disable=invalid-name
-    def convert_to(self, typecode):
-        converted = None
-        if typecode == utils.type_code_byte_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int8)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) > 0:
-                    vals[i] = x[0]
-                else:
-                    vals[i] = 0
-
-            converted = dataframe.DataFrame.ByteColumn(values=vals)
-        elif typecode == utils.type_code_short_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int16)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) >= 2:
-                    vals[i] = int.from_bytes(x[0:2], byteorder="big", signed=True)
-                else:
-                    vals[i] = 0
-
-            converted = dataframe.DataFrame.ShortColumn(values=vals)
-        elif typecode == utils.type_code_int_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int32)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) >= 4:
-                    vals[i] = int.from_bytes(x[0:4], byteorder="big", signed=True)
-                else:
-                    vals[i] = 0
-
-            converted = dataframe.DataFrame.IntColumn(values=vals)
-        elif typecode == utils.type_code_long_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int64)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) >= 8:
-                    vals[i] = int.from_bytes(x[0:8], byteorder="big", signed=True)
-                else:
-                    vals[i] = 0
-
-            converted = dataframe.DataFrame.LongColumn(values=vals)
-        elif typecode == utils.type_code_string_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = x.hex()
-                else:
-                    vals[i] = utils.default_value_string_column()
-
-            converted = dataframe.DataFrame.StringColumn(values=vals)
-        elif typecode == utils.type_code_float_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.float32)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) >= 4:
-                    vals[i] = unpack(">f", x[0:4])[0]
-                else:
-                    vals[i] = 0.0
-
-            converted = dataframe.DataFrame.FloatColumn(values=vals)
-        elif typecode == utils.type_code_double_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.float64)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) >= 8:
-                    vals[i] = unpack(">d", x[0:8])[0]
-                else:
-                    vals[i] = 0.0
-
-            converted = dataframe.DataFrame.DoubleColumn(values=vals)
-        elif typecode == utils.type_code_char_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.uint8)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) > 0:
-                    vals[i] = int(x[0])
-                else:
-                    vals[i] = 0
-
-            converted = dataframe.DataFrame.CharColumn(values=vals)
-        elif typecode == utils.type_code_boolean_column():
-            vals = np.empty([self._values.shape[0]], dtype=bool)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    is_zero = True
-                    for y in x:
-                        if y != 0:
-                            is_zero = False
-                            break
-
-                    vals[i] = not is_zero
-                else:
-                    vals[i] = False
-
-            converted = dataframe.DataFrame.BooleanColumn(values=vals)
-        elif typecode == BinaryColumn.TYPE_CODE:
-            converted = self.clone()
-        elif typecode == utils.type_code_nullable_byte_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) > 0:
-                    vals[i] = x[0]
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableByteColumn(values=vals)
-        elif typecode == utils.type_code_nullable_short_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) >= 2:
-                    vals[i] = int.from_bytes(x[0:2], byteorder="big", signed=True)
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableShortColumn(values=vals)
-        elif typecode == utils.type_code_nullable_int_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) >= 4:
-                    vals[i] = int.from_bytes(x[0:4], byteorder="big", signed=True)
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableIntColumn(values=vals)
-        elif typecode == utils.type_code_nullable_long_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) >= 8:
-                    vals[i] = int.from_bytes(x[0:8], byteorder="big", signed=True)
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableLongColumn(values=vals)
-        elif typecode == utils.type_code_nullable_string_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = x.hex()
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableStringColumn(values=vals)
-        elif typecode == utils.type_code_nullable_float_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) >= 4:
-                    vals[i] = unpack(">f", x[0:4])[0]
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableFloatColumn(values=vals)
-        elif typecode == utils.type_code_nullable_double_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) >= 8:
-                    vals[i] = unpack(">d", x[0:8])[0]
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableDoubleColumn(values=vals)
-        elif typecode == utils.type_code_nullable_char_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) > 0:
-                    vals[i] = int(x[0])
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableCharColumn(values=vals)
-        elif typecode == utils.type_code_nullable_boolean_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    is_zero = True
-                    for y in x:
-                        if y != 0:
-                            is_zero = False
-                            break
-
-                    vals[i] = not is_zero
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableBooleanColumn(values=vals)
-        elif typecode == NullableBinaryColumn.TYPE_CODE:
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) > 0:
-                    b = bytearray(len(x))
-                    b[:] = x
-                    vals[i] = b
-                else:
-                    vals[i] = None
-
-            converted = NullableBinaryColumn(values=vals)
-        else:
-            raise dataframe.DataFrameException(
-                "Unknown column type code: {}".format(typecode))
-
-        # pylint: disable=protected-access
-        converted._name = self._name
-        return converted
+    def _to_byte(self):
+        vals = np.empty(self._values.shape[0], dtype=np.int8)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) > 0:
+                vals[i] = x[0]
+            else:
+                vals[i] = 0
+
+        return dataframe.DataFrame.ByteColumn(values=vals)
+
+    def _to_short(self):
+        vals = np.empty(self._values.shape[0], dtype=np.int16)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) >= 2:
+                vals[i] = int.from_bytes(x[0:2], byteorder="big", signed=True)
+            else:
+                vals[i] = 0
+
+        return dataframe.DataFrame.ShortColumn(values=vals)
+
+    def _to_int(self):
+        vals = np.empty(self._values.shape[0], dtype=np.int32)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) >= 4:
+                vals[i] = int.from_bytes(x[0:4], byteorder="big", signed=True)
+            else:
+                vals[i] = 0
+
+        return dataframe.DataFrame.IntColumn(values=vals)
+
+    def _to_long(self):
+        vals = np.empty(self._values.shape[0], dtype=np.int64)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) >= 8:
+                vals[i] = int.from_bytes(x[0:8], byteorder="big", signed=True)
+            else:
+                vals[i] = 0
+
+        return dataframe.DataFrame.LongColumn(values=vals)
+
+    def _to_string(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None:
+                vals[i] = x.hex()
+            else:
+                vals[i] = utils.default_value_string_column()
+
+        return dataframe.DataFrame.StringColumn(values=vals)
+
+    def _to_float(self):
+        vals = np.empty(self._values.shape[0], dtype=np.float32)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) >= 4:
+                vals[i] = _FLOAT.unpack_from(x)[0]
+            else:
+                vals[i] = 0.0
+
+        return dataframe.DataFrame.FloatColumn(values=vals)
+
+    def _to_double(self):
+        vals = np.empty(self._values.shape[0], dtype=np.float64)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) >= 8:
+                vals[i] = _DOUBLE.unpack_from(x)[0]
+            else:
+                vals[i] = 0.0
+
+        return dataframe.DataFrame.DoubleColumn(values=vals)
+
+    def _to_char(self):
+        vals = np.empty(self._values.shape[0], dtype=np.uint8)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) > 0:
+                vals[i] = int(x[0])
+            else:
+                vals[i] = 0
+
+        return dataframe.DataFrame.CharColumn(values=vals)
+
+    def _to_boolean(self):
+        vals = np.empty(self._values.shape[0], dtype=bool)
+        for i, x in enumerate(self._values):
+            if x is not None:
+                is_zero = True
+                for y in x:
+                    if y != 0:
+                        is_zero = False
+                        break
+
+                vals[i] = not is_zero
+            else:
+                vals[i] = False
+
+        return dataframe.DataFrame.BooleanColumn(values=vals)
+
+    def _to_binary(self):
+        return self.clone()
+
+    def _to_nullable_byte(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) > 0:
+                vals[i] = x[0]
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableByteColumn(values=vals)
+
+    def _to_nullable_short(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) >= 2:
+                vals[i] = int.from_bytes(x[0:2], byteorder="big", signed=True)
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableShortColumn(values=vals)
+
+    def _to_nullable_int(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) >= 4:
+                vals[i] = int.from_bytes(x[0:4], byteorder="big", signed=True)
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableIntColumn(values=vals)
+
+    def _to_nullable_long(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) >= 8:
+                vals[i] = int.from_bytes(x[0:8], byteorder="big", signed=True)
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableLongColumn(values=vals)
+
+    def _to_nullable_string(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None:
+                vals[i] = x.hex()
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableStringColumn(values=vals)
+
+    def _to_nullable_float(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) >= 4:
+                vals[i] = _FLOAT.unpack_from(x)[0]
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableFloatColumn(values=vals)
+
+    def _to_nullable_double(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) >= 8:
+                vals[i] = _DOUBLE.unpack_from(x)[0]
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableDoubleColumn(values=vals)
+
+    def _to_nullable_char(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) > 0:
+                vals[i] = int(x[0])
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableCharColumn(values=vals)
+
+    def _to_nullable_boolean(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None:
+                is_zero = True
+                for y in x:
+                    if y != 0:
+                        is_zero = False
+                        break
+
+                vals[i] = not is_zero
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableBooleanColumn(values=vals)
+
+    def _to_nullable_binary(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) > 0:
+                b = bytearray(len(x))
+                b[:] = x
+                vals[i] = b
+            else:
+                vals[i] = None
+
+        return NullableBinaryColumn(values=vals)
 
     def _create_array(self, size=0):
         array = np.empty(size, dtype=object)
@@ -345,6 +358,8 @@ class NullableBinaryColumn(column.Column):
 
     TYPE_CODE = 20
 
+    __slots__ = ()
+
     def __init__(self, name=None, values=None):
         """Constructs a new NullableBinaryColumn.
 
@@ -438,206 +453,213 @@ class NullableBinaryColumn(column.Column):
              (x.hex() if x is not None else None for x in self._values.tolist())
             ))
 
-    # pylint: disable=too-many-branches
-    # pylint: disable=too-many-statements
-    # pylint: disable=invalid-name
-    def convert_to(self, typecode):
-        converted = None
-        if typecode == utils.type_code_byte_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int8)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) > 0:
-                    vals[i] = x[0]
-                else:
-                    vals[i] = 0
-
-            converted = dataframe.DataFrame.ByteColumn(values=vals)
-        elif typecode == utils.type_code_short_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int16)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) >= 2:
-                    vals[i] = int.from_bytes(x[0:2], byteorder="big", signed=True)
-                else:
-                    vals[i] = 0
-
-            converted = dataframe.DataFrame.ShortColumn(values=vals)
-        elif typecode == utils.type_code_int_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int32)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) >= 4:
-                    vals[i] = int.from_bytes(x[0:4], byteorder="big", signed=True)
-                else:
-                    vals[i] = 0
-
-            converted = dataframe.DataFrame.IntColumn(values=vals)
-        elif typecode == utils.type_code_long_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int64)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) >= 8:
-                    vals[i] = int.from_bytes(x[0:8], byteorder="big", signed=True)
-                else:
-                    vals[i] = 0
-
-            converted = dataframe.DataFrame.LongColumn(values=vals)
-        elif typecode == utils.type_code_string_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = x.hex()
-                else:
-                    vals[i] = utils.default_value_string_column()
-
-            converted = dataframe.DataFrame.StringColumn(values=vals)
-        elif typecode == utils.type_code_float_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.float32)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) >= 4:
-                    vals[i] = unpack(">f", x[0:4])[0]
-                else:
-                    vals[i] = 0.0
-
-            converted = dataframe.DataFrame.FloatColumn(values=vals)
-        elif typecode == utils.type_code_double_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.float64)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) >= 8:
-                    vals[i] = unpack(">d", x[0:8])[0]
-                else:
-                    vals[i] = 0.0
-
-            converted = dataframe.DataFrame.DoubleColumn(values=vals)
-        elif typecode == utils.type_code_char_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.uint8)
-            ord_default = ord(utils.default_value_char_column())
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) > 0:
-                    vals[i] = int(x[0])
-                else:
-                    vals[i] = ord_default
-
-            converted = dataframe.DataFrame.CharColumn(values=vals)
-        elif typecode == utils.type_code_boolean_column():
-            vals = np.empty([self._values.shape[0]], dtype=bool)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    is_zero = True
-                    for y in x:
-                        if y != 0:
-                            is_zero = False
-                            break
-
-                    vals[i] = not is_zero
-                else:
-                    vals[i] = False
-
-            converted = dataframe.DataFrame.BooleanColumn(values=vals)
-        elif typecode == BinaryColumn.TYPE_CODE:
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) > 0:
-                    b = bytearray(len(x))
-                    b[:] = x
-                    vals[i] = b
-                else:
-                    vals[i] = bytearray(b"\x00")
-
-            converted = BinaryColumn(values=vals)
-        elif typecode == utils.type_code_nullable_byte_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) > 0:
-                    vals[i] = x[0]
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableByteColumn(values=vals)
-        elif typecode == utils.type_code_nullable_short_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) >= 2:
-                    vals[i] = int.from_bytes(x[0:2], byteorder="big", signed=True)
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableShortColumn(values=vals)
-        elif typecode == utils.type_code_nullable_int_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) >= 4:
-                    vals[i] = int.from_bytes(x[0:4], byteorder="big", signed=True)
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableIntColumn(values=vals)
-        elif typecode == utils.type_code_nullable_long_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) >= 8:
-                    vals[i] = int.from_bytes(x[0:8], byteorder="big", signed=True)
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableLongColumn(values=vals)
-        elif typecode == utils.type_code_nullable_string_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = x.hex()
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableStringColumn(values=vals)
-        elif typecode == utils.type_code_nullable_float_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) >= 4:
-                    vals[i] = unpack(">f", x[0:4])[0]
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableFloatColumn(values=vals)
-        elif typecode == utils.type_code_nullable_double_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) >= 8:
-                    vals[i] = unpack(">d", x[0:8])[0]
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableDoubleColumn(values=vals)
-        elif typecode == utils.type_code_nullable_char_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and len(x) > 0:
-                    vals[i] = int(x[0])
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableCharColumn(values=vals)
-        elif typecode == utils.type_code_nullable_boolean_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    is_zero = True
-                    for y in x:
-                        if y != 0:
-                            is_zero = False
-                            break
-
-                    vals[i] = not is_zero
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableBooleanColumn(values=vals)
-        elif typecode == NullableBinaryColumn.TYPE_CODE:
-            converted = self.clone()
-        else:
-            raise dataframe.DataFrameException(
-                "Unknown column type code: {}".format(typecode))
-
-        # pylint: disable=protected-access
-        converted._name = self._name
-        return converted
+    def _to_byte(self):
+        vals = np.empty(self._values.shape[0], dtype=np.int8)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) > 0:
+                vals[i] = x[0]
+            else:
+                vals[i] = 0
+
+        return dataframe.DataFrame.ByteColumn(values=vals)
+
+    def _to_short(self):
+        vals = np.empty(self._values.shape[0], dtype=np.int16)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) >= 2:
+                vals[i] = int.from_bytes(x[0:2], byteorder="big", signed=True)
+            else:
+                vals[i] = 0
+
+        return dataframe.DataFrame.ShortColumn(values=vals)
+
+    def _to_int(self):
+        vals = np.empty(self._values.shape[0], dtype=np.int32)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) >= 4:
+                vals[i] = int.from_bytes(x[0:4], byteorder="big", signed=True)
+            else:
+                vals[i] = 0
+
+        return dataframe.DataFrame.IntColumn(values=vals)
+
+    def _to_long(self):
+        vals = np.empty(self._values.shape[0], dtype=np.int64)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) >= 8:
+                vals[i] = int.from_bytes(x[0:8], byteorder="big", signed=True)
+            else:
+                vals[i] = 0
+
+        return dataframe.DataFrame.LongColumn(values=vals)
+
+    def _to_string(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None:
+                vals[i] = x.hex()
+            else:
+                vals[i] = utils.default_value_string_column()
+
+        return dataframe.DataFrame.StringColumn(values=vals)
+
+    def _to_float(self):
+        vals = np.empty(self._values.shape[0], dtype=np.float32)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) >= 4:
+                vals[i] = _FLOAT.unpack_from(x)[0]
+            else:
+                vals[i] = 0.0
+
+        return dataframe.DataFrame.FloatColumn(values=vals)
+
+    def _to_double(self):
+        vals = np.empty(self._values.shape[0], dtype=np.float64)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) >= 8:
+                vals[i] = _DOUBLE.unpack_from(x)[0]
+            else:
+                vals[i] = 0.0
+
+        return dataframe.DataFrame.DoubleColumn(values=vals)
+
+    def _to_char(self):
+        vals = np.empty(self._values.shape[0], dtype=np.uint8)
+        ord_default = ord(utils.default_value_char_column())
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) > 0:
+                vals[i] = int(x[0])
+            else:
+                vals[i] = ord_default
+
+        return dataframe.DataFrame.CharColumn(values=vals)
+
+    def _to_boolean(self):
+        vals = np.empty(self._values.shape[0], dtype=bool)
+        for i, x in enumerate(self._values):
+            if x is not None:
+                is_zero = True
+                for y in x:
+                    if y != 0:
+                        is_zero = False
+                        break
+
+                vals[i] = not is_zero
+            else:
+                vals[i] = False
+
+        return dataframe.DataFrame.BooleanColumn(values=vals)
+
+    def _to_binary(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) > 0:
+                b = bytearray(len(x))
+                b[:] = x
+                vals[i] = b
+            else:
+                vals[i] = bytearray(b"\x00")
+
+        return BinaryColumn(values=vals)
+
+    def _to_nullable_byte(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) > 0:
+                vals[i] = x[0]
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableByteColumn(values=vals)
+
+    def _to_nullable_short(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) >= 2:
+                vals[i] = int.from_bytes(x[0:2], byteorder="big", signed=True)
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableShortColumn(values=vals)
+
+    def _to_nullable_int(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) >= 4:
+                vals[i] = int.from_bytes(x[0:4], byteorder="big", signed=True)
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableIntColumn(values=vals)
+
+    def _to_nullable_long(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) >= 8:
+                vals[i] = int.from_bytes(x[0:8], byteorder="big", signed=True)
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableLongColumn(values=vals)
+
+    def _to_nullable_string(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None:
+                vals[i] = x.hex()
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableStringColumn(values=vals)
+
+    def _to_nullable_float(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) >= 4:
+                vals[i] = _FLOAT.unpack_from(x)[0]
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableFloatColumn(values=vals)
+
+    def _to_nullable_double(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) >= 8:
+                vals[i] = _DOUBLE.unpack_from(x)[0]
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableDoubleColumn(values=vals)
+
+    def _to_nullable_char(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None and len(x) > 0:
+                vals[i] = int(x[0])
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableCharColumn(values=vals)
+
+    def _to_nullable_boolean(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None:
+                is_zero = True
+                for y in x:
+                    if y != 0:
+                        is_zero = False
+                        break
+
+                vals[i] = not is_zero
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableBooleanColumn(values=vals)
+
+    def _to_nullable_binary(self):
+        return self.clone()
 
     def _create_array(self, size=0):
         return np.empty(size, dtype=object)
@@ -29,6 +29,8 @@ class BooleanColumn(column.Column):
 
     TYPE_CODE = 9
 
+    __slots__ = ()
+
     def __init__(self, name=None, values=None):
         """Constructs a new BooleanColumn.
 
@@ -126,99 +128,105 @@ class BooleanColumn(column.Column):
     def get_default_value(self):
         return False
 
-    # pylint: disable=too-many-branches
-    # pylint: disable=too-many-statements
-    # pylint: disable=invalid-name
-    def convert_to(self, typecode):
-        converted = None
-        if typecode == utils.type_code_byte_column():
-            converted = dataframe.DataFrame.ByteColumn(values=self._values.astype(np.int8))
-        elif typecode == utils.type_code_short_column():
-            converted = dataframe.DataFrame.ShortColumn(values=self._values.astype(np.int16))
-        elif typecode == utils.type_code_int_column():
-            converted = dataframe.DataFrame.IntColumn(values=self._values.astype(np.int32))
-        elif typecode == utils.type_code_long_column():
-            converted = dataframe.DataFrame.LongColumn(values=self._values.astype(np.int64))
-        elif typecode == utils.type_code_string_column():
-            vals = self._values.astype(object)
-            for i, x in np.ndenumerate(vals):
-                vals[i] = str(x)
+    def _to_byte(self):
+        return dataframe.DataFrame.ByteColumn(values=self._values.astype(np.int8))
 
-            converted = dataframe.DataFrame.StringColumn(values=vals)
-        elif typecode == utils.type_code_float_column():
-            converted = dataframe.DataFrame.FloatColumn(values=self._values.astype(np.float32))
-        elif typecode == utils.type_code_double_column():
-            converted = dataframe.DataFrame.DoubleColumn(values=self._values.astype(np.float64))
-        elif typecode == utils.type_code_char_column():
-            vals = self._values.astype(np.uint8)
-            for i, x in np.ndenumerate(vals):
-                if x:
-                    vals[i] = ord("1")
-                else:
-                    vals[i] = ord("0")
+    def _to_short(self):
+        return dataframe.DataFrame.ShortColumn(values=self._values.astype(np.int16))
 
-            converted = dataframe.DataFrame.CharColumn(values=vals)
-        elif typecode == BooleanColumn.TYPE_CODE:
-            converted = self.clone()
-        elif typecode == utils.type_code_binary_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = bytearray(int(x).to_bytes(1, byteorder="big", signed=True))
+    def _to_int(self):
+        return dataframe.DataFrame.IntColumn(values=self._values.astype(np.int32))
 
-            converted = dataframe.DataFrame.BinaryColumn(values=vals)
-        elif typecode == utils.type_code_nullable_byte_column():
-            vals = self._values.astype(np.int8)
-            converted = dataframe.DataFrame.NullableByteColumn(values=vals.astype(object))
-        elif typecode == utils.type_code_nullable_short_column():
-            vals = self._values.astype(np.int16)
-            converted = dataframe.DataFrame.NullableShortColumn(values=vals.astype(object))
-        elif typecode == utils.type_code_nullable_int_column():
-            vals = self._values.astype(np.int32)
-            converted = dataframe.DataFrame.NullableIntColumn(values=self._values.astype(object))
-        elif typecode == utils.type_code_nullable_long_column():
-            vals = self._values.astype(np.int64)
-            converted = dataframe.DataFrame.NullableLongColumn(
-                values=self._values.astype(object))
-
-        elif typecode == utils.type_code_nullable_string_column():
-            vals = self._values.astype(object)
-            for i, x in np.ndenumerate(vals):
-                vals[i] = str(x)
+    def _to_long(self):
+        return dataframe.DataFrame.LongColumn(values=self._values.astype(np.int64))
 
-            converted = dataframe.DataFrame.NullableStringColumn(values=vals)
-        elif typecode == utils.type_code_nullable_float_column():
-            vals = self._values.astype(np.float32)
-            vals = vals.astype(object)
-            converted = dataframe.DataFrame.NullableFloatColumn(values=vals)
-        elif typecode == utils.type_code_nullable_double_column():
-            vals = self._values.astype(np.float64)
-            vals = vals.astype(object)
-            converted = dataframe.DataFrame.NullableDoubleColumn(values=vals)
-        elif typecode == utils.type_code_nullable_char_column():
-            vals = self._values.astype(np.uint8)
-            vals = vals.astype(object)
-            for i, x in np.ndenumerate(vals):
-                if x:
-                    vals[i] = ord("1")
-                else:
-                    vals[i] = ord("0")
+    def _to_string(self):
+        vals = self._values.astype(object)
+        for i, x in enumerate(vals):
+            vals[i] = str(x)
 
-            converted = dataframe.DataFrame.NullableCharColumn(values=vals)
-        elif typecode == NullableBooleanColumn.TYPE_CODE:
-            converted = NullableBooleanColumn(values=self._values.astype(object))
-        elif typecode == utils.type_code_nullable_binary_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = bytearray(int(x).to_bytes(1, byteorder="big", signed=True))
+        return dataframe.DataFrame.StringColumn(values=vals)
 
-            converted = dataframe.DataFrame.NullableBinaryColumn(values=vals)
-        else:
-            raise dataframe.DataFrameException(
-                "Unknown column type code: {}".format(typecode))
+    def _to_float(self):
+        return dataframe.DataFrame.FloatColumn(values=self._values.astype(np.float32))
+
+    def _to_double(self):
+        return dataframe.DataFrame.DoubleColumn(values=self._values.astype(np.float64))
+
+    def _to_char(self):
+        vals = self._values.astype(np.uint8)
+        for i, x in enumerate(vals):
+            if x:
+                vals[i] = ord("1")
+            else:
+                vals[i] = ord("0")
+
+        return dataframe.DataFrame.CharColumn(values=vals)
+
+    def _to_boolean(self):
+        return self.clone()
+
+    def _to_binary(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = bytearray(int(x).to_bytes(1, byteorder="big", signed=True))
+
+        return dataframe.DataFrame.BinaryColumn(values=vals)
+
+    def _to_nullable_byte(self):
+        vals = self._values.astype(np.int8)
+        return dataframe.DataFrame.NullableByteColumn(values=vals.astype(object))
 
-        # pylint: disable=protected-access
-        converted._name = self._name
-        return converted
+    def _to_nullable_short(self):
+        vals = self._values.astype(np.int16)
+        return dataframe.DataFrame.NullableShortColumn(values=vals.astype(object))
+
+    def _to_nullable_int(self):
+        vals = self._values.astype(np.int32)
+        return dataframe.DataFrame.NullableIntColumn(values=self._values.astype(object))
+
+    def _to_nullable_long(self):
+        vals = self._values.astype(np.int64)
+        return dataframe.DataFrame.NullableLongColumn(
+            values=self._values.astype(object))
+
+    def _to_nullable_string(self):
+        vals = self._values.astype(object)
+        for i, x in enumerate(vals):
+            vals[i] = str(x)
+
+        return dataframe.DataFrame.NullableStringColumn(values=vals)
+
+    def _to_nullable_float(self):
+        vals = self._values.astype(np.float32)
+        vals = vals.astype(object)
+        return dataframe.DataFrame.NullableFloatColumn(values=vals)
+
+    def _to_nullable_double(self):
+        vals = self._values.astype(np.float64)
+        vals = vals.astype(object)
+        return dataframe.DataFrame.NullableDoubleColumn(values=vals)
+
+    def _to_nullable_char(self):
+        vals = self._values.astype(np.uint8)
+        vals = vals.astype(object)
+        for i, x in enumerate(vals):
+            if x:
+                vals[i] = ord("1")
+            else:
+                vals[i] = ord("0")
+
+        return dataframe.DataFrame.NullableCharColumn(values=vals)
+
+    def _to_nullable_boolean(self):
+        return NullableBooleanColumn(values=self._values.astype(object))
+
+    def _to_nullable_binary(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = bytearray(int(x).to_bytes(1, byteorder="big", signed=True))
+
+        return dataframe.DataFrame.NullableBinaryColumn(values=vals)
 
     def _create_array(self, size=0):
         return np.zeros(size, dtype=bool)
@@ -230,6 +238,8 @@ class NullableBooleanColumn(column.Column):
 
     TYPE_CODE = 18
 
+    __slots__ = ()
+
     def __init__(self, name=None, values=None):
         """Constructs a new NullableBooleanColumn.
 
@@ -329,156 +339,163 @@ class NullableBooleanColumn(column.Column):
     def get_default_value(self):
         return None
 
-    # pylint: disable=too-many-branches
-    # pylint: disable=too-many-statements
-    # pylint: disable=invalid-name
-    def convert_to(self, typecode):
-        converted = None
-        if typecode == utils.type_code_byte_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int8)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(x) if x is not None else 0
-
-            converted = dataframe.DataFrame.ByteColumn(values=vals)
-        elif typecode == utils.type_code_short_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int16)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(x) if x is not None else 0
-
-            converted = dataframe.DataFrame.ShortColumn(values=vals)
-        elif typecode == utils.type_code_int_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int32)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(x) if x is not None else 0
-
-            converted = dataframe.DataFrame.IntColumn(values=vals)
-        elif typecode == utils.type_code_long_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int64)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(x) if x is not None else 0
-
-            converted = dataframe.DataFrame.LongColumn(values=vals)
-        elif typecode == utils.type_code_string_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = str(x)
-                else:
-                    vals[i] = utils.default_value_string_column()
-
-            converted = dataframe.DataFrame.StringColumn(values=vals)
-        elif typecode == utils.type_code_float_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.float32)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = float(x) if x is not None else 0.0
-
-            converted = dataframe.DataFrame.FloatColumn(values=vals)
-        elif typecode == utils.type_code_double_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.float64)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = float(x) if x is not None else 0.0
-
-            converted = dataframe.DataFrame.DoubleColumn(values=vals)
-        elif typecode == utils.type_code_char_column():
-            vals = np.zeros([self._values.shape[0]], dtype=np.uint8)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None and x is True:
+    def _to_byte(self):
+        vals = np.empty(self._values.shape[0], dtype=np.int8)
+        for i, x in enumerate(self._values):
+            vals[i] = int(x) if x is not None else 0
+
+        return dataframe.DataFrame.ByteColumn(values=vals)
+
+    def _to_short(self):
+        vals = np.empty(self._values.shape[0], dtype=np.int16)
+        for i, x in enumerate(self._values):
+            vals[i] = int(x) if x is not None else 0
+
+        return dataframe.DataFrame.ShortColumn(values=vals)
+
+    def _to_int(self):
+        vals = np.empty(self._values.shape[0], dtype=np.int32)
+        for i, x in enumerate(self._values):
+            vals[i] = int(x) if x is not None else 0
+
+        return dataframe.DataFrame.IntColumn(values=vals)
+
+    def _to_long(self):
+        vals = np.empty(self._values.shape[0], dtype=np.int64)
+        for i, x in enumerate(self._values):
+            vals[i] = int(x) if x is not None else 0
+
+        return dataframe.DataFrame.LongColumn(values=vals)
+
+    def _to_string(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None:
+                vals[i] = str(x)
+            else:
+                vals[i] = utils.default_value_string_column()
+
+        return dataframe.DataFrame.StringColumn(values=vals)
+
+    def _to_float(self):
+        vals = np.empty(self._values.shape[0], dtype=np.float32)
+        for i, x in enumerate(self._values):
+            vals[i] = float(x) if x is not None else 0.0
+
+        return dataframe.DataFrame.FloatColumn(values=vals)
+
+    def _to_double(self):
+        vals = np.empty(self._values.shape[0], dtype=np.float64)
+        for i, x in enumerate(self._values):
+            vals[i] = float(x) if x is not None else 0.0
+
+        return dataframe.DataFrame.DoubleColumn(values=vals)
+
+    def _to_char(self):
+        vals = np.zeros(self._values.shape[0], dtype=np.uint8)
+        for i, x in enumerate(self._values):
+            if x is not None and x is True:
+                vals[i] = ord("1")
+            else:
+                vals[i] = ord("0")
+
+        return dataframe.DataFrame.CharColumn(values=vals)
+
+    def _to_boolean(self):
+        vals = self._values.astype(bool)
+        for i, x in enumerate(vals):
+            if x is not None and x is True:
+                vals[i] = True
+            else:
+                vals[i] = False
+
+        return BooleanColumn(values=vals)
+
+    def _to_binary(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None:
+                vals[i] = bytearray(int(x).to_bytes(1, byteorder="big", signed=True))
+            else:
+                vals[i] = bytearray(int(0).to_bytes(1, byteorder="big", signed=True))
+
+        return dataframe.DataFrame.BinaryColumn(values=vals)
+
+    def _to_nullable_byte(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = int(x) if x is not None else None
+
+        return dataframe.DataFrame.NullableByteColumn(values=vals)
+
+    def _to_nullable_short(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = int(x) if x is not None else None
+
+        return dataframe.DataFrame.NullableShortColumn(values=vals)
+
+    def _to_nullable_int(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = int(x) if x is not None else None
+
+        return dataframe.DataFrame.NullableIntColumn(values=vals)
+
+    def _to_nullable_long(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = int(x) if x is not None else None
+
+        return dataframe.DataFrame.NullableLongColumn(values=vals)
+
+    def _to_nullable_string(self):
+        vals = self._values.astype(object)
+        for i, x in enumerate(vals):
+            vals[i] = str(x) if x is not None else None
+
+        return dataframe.DataFrame.NullableStringColumn(values=vals)
+
+    def _to_nullable_float(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = float(x) if x is not None else None
+
+        return dataframe.DataFrame.NullableFloatColumn(values=vals)
+
+    def _to_nullable_double(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = float(x) if x is not None else None
+
+        return dataframe.DataFrame.NullableDoubleColumn(values=vals)
+
+    def _to_nullable_char(self):
+        vals = self._values.astype(object)
+        vals = vals.astype(object)
+        for i, x in enumerate(vals):
+            if x is not None:
+                if x is True:
                     vals[i] = ord("1")
                 else:
                     vals[i] = ord("0")
+            else:
+                vals[i] = None
 
-            converted = dataframe.DataFrame.CharColumn(values=vals)
-        elif typecode == BooleanColumn.TYPE_CODE:
-            vals = self._values.astype(bool)
-            for i, x in np.ndenumerate(vals):
-                if x is not None and x is True:
-                    vals[i] = True
-                else:
-                    vals[i] = False
-
-            converted = BooleanColumn(values=vals)
-        elif typecode == utils.type_code_binary_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = bytearray(int(x).to_bytes(1, byteorder="big", signed=True))
-                else:
-                    vals[i] = bytearray(int(0).to_bytes(1, byteorder="big", signed=True))
-
-            converted = dataframe.DataFrame.BinaryColumn(values=vals)
-        elif typecode == utils.type_code_nullable_byte_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(x) if x is not None else None
-
-            converted = dataframe.DataFrame.NullableByteColumn(values=vals)
-        elif typecode == utils.type_code_nullable_short_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(x) if x is not None else None
-
-            converted = dataframe.DataFrame.NullableShortColumn(values=vals)
-        elif typecode == utils.type_code_nullable_int_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(x) if x is not None else None
-
-            converted = dataframe.DataFrame.NullableIntColumn(values=vals)
-        elif typecode == utils.type_code_nullable_long_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(x) if x is not None else None
-
-            converted = dataframe.DataFrame.NullableLongColumn(values=vals)
-        elif typecode == utils.type_code_nullable_string_column():
-            vals = self._values.astype(object)
-            for i, x in np.ndenumerate(vals):
-                vals[i] = str(x) if x is not None else None
-
-            converted = dataframe.DataFrame.NullableStringColumn(values=vals)
-        elif typecode == utils.type_code_nullable_float_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = float(x) if x is not None else None
-
-            converted = dataframe.DataFrame.NullableFloatColumn(values=vals)
-        elif typecode == utils.type_code_nullable_double_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = float(x) if x is not None else None
-
-            converted = dataframe.DataFrame.NullableDoubleColumn(values=vals)
-        elif typecode == utils.type_code_nullable_char_column():
-            vals = self._values.astype(object)
-            vals = vals.astype(object)
-            for i, x in np.ndenumerate(vals):
-                if x is not None:
-                    if x is True:
-                        vals[i] = ord("1")
-                    else:
-                        vals[i] = ord("0")
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableCharColumn(values=vals)
-        elif typecode == NullableBooleanColumn.TYPE_CODE:
-            converted = self.clone()
-        elif typecode == utils.type_code_nullable_binary_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = bytearray(int(x).to_bytes(1, byteorder="big", signed=True))
-                else:
-                    vals[i] = None
+        return dataframe.DataFrame.NullableCharColumn(values=vals)
 
-            converted = dataframe.DataFrame.NullableBinaryColumn(values=vals)
-        else:
-            raise dataframe.DataFrameException(
-                "Unknown column type code: {}".format(typecode))
+    def _to_nullable_boolean(self):
+        return self.clone()
+
+    def _to_nullable_binary(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None:
+                vals[i] = bytearray(int(x).to_bytes(1, byteorder="big", signed=True))
+            else:
+                vals[i] = None
 
-        # pylint: disable=protected-access
-        converted._name = self._name
-        return converted
+        return dataframe.DataFrame.NullableBinaryColumn(values=vals)
 
     def _create_array(self, size=0):
         return np.empty(size, dtype=object)
@@ -22,6 +22,11 @@ import raven.struct.dataframe.core as dataframe
 import raven.struct.dataframe.column as column
 import raven.struct.dataframe._columnutils as utils
 
+# The types of values which are valid without any further checks
+# as long as they are within the range of int8 values
+_INT_TYPES = frozenset((int, np.int8))
+_NULLABLE_INT_TYPES = frozenset((int, np.int8, type(None)))
+
 class ByteColumn(column.Column):
     """A Column holding byte values (int8).
     This implementation DOES NOT support null values.
@@ -29,6 +34,8 @@ class ByteColumn(column.Column):
 
     TYPE_CODE = 1
 
+    __slots__ = ()
+
     def __init__(self, name=None, values=None):
         """Constructs a new ByteColumn.
 
@@ -48,10 +55,13 @@ class ByteColumn(column.Column):
             values = np.empty(0, dtype=np.int8)
 
         if isinstance(values, list):
-            for value in values:
-                self._check_type(value)
+            # only check each value individually if not all of
+            # them are plain integers within the valid range
+            if not utils.is_valid_integers(values, _INT_TYPES, np.int8):
+                for value in values:
+                    self._check_type(value)
 
-            values = np.array(values, dtype=np.int8)
+            values = np.fromiter(values, dtype=np.int8, count=len(values))
 
         elif isinstance(values, np.ndarray):
             if values.dtype != "int8":
@@ -114,92 +124,79 @@ class ByteColumn(column.Column):
     def get_default_value(self):
         return 0
 
-    # pylint: disable=too-many-branches
-    # pylint: disable=too-many-statements
-    # pylint: disable=invalid-name
-    def convert_to(self, typecode):
-        converted = None
-        if typecode == ByteColumn.TYPE_CODE:
-            converted = self.clone()
-        elif typecode == utils.type_code_short_column():
-            converted = dataframe.DataFrame.ShortColumn(values=self._values.astype(np.int16))
-        elif typecode == utils.type_code_int_column():
-            converted = dataframe.DataFrame.IntColumn(values=self._values.astype(np.int32))
-        elif typecode == utils.type_code_long_column():
-            converted = dataframe.DataFrame.LongColumn(values=self._values.astype(np.int64))
-        elif typecode == utils.type_code_string_column():
-            vals = self._values.astype(object)
-            for i, x in np.ndenumerate(vals):
-                vals[i] = str(x)
-
-            converted = dataframe.DataFrame.StringColumn(values=vals)
-        elif typecode == utils.type_code_float_column():
-            converted = dataframe.DataFrame.FloatColumn(values=self._values.astype(np.float32))
-        elif typecode == utils.type_code_double_column():
-            converted = dataframe.DataFrame.DoubleColumn(values=self._values.astype(np.float64))
-        elif typecode == utils.type_code_char_column():
-            vals = self._values.astype(np.uint8)
-            for i, x in np.ndenumerate(vals):
-                vals[i] = ord(str(x)[0])
-
-            converted = dataframe.DataFrame.CharColumn(values=vals)
-        elif typecode == utils.type_code_boolean_column():
-            converted = dataframe.DataFrame.BooleanColumn(values=self._values.astype(bool))
-        elif typecode == utils.type_code_binary_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = bytearray(int(x).to_bytes(1, byteorder="big", signed=True))
-
-            converted = dataframe.DataFrame.BinaryColumn(values=vals)
-        elif typecode == NullableByteColumn.TYPE_CODE:
-            converted = NullableByteColumn(values=self._values.astype(object))
-        elif typecode == utils.type_code_nullable_short_column():
-            converted = dataframe.DataFrame.NullableShortColumn(
-                values=self._values.astype(object))
-
-        elif typecode == utils.type_code_nullable_int_column():
-            converted = dataframe.DataFrame.NullableIntColumn(values=self._values.astype(object))
-        elif typecode == utils.type_code_nullable_long_column():
-            converted = dataframe.DataFrame.NullableLongColumn(
-                values=self._values.astype(object))
-
-        elif typecode == utils.type_code_nullable_string_column():
-            vals = self._values.astype(object)
-            for i, x in np.ndenumerate(vals):
-                vals[i] = str(x)
-
-            converted = dataframe.DataFrame.NullableStringColumn(values=vals)
-        elif typecode == utils.type_code_nullable_float_column():
-            vals = self._values.astype(np.float32)
-            vals = vals.astype(object)
-            converted = dataframe.DataFrame.NullableFloatColumn(values=vals)
-        elif typecode == utils.type_code_nullable_double_column():
-            vals = self._values.astype(np.float64)
-            vals = vals.astype(object)
-            converted = dataframe.DataFrame.NullableDoubleColumn(values=vals)
-        elif typecode == utils.type_code_nullable_char_column():
-            vals = self._values.astype(object)
-            for i, x in np.ndenumerate(vals):
-                vals[i] = ord(str(x)[0])
-
-            converted = dataframe.DataFrame.NullableCharColumn(values=vals)
-        elif typecode == utils.type_code_nullable_boolean_column():
-            vals = self._values.astype(bool)
-            vals = vals.astype(object)
-            converted = dataframe.DataFrame.NullableBooleanColumn(values=vals)
-        elif typecode == utils.type_code_nullable_binary_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = bytearray(int(x).to_bytes(1, byteorder="big", signed=True))
-
-            converted = dataframe.DataFrame.NullableBinaryColumn(values=vals)
-        else:
-            raise dataframe.DataFrameException(
-                "Unknown column type code: {}".format(typecode))
+    def _to_byte(self):
+        return self.clone()
+
+    def _to_short(self):
+        return dataframe.DataFrame.ShortColumn(values=self._values.astype(np.int16))
+
+    def _to_int(self):
+        return dataframe.DataFrame.IntColumn(values=self._values.astype(np.int32))
+
+    def _to_long(self):
+        return dataframe.DataFrame.LongColumn(values=self._values.astype(np.int64))
+
+    def _to_string(self):
+        # numpy formats all values in the same way as str()
+        vals = self._values.astype(str).astype(object)
+        return dataframe.DataFrame.StringColumn(values=vals)
+
+    def _to_float(self):
+        return dataframe.DataFrame.FloatColumn(values=self._values.astype(np.float32))
+
+    def _to_double(self):
+        return dataframe.DataFrame.DoubleColumn(values=self._values.astype(np.float64))
+
+    def _to_char(self):
+        # the first character of the string representation of each
+        # value after it has been cast to uint8
+        vals = utils.leading_chars(self._values.astype(np.uint8))
+        return dataframe.DataFrame.CharColumn(values=vals)
+
+    def _to_boolean(self):
+        return dataframe.DataFrame.BooleanColumn(values=self._values.astype(bool))
+
+    def _to_binary(self):
+        vals = utils.to_bytearrays(self._values, ">i1")
+        return dataframe.DataFrame.BinaryColumn(values=vals)
+
+    def _to_nullable_byte(self):
+        return NullableByteColumn(values=utils.to_objects(self._values))
 
-        # pylint: disable=protected-access
-        converted._name = self._name
-        return converted
+    def _to_nullable_short(self):
+        return dataframe.DataFrame.NullableShortColumn(
+            values=utils.to_objects(self._values))
+
+    def _to_nullable_int(self):
+        return dataframe.DataFrame.NullableIntColumn(values=utils.to_objects(self._values))
+
+    def _to_nullable_long(self):
+        return dataframe.DataFrame.NullableLongColumn(
+            values=utils.to_objects(self._values))
+
+    def _to_nullable_string(self):
+        vals = self._values.astype(str).astype(object)
+        return dataframe.DataFrame.NullableStringColumn(values=vals)
+
+    def _to_nullable_float(self):
+        vals = utils.to_objects(self._values.astype(np.float32))
+        return dataframe.DataFrame.NullableFloatColumn(values=vals)
+
+    def _to_nullable_double(self):
+        vals = utils.to_objects(self._values.astype(np.float64))
+        return dataframe.DataFrame.NullableDoubleColumn(values=vals)
+
+    def _to_nullable_char(self):
+        vals = utils.to_objects(utils.leading_chars(self._values))
+        return dataframe.DataFrame.NullableCharColumn(values=vals)
+
+    def _to_nullable_boolean(self):
+        vals = utils.to_objects(self._values.astype(bool))
+        return dataframe.DataFrame.NullableBooleanColumn(values=vals)
+
+    def _to_nullable_binary(self):
+        vals = utils.to_bytearrays(self._values, ">i1")
+        return dataframe.DataFrame.NullableBinaryColumn(values=vals)
 
     def _create_array(self, size=0):
         return np.zeros(size, dtype=np.int8)
@@ -211,6 +208,8 @@ class NullableByteColumn(column.Column):
 
     TYPE_CODE = 10
 
+    __slots__ = ()
+
     def __init__(self, name=None, values=None):
         """Constructs a new NullableByteColumn.
 
@@ -230,8 +229,9 @@ class NullableByteColumn(column.Column):
             values = np.empty(0, dtype=object)
 
         if isinstance(values, list):
-            for value in values:
-                self._check_type(value)
+            if not utils.is_valid_integers(values, _NULLABLE_INT_TYPES, np.int8):
+                for value in values:
+                    self._check_type(value)
 
             values = np.array(values, dtype=object)
 
@@ -241,8 +241,9 @@ class NullableByteColumn(column.Column):
                     ("Invalid argument array. Expected "
                      "byte array (object) but found {}".format(values.dtype)))
 
-            for value in values:
-                self._check_type(value)
+            if not utils.is_valid_integers(values, _NULLABLE_INT_TYPES, np.int8):
+                for value in values:
+                    self._check_type(value)
 
         elif isinstance(values, int):
             values = np.empty(values, dtype=object)
@@ -298,183 +299,123 @@ class NullableByteColumn(column.Column):
     def get_default_value(self):
         return None
 
-    # pylint: disable=too-many-branches
-    # pylint: disable=too-many-statements
-    # pylint: disable=invalid-name
-    def convert_to(self, typecode):
-        converted = None
-        if typecode == ByteColumn.TYPE_CODE:
-            vals = np.empty([self._values.shape[0]], dtype=np.int8)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = int(x)
-                else:
-                    vals[i] = 0
-
-            converted = ByteColumn(values=vals)
-        elif typecode == utils.type_code_short_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int16)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = int(x)
-                else:
-                    vals[i] = 0
-
-            converted = dataframe.DataFrame.ShortColumn(values=vals)
-        elif typecode == utils.type_code_int_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int32)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = int(x)
-                else:
-                    vals[i] = 0
-
-            converted = dataframe.DataFrame.IntColumn(values=vals)
-        elif typecode == utils.type_code_long_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int64)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = int(x)
-                else:
-                    vals[i] = 0
-
-            converted = dataframe.DataFrame.LongColumn(values=vals)
-        elif typecode == utils.type_code_string_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = str(x)
-                else:
-                    vals[i] = utils.default_value_string_column()
-
-            converted = dataframe.DataFrame.StringColumn(values=vals)
-        elif typecode == utils.type_code_float_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.float32)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = float(x)
-                else:
-                    vals[i] = 0.0
-
-            converted = dataframe.DataFrame.FloatColumn(values=vals)
-        elif typecode == utils.type_code_double_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.float64)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = float(x)
-                else:
-                    vals[i] = 0.0
-
-            converted = dataframe.DataFrame.DoubleColumn(values=vals)
-        elif typecode == utils.type_code_char_column():
-            vals = np.zeros([self._values.shape[0]], dtype=np.uint8)
-            ord_default = ord(utils.default_value_char_column())
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = ord(str(x)[0])
-                else:
-                    vals[i] = ord_default
-
-            converted = dataframe.DataFrame.CharColumn(values=vals)
-        elif typecode == utils.type_code_boolean_column():
-            vals = np.empty([self._values.shape[0]], dtype=bool)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = (x != 0)
-                else:
-                    vals[i] = False
-
-            converted = dataframe.DataFrame.BooleanColumn(values=vals)
-        elif typecode == utils.type_code_binary_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = bytearray(int(x).to_bytes(1, byteorder="big", signed=True))
-                else:
-                    vals[i] = bytearray(int(0).to_bytes(1, byteorder="big", signed=True))
-
-            converted = dataframe.DataFrame.BinaryColumn(values=vals)
-        elif typecode == NullableByteColumn.TYPE_CODE:
-            converted = self.clone()
-        elif typecode == utils.type_code_nullable_short_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(np.int16(x)) if x is not None else None
-
-            converted = dataframe.DataFrame.NullableShortColumn(values=vals)
-        elif typecode == utils.type_code_nullable_int_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(np.int32(x)) if x is not None else None
-
-            converted = dataframe.DataFrame.NullableIntColumn(values=vals)
-        elif typecode == utils.type_code_nullable_long_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(np.int64(x)) if x is not None else None
-
-            converted = dataframe.DataFrame.NullableLongColumn(values=vals)
-        elif typecode == utils.type_code_nullable_string_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = str(x)
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableStringColumn(values=vals)
-        elif typecode == utils.type_code_nullable_float_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = float(x)
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableFloatColumn(values=vals)
-        elif typecode == utils.type_code_nullable_double_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = float(x)
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableDoubleColumn(values=vals)
-        elif typecode == utils.type_code_nullable_char_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = ord(str(x)[0])
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableCharColumn(values=vals)
-        elif typecode == utils.type_code_nullable_boolean_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = (x != 0)
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableBooleanColumn(values=vals)
-        elif typecode == utils.type_code_nullable_binary_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = bytearray(int(x).to_bytes(1, byteorder="big", signed=True))
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableBinaryColumn(values=vals)
-        else:
-            raise dataframe.DataFrameException(
-                "Unknown column type code: {}".format(typecode))
+    def _to_byte(self):
+        _, data = self._densify()
+        return ByteColumn(values=data.astype(np.int8))
+
+    def _to_short(self):
+        _, data = self._densify()
+        vals = utils.cast_integers(self._values, data, np.int16)
+        return dataframe.DataFrame.ShortColumn(values=vals)
+
+    def _to_int(self):
+        _, data = self._densify()
+        vals = utils.cast_integers(self._values, data, np.int32)
+        return dataframe.DataFrame.IntColumn(values=vals)
+
+    def _to_long(self):
+        _, data = self._densify()
+        return dataframe.DataFrame.LongColumn(values=data)
+
+    def _to_string(self):
+        mask, data = self._densify()
+        vals = data.astype(str).astype(object)
+        vals[mask] = utils.default_value_string_column()
+        return dataframe.DataFrame.StringColumn(values=vals)
+
+    def _to_float(self):
+        _, data = self._densify()
+        # values are converted to float32 by way of a Python float
+        vals = data.astype(np.float64).astype(np.float32)
+        return dataframe.DataFrame.FloatColumn(values=vals)
+
+    def _to_double(self):
+        _, data = self._densify()
+        return dataframe.DataFrame.DoubleColumn(values=data.astype(np.float64))
+
+    def _to_char(self):
+        # the first character of the string representation of each value
+        mask, data = self._densify()
+        vals = utils.leading_chars(data)
+        vals[mask] = ord(utils.default_value_char_column())
+        return dataframe.DataFrame.CharColumn(values=vals)
+
+    def _to_boolean(self):
+        _, data = self._densify()
+        return dataframe.DataFrame.BooleanColumn(values=(data != 0))
+
+    def _to_binary(self):
+        _, data = self._densify()
+        vals = utils.to_bytearrays(data, ">i1")
+        return dataframe.DataFrame.BinaryColumn(values=vals)
+
+    def _to_nullable_byte(self):
+        return self.clone()
+
+    def _to_nullable_short(self):
+        mask, data = self._densify()
+        vals = utils.to_objects(utils.cast_integers(self._values, data, np.int16))
+        vals[mask] = None
+        return dataframe.DataFrame.NullableShortColumn(values=vals)
+
+    def _to_nullable_int(self):
+        mask, data = self._densify()
+        vals = utils.to_objects(utils.cast_integers(self._values, data, np.int32))
+        vals[mask] = None
+        return dataframe.DataFrame.NullableIntColumn(values=vals)
+
+    def _to_nullable_long(self):
+        mask, data = self._densify()
+        vals = utils.to_objects(data)
+        vals[mask] = None
+        return dataframe.DataFrame.NullableLongColumn(values=vals)
+
+    def _to_nullable_string(self):
+        mask, data = self._densify()
+        vals = data.astype(str).astype(object)
+        vals[mask] = None
+        return dataframe.DataFrame.NullableStringColumn(values=vals)
+
+    def _to_nullable_float(self):
+        # values are not rounded to single precision
+        mask, data = self._densify()
+        vals = utils.to_objects(data.astype(np.float64))
+        vals[mask] = None
+        return dataframe.DataFrame.NullableFloatColumn(values=vals)
+
+    def _to_nullable_double(self):
+        mask, data = self._densify()
+        vals = utils.to_objects(data.astype(np.float64))
+        vals[mask] = None
+        return dataframe.DataFrame.NullableDoubleColumn(values=vals)
+
+    def _to_nullable_char(self):
+        mask, data = self._densify()
+        vals = utils.to_objects(utils.leading_chars(data))
+        vals[mask] = None
+        return dataframe.DataFrame.NullableCharColumn(values=vals)
+
+    def _to_nullable_boolean(self):
+        mask, data = self._densify()
+        vals = utils.to_objects(data != 0)
+        vals[mask] = None
+        return dataframe.DataFrame.NullableBooleanColumn(values=vals)
+
+    def _to_nullable_binary(self):
+        mask, data = self._densify()
+        vals = utils.to_bytearrays(data, ">i1")
+        vals[mask] = None
+        return dataframe.DataFrame.NullableBinaryColumn(values=vals)
+
+    def _densify(self):
+        """Splits the values of this column into a null mask and an int64
+        array in which all null values are replaced by zero.
 
-        # pylint: disable=protected-access
-        converted._name = self._name
-        return converted
+        Returns:
+            A tuple holding the boolean mask which is True at all indices
+            of null values, and the int64 array of the values
+        """
+        return utils.densify(self._values, np.int64)
 
     def _create_array(self, size=0):
         return np.empty(size, dtype=object)
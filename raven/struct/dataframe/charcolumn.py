@@ -39,6 +39,8 @@ class CharColumn(column.Column):
     """
 
     TYPE_CODE = 8
+
+    __slots__ = ()
     DEFAULT_VALUE = "?"
 
     def __init__(self, name=None, values=None):
@@ -73,17 +75,14 @@ class CharColumn(column.Column):
                     ("Invalid argument array. Expected "
                      "char array (uint8) but found {}".format(values.dtype)))
 
-            for i, value in enumerate(values):
-                if (value < 32) or (value > 126):
-                    raise dataframe.DataFrameException(
-                        ("Invalid character value for CharColumn at index {}. "
-                         "Only printable ASCII is permitted").format(i))
+            invalid = _invalid_index(values)
+            if invalid is not None:
+                raise dataframe.DataFrameException(
+                    ("Invalid character value for CharColumn at index {}. "
+                     "Only printable ASCII is permitted").format(invalid))
 
         elif isinstance(values, int):
-            values = np.zeros(values, dtype=np.uint8)
-            default_val = ord(CharColumn.DEFAULT_VALUE)
-            for i in range(values.shape[0]):
-                values[i] = default_val
+            values = np.full(values, ord(CharColumn.DEFAULT_VALUE), dtype=np.uint8)
         else:
             raise dataframe.DataFrameException(
                 ("Invalid argument array. Expected "
@@ -173,151 +172,158 @@ class CharColumn(column.Column):
         self._check_type(value)
         self._values[index] = ord(value)
 
-    # pylint: disable=too-many-branches
-    # pylint: disable=too-many-statements
-    # pylint: disable=invalid-name
-    def convert_to(self, typecode):
-        converted = None
-        if typecode == utils.type_code_byte_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int8)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(chr(x))
-
-            converted = dataframe.DataFrame.ByteColumn(values=vals)
-        elif typecode == utils.type_code_short_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int16)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(chr(x))
-
-            converted = dataframe.DataFrame.ShortColumn(values=vals)
-        elif typecode == utils.type_code_int_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int32)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(chr(x))
-
-            converted = dataframe.DataFrame.IntColumn(values=vals)
-        elif typecode == utils.type_code_long_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int64)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(chr(x))
-
-            converted = dataframe.DataFrame.LongColumn(values=vals)
-        elif typecode == utils.type_code_string_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = chr(x)
-
-            converted = dataframe.DataFrame.StringColumn(values=vals)
-        elif typecode == utils.type_code_float_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.float32)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = float(chr(x))
-
-            converted = dataframe.DataFrame.FloatColumn(values=vals)
-        elif typecode == utils.type_code_double_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.float64)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = float(chr(x))
-
-            converted = dataframe.DataFrame.DoubleColumn(values=vals)
-        elif typecode == CharColumn.TYPE_CODE:
-            converted = self.clone()
-        elif typecode == utils.type_code_boolean_column():
-            values_true = {"t", "1", "y"}
-            values_false = {"f", "0", "n"}
-            vals = np.empty([self._values.shape[0]], dtype=bool)
-            for i, x in np.ndenumerate(self._values):
-                x = chr(x).lower()
-                is_true = x in values_true
-                is_false = x in values_false
-                if not is_true and not is_false:
-                    raise dataframe.DataFrameException(
-                        ("Invalid boolean character: '{}'".format(self._values[i])))
+    def _to_byte(self):
+        vals = np.empty(self._values.shape[0], dtype=np.int8)
+        for i, x in enumerate(self._values):
+            vals[i] = int(chr(x))
 
-                vals[i] = is_true
+        return dataframe.DataFrame.ByteColumn(values=vals)
 
-            converted = dataframe.DataFrame.BooleanColumn(values=vals)
-        elif typecode == utils.type_code_binary_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = bytearray(chr(x).encode("utf-8"))
+    def _to_short(self):
+        vals = np.empty(self._values.shape[0], dtype=np.int16)
+        for i, x in enumerate(self._values):
+            vals[i] = int(chr(x))
 
-            converted = dataframe.DataFrame.BinaryColumn(values=vals)
-        elif typecode == utils.type_code_nullable_byte_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(chr(x))
-
-            converted = dataframe.DataFrame.NullableByteColumn(values=vals)
-        elif typecode == utils.type_code_nullable_short_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(chr(x))
-
-            converted = dataframe.DataFrame.NullableShortColumn(values=vals)
-        elif typecode == utils.type_code_nullable_int_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(chr(x))
-
-            converted = dataframe.DataFrame.NullableIntColumn(values=vals)
-        elif typecode == utils.type_code_nullable_long_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(chr(x))
-
-            converted = dataframe.DataFrame.NullableLongColumn(values=vals)
-        elif typecode == utils.type_code_nullable_string_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = chr(x)
-
-            converted = dataframe.DataFrame.NullableStringColumn(values=vals)
-        elif typecode == utils.type_code_nullable_float_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = float(chr(x))
-
-            converted = dataframe.DataFrame.NullableFloatColumn(values=vals)
-        elif typecode == utils.type_code_nullable_double_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = float(chr(x))
-
-            converted = dataframe.DataFrame.NullableDoubleColumn(values=vals)
-        elif typecode == NullableCharColumn.TYPE_CODE:
-            converted = NullableCharColumn(values=self._values.astype(object))
-        elif typecode == utils.type_code_nullable_boolean_column():
-            values_true = {"t", "1", "y"}
-            values_false = {"f", "0", "n"}
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                x = chr(x).lower()
-                is_true = x in values_true
-                is_false = x in values_false
-                if not is_true and not is_false:
-                    raise dataframe.DataFrameException(
-                        ("Invalid boolean character: '{}'".format(self._values[i])))
+        return dataframe.DataFrame.ShortColumn(values=vals)
 
-                vals[i] = is_true
+    def _to_int(self):
+        vals = np.empty(self._values.shape[0], dtype=np.int32)
+        for i, x in enumerate(self._values):
+            vals[i] = int(chr(x))
 
-            converted = dataframe.DataFrame.NullableBooleanColumn(values=vals)
-        elif typecode == utils.type_code_nullable_binary_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = bytearray(chr(x).encode("utf-8"))
+        return dataframe.DataFrame.IntColumn(values=vals)
 
-            converted = dataframe.DataFrame.NullableBinaryColumn(values=vals)
-        else:
-            raise dataframe.DataFrameException(
-                "Unknown column type code: {}".format(typecode))
+    def _to_long(self):
+        vals = np.empty(self._values.shape[0], dtype=np.int64)
+        for i, x in enumerate(self._values):
+            vals[i] = int(chr(x))
+
+        return dataframe.DataFrame.LongColumn(values=vals)
+
+    def _to_string(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = chr(x)
+
+        return dataframe.DataFrame.StringColumn(values=vals)
+
+    def _to_float(self):
+        vals = np.empty(self._values.shape[0], dtype=np.float32)
+        for i, x in enumerate(self._values):
+            vals[i] = float(chr(x))
+
+        return dataframe.DataFrame.FloatColumn(values=vals)
+
+    def _to_double(self):
+        vals = np.empty(self._values.shape[0], dtype=np.float64)
+        for i, x in enumerate(self._values):
+            vals[i] = float(chr(x))
+
+        return dataframe.DataFrame.DoubleColumn(values=vals)
+
+    def _to_char(self):
+        return self.clone()
+
+    def _to_boolean(self):
+        values_true = {"t", "1", "y"}
+        values_false = {"f", "0", "n"}
+        vals = np.empty(self._values.shape[0], dtype=bool)
+        for i, x in enumerate(self._values):
+            x = chr(x).lower()
+            is_true = x in values_true
+            is_false = x in values_false
+            if not is_true and not is_false:
+                raise dataframe.DataFrameException(
+                    ("Invalid boolean character: '{}'".format(self._values[i])))
 
-        # pylint: disable=protected-access
-        converted._name = self._name
-        return converted
+            vals[i] = is_true
+
+        return dataframe.DataFrame.BooleanColumn(values=vals)
+
+    def _to_binary(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = bytearray(chr(x).encode("utf-8"))
+
+        return dataframe.DataFrame.BinaryColumn(values=vals)
+
+    def _to_nullable_byte(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = int(chr(x))
+
+        return dataframe.DataFrame.NullableByteColumn(values=vals)
+
+    def _to_nullable_short(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = int(chr(x))
+
+        return dataframe.DataFrame.NullableShortColumn(values=vals)
+
+    def _to_nullable_int(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = int(chr(x))
+
+        return dataframe.DataFrame.NullableIntColumn(values=vals)
+
+    def _to_nullable_long(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = int(chr(x))
+
+        return dataframe.DataFrame.NullableLongColumn(values=vals)
+
+    def _to_nullable_string(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = chr(x)
+
+        return dataframe.DataFrame.NullableStringColumn(values=vals)
+
+    def _to_nullable_float(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = float(chr(x))
+
+        return dataframe.DataFrame.NullableFloatColumn(values=vals)
+
+    def _to_nullable_double(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = float(chr(x))
+
+        return dataframe.DataFrame.NullableDoubleColumn(values=vals)
+
+    def _to_nullable_char(self):
+        return NullableCharColumn(values=self._values.astype(object))
+
+    def _to_nullable_boolean(self):
+        values_true = {"t", "1", "y"}
+        values_false = {"f", "0", "n"}
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            x = chr(x).lower()
+            is_true = x in values_true
+            is_false = x in values_false
+            if not is_true and not is_false:
+                raise dataframe.DataFrameException(
+                    ("Invalid boolean character: '{}'".format(self._values[i])))
+
+            vals[i] = is_true
+
+        return dataframe.DataFrame.NullableBooleanColumn(values=vals)
+
+    def _to_nullable_binary(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = bytearray(chr(x).encode("utf-8"))
+
+        return dataframe.DataFrame.NullableBinaryColumn(values=vals)
 
     def _create_array(self, size=0):
-        return np.zeros(size, dtype=np.uint8) + ord(self.get_default_value())
+        return np.full(size, ord(self.get_default_value()), dtype=np.uint8)
 
 class NullableCharColumn(column.Column):
     """A Column holding nullable single ASCII-character values.
@@ -338,6 +344,8 @@ class NullableCharColumn(column.Column):
 
     TYPE_CODE = 17
 
+    __slots__ = ()
+
     # pylint: disable=too-many-branches
     def __init__(self, name=None, values=None):
         """Constructs a new NullableCharColumn.
@@ -352,7 +360,8 @@ class NullableCharColumn(column.Column):
         Args:
             name: The name of the NullableCharColumn as a string
             values: The content of the NullableCharColumn.
-                Must be a list or numpy array with dtype object, or an int
+                Must be a list or numpy array with dtype object
+                or uint8, or an int
         """
         if values is None:
             values = np.empty(0, dtype=object)
@@ -368,6 +377,18 @@ class NullableCharColumn(column.Column):
 
             values = charvals
 
+        elif isinstance(values, np.ndarray) and values.dtype == "uint8":
+            # an array without null values is validated in bulk
+            invalid = _invalid_index(values)
+            if invalid is not None:
+                raise dataframe.DataFrameException(
+                    ("Invalid character value for NullableCharColumn at index {}. "
+                     "Only printable ASCII is permitted").format(invalid))
+
+            charvals = np.empty(values.shape[0], dtype=object)
+            charvals[:] = values.tolist()
+            values = charvals
+
         elif isinstance(values, np.ndarray):
             if values.dtype != "object":
                 raise dataframe.DataFrameException(
@@ -506,165 +527,179 @@ class NullableCharColumn(column.Column):
         else:
             self._values[index] = ord(value)
 
-    # pylint: disable=too-many-branches
-    # pylint: disable=too-many-statements
-    # pylint: disable=invalid-name
-    def convert_to(self, typecode):
-        converted = None
-        if typecode == utils.type_code_byte_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int8)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(chr(x)) if x is not None else 0
-
-            converted = dataframe.DataFrame.ByteColumn(values=vals)
-        elif typecode == utils.type_code_short_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int16)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(chr(x)) if x is not None else 0
-
-            converted = dataframe.DataFrame.ShortColumn(values=vals)
-        elif typecode == utils.type_code_int_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int32)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(chr(x)) if x is not None else 0
-
-            converted = dataframe.DataFrame.IntColumn(values=vals)
-        elif typecode == utils.type_code_long_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int64)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(chr(x)) if x is not None else 0
-
-            converted = dataframe.DataFrame.LongColumn(values=vals)
-        elif typecode == utils.type_code_string_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = chr(x) if x is not None else utils.default_value_string_column()
-
-            converted = dataframe.DataFrame.StringColumn(values=vals)
-        elif typecode == utils.type_code_float_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.float32)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = float(chr(x)) if x is not None else 0.0
-
-            converted = dataframe.DataFrame.FloatColumn(values=vals)
-        elif typecode == utils.type_code_double_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.float64)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = float(chr(x)) if x is not None else 0.0
-
-            converted = dataframe.DataFrame.DoubleColumn(values=vals)
-        elif typecode == utils.type_code_char_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.uint8)
-            ord_default = ord(CharColumn.DEFAULT_VALUE)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = x if x is not None else ord_default
-
-            converted = dataframe.DataFrame.CharColumn(values=vals)
-        elif typecode == utils.type_code_boolean_column():
-            values_true = {"t", "1", "y"}
-            values_false = {"f", "0", "n"}
-            vals = np.empty([self._values.shape[0]], dtype=bool)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    x = chr(x).lower()
-                    is_true = x in values_true
-                    is_false = x in values_false
-                    if not is_true and not is_false:
-                        raise dataframe.DataFrameException(
-                            ("Invalid boolean character: '{}'".format(self._values[i])))
+    def _to_byte(self):
+        vals = np.empty(self._values.shape[0], dtype=np.int8)
+        for i, x in enumerate(self._values):
+            vals[i] = int(chr(x)) if x is not None else 0
 
-                    vals[i] = is_true
-                else:
-                    vals[i] = False
-
-            converted = dataframe.DataFrame.BooleanColumn(values=vals)
-        elif typecode == utils.type_code_binary_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = bytearray(chr(x).encode("utf-8"))
-                else:
-                    vals[i] = bytearray.fromhex("00")
-
-            converted = dataframe.DataFrame.BinaryColumn(values=vals)
-        elif typecode == utils.type_code_nullable_byte_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(chr(x)) if x is not None else None
-
-            converted = dataframe.DataFrame.NullableByteColumn(values=vals)
-        elif typecode == utils.type_code_nullable_short_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(chr(x)) if x is not None else None
-
-            converted = dataframe.DataFrame.NullableShortColumn(values=vals)
-        elif typecode == utils.type_code_nullable_int_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(chr(x)) if x is not None else None
-
-            converted = dataframe.DataFrame.NullableIntColumn(values=vals)
-        elif typecode == utils.type_code_nullable_long_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(chr(x)) if x is not None else None
-
-            converted = dataframe.DataFrame.NullableLongColumn(values=vals)
-        elif typecode == utils.type_code_nullable_string_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = chr(x) if x is not None else None
-
-            converted = dataframe.DataFrame.NullableStringColumn(values=vals)
-        elif typecode == utils.type_code_nullable_float_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = float(chr(x)) if x is not None else None
-
-            converted = dataframe.DataFrame.NullableFloatColumn(values=vals)
-        elif typecode == utils.type_code_nullable_double_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = float(chr(x)) if x is not None else None
-
-            converted = dataframe.DataFrame.NullableDoubleColumn(values=vals)
-        elif typecode == NullableCharColumn.TYPE_CODE:
-            converted = self.clone()
-        elif typecode == utils.type_code_nullable_boolean_column():
-            values_true = {"t", "1", "y"}
-            values_false = {"f", "0", "n"}
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    x = chr(x).lower()
-                    is_true = x in values_true
-                    is_false = x in values_false
-                    if not is_true and not is_false:
-                        raise dataframe.DataFrameException(
-                            ("Invalid boolean character: '{}'".format(self._values[i])))
+        return dataframe.DataFrame.ByteColumn(values=vals)
 
-                    vals[i] = is_true
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableBooleanColumn(values=vals)
-        elif typecode == utils.type_code_nullable_binary_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = bytearray(chr(x).encode("utf-8"))
-                else:
-                    vals[i] = None
+    def _to_short(self):
+        vals = np.empty(self._values.shape[0], dtype=np.int16)
+        for i, x in enumerate(self._values):
+            vals[i] = int(chr(x)) if x is not None else 0
 
-            converted = dataframe.DataFrame.NullableBinaryColumn(values=vals)
-        else:
-            raise dataframe.DataFrameException(
-                "Unknown column type code: {}".format(typecode))
+        return dataframe.DataFrame.ShortColumn(values=vals)
+
+    def _to_int(self):
+        vals = np.empty(self._values.shape[0], dtype=np.int32)
+        for i, x in enumerate(self._values):
+            vals[i] = int(chr(x)) if x is not None else 0
+
+        return dataframe.DataFrame.IntColumn(values=vals)
+
+    def _to_long(self):
+        vals = np.empty(self._values.shape[0], dtype=np.int64)
+        for i, x in enumerate(self._values):
+            vals[i] = int(chr(x)) if x is not None else 0
+
+        return dataframe.DataFrame.LongColumn(values=vals)
+
+    def _to_string(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = chr(x) if x is not None else utils.default_value_string_column()
+
+        return dataframe.DataFrame.StringColumn(values=vals)
+
+    def _to_float(self):
+        vals = np.empty(self._values.shape[0], dtype=np.float32)
+        for i, x in enumerate(self._values):
+            vals[i] = float(chr(x)) if x is not None else 0.0
+
+        return dataframe.DataFrame.FloatColumn(values=vals)
+
+    def _to_double(self):
+        vals = np.empty(self._values.shape[0], dtype=np.float64)
+        for i, x in enumerate(self._values):
+            vals[i] = float(chr(x)) if x is not None else 0.0
+
+        return dataframe.DataFrame.DoubleColumn(values=vals)
+
+    def _to_char(self):
+        vals = np.empty(self._values.shape[0], dtype=np.uint8)
+        ord_default = ord(CharColumn.DEFAULT_VALUE)
+        for i, x in enumerate(self._values):
+            vals[i] = x if x is not None else ord_default
+
+        return dataframe.DataFrame.CharColumn(values=vals)
+
+    def _to_boolean(self):
+        values_true = {"t", "1", "y"}
+        values_false = {"f", "0", "n"}
+        vals = np.empty(self._values.shape[0], dtype=bool)
+        for i, x in enumerate(self._values):
+            if x is not None:
+                x = chr(x).lower()
+                is_true = x in values_true
+                is_false = x in values_false
+                if not is_true and not is_false:
+                    raise dataframe.DataFrameException(
+                        ("Invalid boolean character: '{}'".format(self._values[i])))
+
+                vals[i] = is_true
+            else:
+                vals[i] = False
+
+        return dataframe.DataFrame.BooleanColumn(values=vals)
+
+    def _to_binary(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None:
+                vals[i] = bytearray(chr(x).encode("utf-8"))
+            else:
+                vals[i] = bytearray.fromhex("00")
 
-        # pylint: disable=protected-access
-        converted._name = self._name
-        return converted
+        return dataframe.DataFrame.BinaryColumn(values=vals)
+
+    def _to_nullable_byte(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = int(chr(x)) if x is not None else None
+
+        return dataframe.DataFrame.NullableByteColumn(values=vals)
+
+    def _to_nullable_short(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = int(chr(x)) if x is not None else None
+
+        return dataframe.DataFrame.NullableShortColumn(values=vals)
+
+    def _to_nullable_int(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = int(chr(x)) if x is not None else None
+
+        return dataframe.DataFrame.NullableIntColumn(values=vals)
+
+    def _to_nullable_long(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = int(chr(x)) if x is not None else None
+
+        return dataframe.DataFrame.NullableLongColumn(values=vals)
+
+    def _to_nullable_string(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = chr(x) if x is not None else None
+
+        return dataframe.DataFrame.NullableStringColumn(values=vals)
+
+    def _to_nullable_float(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = float(chr(x)) if x is not None else None
+
+        return dataframe.DataFrame.NullableFloatColumn(values=vals)
+
+    def _to_nullable_double(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = float(chr(x)) if x is not None else None
+
+        return dataframe.DataFrame.NullableDoubleColumn(values=vals)
+
+    def _to_nullable_char(self):
+        return self.clone()
+
+    def _to_nullable_boolean(self):
+        values_true = {"t", "1", "y"}
+        values_false = {"f", "0", "n"}
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None:
+                x = chr(x).lower()
+                is_true = x in values_true
+                is_false = x in values_false
+                if not is_true and not is_false:
+                    raise dataframe.DataFrameException(
+                        ("Invalid boolean character: '{}'".format(self._values[i])))
+
+                vals[i] = is_true
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableBooleanColumn(values=vals)
+
+    def _to_nullable_binary(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None:
+                vals[i] = bytearray(chr(x).encode("utf-8"))
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableBinaryColumn(values=vals)
 
     def _create_array(self, size=0):
         return np.empty(size, dtype=object)
+
+def _invalid_index(values):
+    """Returns the index of the first value in the specified uint8 array
+    which is not a printable ASCII-character, or None if all values are valid.
+    """
+    invalid = np.flatnonzero((values < 32) | (values > 126))
+    return int(invalid[0]) if invalid.shape[0] > 0 else None
@@ -85,6 +85,8 @@ class Column(ABC):
 
     __metaclass__ = ABCMeta
 
+    __slots__ = ("_name", "_values")
+
     def __init__(self, name=None, values=None):
         """Assigns this Column instance the specified name and values.
 
@@ -104,7 +106,7 @@ class Column(ABC):
                 ("Invalid argument 'values'. "
                  "Expected numpy.ndarray but found {}").format(type(values)))
 
-        self._name = name
+        self._name = dataframe._intern(name) # pylint: disable=protected-access
         self._values = values
 
     @abstractmethod
@@ -159,7 +161,6 @@ class Column(ABC):
         """
         raise NotImplementedError
 
-    @abstractmethod
     def convert_to(self, typecode):
         """Converts this Column to a Column instance of the specified type code.
 
@@ -177,7 +178,16 @@ class Column(ABC):
             A Column instance with the specified type code which holds all
             entries of this Column converted to the corresponding element type
         """
-        raise NotImplementedError
+        import raven.struct.dataframe._columnutils as utils
+        convert = utils.converters(type(self)).get(typecode)
+        if convert is None:
+            raise dataframe.DataFrameException(
+                "Unknown column type code: {}".format(typecode))
+
+        converted = convert(self)
+        # pylint: disable=protected-access
+        converted._name = self._name
+        return converted
 
     @abstractmethod
     def _check_type(self, value):
@@ -309,10 +319,12 @@ class Column(ABC):
         Returns:
             A copy of this Column
         """
-        copy = Column.of_type(self.type_code())
+        # the values are copied directly, so the
+        # constructor does not have to be called
+        copy = self.__class__.__new__(self.__class__)
         # pylint: disable=protected-access
         copy._name = self._name
-        copy._values = np.copy(self._values)
+        copy._values = self._values.copy()
         return copy
 
     def memory_usage(self):
@@ -520,6 +532,26 @@ class Column(ABC):
             self[i] = self.get_default_value()
             i -= 1
 
+    def _retain(self, keep, next_pos):
+        """Retains all entries selected by the specified mask and removes
+        all other entries.
+
+        The retained entries keep their order and are moved to the front of
+        the internal array. All freed positions are reset to the default value.
+
+        Args:
+            keep: A bool numpy array of length next_pos, which is True
+                for each entry to retain
+            next_pos: The index of the next free position
+        """
+        n = int(np.count_nonzero(keep))
+        self._values[:n] = self._values[:next_pos][keep]
+        if self._values.dtype == object:
+            for i in range(n, next_pos):
+                self[i] = self.get_default_value()
+        elif n < next_pos:
+            self[n:next_pos] = self.get_default_value()
+
     def _resize(self):
         """Resizes the internal array holding the column entries.
 
@@ -532,9 +564,7 @@ class Column(ABC):
         else:
             new_entries = self._create_array(2)
 
-        for i in range(valsize):
-            new_entries[i] = self._values[i]
-
+        new_entries[:valsize] = self._values
         self._values = new_entries
 
     def _match_length(self, length):
@@ -546,10 +576,6 @@ class Column(ABC):
         valsize = self._values.shape[0]
         if length != valsize:
             tmp = self._create_array(length)
-            for i in range(length):
-                if i < valsize:
-                    tmp[i] = self._values[i]
-                else:
-                    break
-
+            n = min(length, valsize)
+            tmp[:n] = self._values[:n]
             self._values = tmp
@@ -15,7 +15,9 @@
 """Provides a DataFrame API and implementations."""
 
 import re as regex_matcher
+import sys
 import inspect
+import concurrent.futures
 
 from abc import ABC, ABCMeta
 
@@ -35,6 +37,148 @@ import raven.struct.dataframe.binarycolumn as binarycolumn
 import raven.struct.dataframe._dataframeutils as dataframeutils
 import raven.io.dataframe.dataframes
 import raven.io.dataframe.csvfiles
+import raven.io.dataframe.parquetfiles
+
+# Column classes resolved once at import time so that the factory
+# methods of the DataFrame class do not look them up on every call
+_ByteColumn = bytecolumn.ByteColumn
+_ShortColumn = shortcolumn.ShortColumn
+_IntColumn = intcolumn.IntColumn
+_LongColumn = longcolumn.LongColumn
+_StringColumn = stringcolumn.StringColumn
+_FloatColumn = floatcolumn.FloatColumn
+_DoubleColumn = doublecolumn.DoubleColumn
+_CharColumn = charcolumn.CharColumn
+_BooleanColumn = booleancolumn.BooleanColumn
+_BinaryColumn = binarycolumn.BinaryColumn
+_NullableByteColumn = bytecolumn.NullableByteColumn
+_NullableShortColumn = shortcolumn.NullableShortColumn
+_NullableIntColumn = intcolumn.NullableIntColumn
+_NullableLongColumn = longcolumn.NullableLongColumn
+_NullableStringColumn = stringcolumn.NullableStringColumn
+_NullableFloatColumn = floatcolumn.NullableFloatColumn
+_NullableDoubleColumn = doublecolumn.NullableDoubleColumn
+_NullableCharColumn = charcolumn.NullableCharColumn
+_NullableBooleanColumn = booleancolumn.NullableBooleanColumn
+_NullableBinaryColumn = binarycolumn.NullableBinaryColumn
+
+# maps each element type name to its (default, nullable) Column classes
+_COL_CLASSES = {
+    "byte": (_ByteColumn, _NullableByteColumn),
+    "short": (_ShortColumn, _NullableShortColumn),
+    "int": (_IntColumn, _NullableIntColumn),
+    "long": (_LongColumn, _NullableLongColumn),
+    "string": (_StringColumn, _NullableStringColumn),
+    "float": (_FloatColumn, _NullableFloatColumn),
+    "double": (_DoubleColumn, _NullableDoubleColumn),
+    "char": (_CharColumn, _NullableCharColumn),
+    "boolean": (_BooleanColumn, _NullableBooleanColumn),
+    "binary": (_BinaryColumn, _NullableBinaryColumn),
+}
+
+# Column constructors indexed by column kind, as resolved by _KINDS
+_CTOR_TABLE = tuple(pair[0] for pair in _COL_CLASSES.values())
+_NCTOR_TABLE = tuple(pair[1] for pair in _COL_CLASSES.values())
+
+# maps all accepted type names, including aliases, to a column kind
+_KINDS = {name: kind for kind, name in enumerate(_COL_CLASSES)}
+_KINDS.update({"integer": _KINDS["int"], "str": _KINDS["string"],
+               "character": _KINDS["char"], "bool": _KINDS["boolean"]})
+
+def _intern(name):
+    """Returns the interned version of the specified Column name.
+
+    Column names are used as dict keys and compared frequently, so all
+    names are interned when they are assigned to a Column. Empty names
+    and None are returned unchanged.
+    """
+    return sys.intern(str(name)) if name else name
+
+def _make_column(kind, nullable, name=None, values=None):
+    """Constructs a new Column of the specified kind.
+
+    This is the internal counterpart of the Column factory methods of the
+    DataFrame class. Callers should resolve type names to kinds once
+    through the _KINDS table and then construct Columns with this function.
+
+    Args:
+        kind: The kind of the Column to construct, as an int
+        nullable: A boolean flag indicating whether to construct
+            a nullable Column
+        name: The name of the Column as a string
+        values: The content of the Column
+
+    Returns:
+        A new Column of the specified kind
+    """
+    return (_NCTOR_TABLE if nullable else _CTOR_TABLE)[kind](name, values)
+
+def _row_values(col, start, stop):
+    """Returns the values of the specified Column in the specified range
+    of rows, as they would be returned by the Column's item access.
+    """
+    # pylint: disable=protected-access
+    values = col._values[start:stop]
+    if isinstance(col, (_CharColumn, _NullableCharColumn)):
+        return [None if v is None else chr(v) for v in values]
+
+    return values
+
+def _ranked_positions(values, k, descending):
+    """Returns the positions of the k smallest or largest of the specified
+    values, which must not contain NaN. Equal values are ordered by their
+    position.
+    """
+    n = values.shape[0]
+    if k == 0:
+        return np.arange(0)
+
+    positions = np.arange(n)
+    if k < n:
+        # only the values up to the k-th value need to be sorted
+        if descending:
+            kth = np.partition(values, n - k)[n - k]
+            positions = np.flatnonzero(values >= kth)
+        else:
+            kth = np.partition(values, k - 1)[k - 1]
+            positions = np.flatnonzero(values <= kth)
+
+        values = values[positions]
+
+    if descending:
+        # sort the reversed values so that ties keep their order
+        order = np.argsort(values[::-1], kind="stable")[::-1]
+        order = (values.shape[0] - 1) - order
+    else:
+        order = np.argsort(values, kind="stable")
+
+    return positions[order[:k]]
+
+def _with_nan_positions(ranked, nans, k, n):
+    """Merges the specified positions of NaN values into the specified
+    positions of ranked values. Each NaN is placed as soon as it is the
+    first position not yet taken, as no value compares less or greater
+    than NaN. Returns the first k of the n merged positions.
+    """
+    taken = np.zeros(n, dtype=bool)
+    merged = np.empty(k, dtype=np.int64)
+    first = 0
+    next_ranked = 0
+    next_nan = 0
+    for i in range(k):
+        while taken[first]:
+            first += 1
+
+        if next_nan < nans.shape[0] and nans[next_nan] == first:
+            merged[i] = nans[next_nan]
+            next_nan += 1
+        else:
+            merged[i] = ranked[next_ranked]
+            next_ranked += 1
+
+        taken[merged[i]] = True
+
+    return merged
 
 __author__ = "Phil Gaiser"
 
@@ -158,6 +302,10 @@ class DataFrame(ABC):
 
     __metaclass__ = ABCMeta
 
+    __slots__ = ("__is_nullable", "__next", "__names", "__columns",
+                 "__type_codes", "__check_fns", "__hash_cache",
+                 "__pending_shrink")
+
     # pylint: disable=C0103, C0121, C0302, W0212, R0911
     # pylint: disable=R0912, R0914, R0915, R1705, R1720
     def __init__(self, is_nullable=None, columns=None):
@@ -197,19 +345,24 @@ class DataFrame(ABC):
                  "a bool. WARNING: This constructor is not public API"))
 
         self.__is_nullable = is_nullable
+        self.__hash_cache = None
+        self.__pending_shrink = False
         if columns is None or len(columns) == 0:
             self.__next = -1
             self.__names = None
             self.__columns = None
+            self.__type_codes = None
+            self.__check_fns = None
             return
 
+        # sizes, types and names of all Columns are validated
+        # in a single pass over the constructor arguments
         col_size = columns[0].capacity()
-        for i in range(1, len(columns)):
-            if columns[i].capacity() != col_size:
-                raise DataFrameException("Columns have deviating sizes")
-
         self.__names = None
         for i, col in enumerate(columns):
+            if col.capacity() != col_size:
+                raise DataFrameException("Columns have deviating sizes")
+
             if self.__is_nullable:
                 if not col.is_nullable():
                     columns[i] = col.as_nullable()
@@ -227,6 +380,8 @@ class DataFrame(ABC):
 
         self.__next = col_size
         self.__columns = columns
+        self.__type_codes = None
+        self.__check_fns = None
 
     def get_byte(self, col, row):
         """Gets the byte from the specified column at the specified row index.
@@ -718,6 +873,7 @@ class DataFrame(ABC):
             if not name:
                 raise DataFrameException("Column name must not be None or empty")
 
+            name = _intern(name)
             self.__names[name] = i
             self.__columns[i]._name = name
 
@@ -778,6 +934,7 @@ class DataFrame(ABC):
             del self.__names[current]
             overridden = True
 
+        name = _intern(name)
         self.__names[name] = col
         self.__columns[col]._name = name
         return self if arg_is_string else overridden
@@ -858,6 +1015,41 @@ class DataFrame(ABC):
 
         return [col[index] for col in self.__columns]
 
+    def iter_rows(self, buffer_size=500):
+        """Returns a generator over all rows of this DataFrame.
+
+        Each row is yielded as a tuple holding the same values as the list
+        returned by get_row() for the corresponding index. Rows are fetched
+        from the underlying Columns in chunks of the specified size, which is
+        considerably faster than calling get_row() for every row index.
+        This DataFrame must not be structurally modified while the
+        returned generator is in use.
+
+        Args:
+            buffer_size: The number of rows to fetch from the Columns at a time,
+                as an int. Must be positive. The default is 500
+
+        Returns:
+            A generator yielding all rows of this DataFrame, as tuples
+        """
+        if not isinstance(buffer_size, int):
+            raise DataFrameException(
+                ("Invalid argument 'buffer_size'. Expected int "
+                 "but found {}").format(type(buffer_size)))
+
+        if buffer_size < 1:
+            raise DataFrameException(
+                "Invalid buffer size: {}".format(buffer_size))
+
+        return self._iter_rows(buffer_size)
+
+    def _iter_rows(self, buffer_size):
+        rows = self.__next
+        for start in range(0, rows, buffer_size):
+            stop = min(start + buffer_size, rows)
+            yield from zip(*[_row_values(col, start, stop)
+                             for col in self.__columns])
+
     def get_rows(self, from_index=None, to_index=None):
         """Gets the rows located in the specified range.
 
@@ -1109,13 +1301,8 @@ class DataFrame(ABC):
         if index >= self.__next or index < 0:
             raise DataFrameException("Invalid row index: {}".format(index))
 
-        for col in self.__columns:
-            col._remove(index, index+1, self.__next)
-
-        self.__next -= 1
-        if self.__next*3 < self.__columns[0].capacity():
-            self._flush_all(4)
-
+        self._remove_rows_by_range(index, index+1)
+        self._maybe_shrink()
         return self
 
     def remove_rows(self, col=None, regex=None, from_index=None, to_index=None):
@@ -1210,10 +1397,12 @@ class DataFrame(ABC):
                         ("Invalid row index 'to_index': {}").format(to_index))
 
         # call corresponding implementation method
-        if use_match_op:
-            return self._remove_rows_by_match(col, regex)
-        else:
-            return self._remove_rows_by_range(from_index, to_index)
+        result = (self._remove_rows_by_match(col, regex)
+                  if use_match_op
+                  else self._remove_rows_by_range(from_index, to_index))
+
+        self._maybe_shrink()
+        return result
 
     def add_column(self, col=None, name=None):
         """Adds the provided Column to this DataFrame.
@@ -1268,9 +1457,11 @@ class DataFrame(ABC):
         if self.__next == -1:
             self.__columns = [None]
             self.__columns[0] = col
+            self.__type_codes = None
+            self.__check_fns = None
             self.__next = col.capacity()
             if name:
-                col._name = name
+                col._name = _intern(name)
 
             if col._name:
                 self.__names = dict()
@@ -1298,7 +1489,7 @@ class DataFrame(ABC):
 
             tmp[len(self.__columns)] = col
             if name: # override name
-                col._name = name
+                col._name = _intern(name)
 
             if col._name:
                 if self.__names is None:
@@ -1307,6 +1498,8 @@ class DataFrame(ABC):
                 self.__names[col._name] = len(self.__columns)
 
             self.__columns = tmp
+            self.__type_codes = None
+            self.__check_fns = None
 
         return self
 
@@ -1364,6 +1557,8 @@ class DataFrame(ABC):
                     self.__names[key] = value-1
 
         self.__columns = tmp
+        self.__type_codes = None
+        self.__check_fns = None
         return removed
 
     def insert_column(self, index, col=None, name=None):
@@ -1420,7 +1615,7 @@ class DataFrame(ABC):
                     ("Invalid argument 'name'. Expected "
                      "str but found {}").format(type(name)))
 
-            col._name = name
+            col._name = _intern(name)
 
         if col.capacity() == 0 and self.__next > 0:
             col = raven.struct.dataframe.column.Column.like(col, self.__next)
@@ -1431,6 +1626,8 @@ class DataFrame(ABC):
 
             self.__columns = [None]
             self.__columns[0] = col
+            self.__type_codes = None
+            self.__check_fns = None
             self.__next = col.capacity()
             if col._name:
                 self.__names = dict()
@@ -1464,6 +1661,8 @@ class DataFrame(ABC):
                 tmp[i] = self.__columns[i]
 
             self.__columns = tmp
+            self.__type_codes = None
+            self.__check_fns = None
             if self.__names is not None:
                 for key, value in self.__names.items():
                     if value >= index:
@@ -1561,7 +1760,7 @@ class DataFrame(ABC):
         This method can be called when unnecessary space allocation
         should get freed up.
         """
-        if self.__next != -1 and self.__next != self.__columns[0].capacity():
+        if not self._is_flushed():
             self._flush_all(0)
 
     def get_column(self, col):
@@ -1753,7 +1952,7 @@ class DataFrame(ABC):
 
         if isinstance(position, str):
             if self.has_column(position):
-                col._name = position
+                col._name = _intern(position)
                 return self.set_column(self._enforce_name(position), col)
             else:
                 return self.add_column(col, name=position)
@@ -1787,6 +1986,8 @@ class DataFrame(ABC):
         col._match_length(self.capacity())
         old_name = self.__columns[index]._name
         self.__columns[index] = col
+        self.__type_codes = None
+        self.__check_fns = None
         if col._name:
             if self.__names is not None and old_name is not None:
                 del self.__names[old_name]
@@ -1870,6 +2071,8 @@ class DataFrame(ABC):
                  else "DefaultDataFrame cannot use NullableColumn instance"))
 
         self.__columns[col] = c
+        self.__type_codes = None
+        self.__check_fns = None
         return self
 
     def index_of(self, col, regex, start_from=0):
@@ -2059,15 +2262,16 @@ class DataFrame(ABC):
                 i += 1
             else:
                 if k != -1:
-                    self.remove_rows(from_index=k, to_index=i)
+                    self._remove_rows_by_range(k, i)
                     i -= (i - k)
                     k = -1
                 else:
                     i += 1
 
         if k != -1:
-            self.remove_rows(from_index=k, to_index=i)
+            self._remove_rows_by_range(k, i)
 
+        self._maybe_shrink()
         return self
 
     def drop(self, col, regex):
@@ -2265,6 +2469,8 @@ class DataFrame(ABC):
                 factors[i] = total_factors
 
         self.__columns[col] = factors
+        self.__type_codes = None
+        self.__check_fns = None
         return fmap
 
     def count(self, col, regex=None):
@@ -2989,12 +3195,7 @@ class DataFrame(ABC):
         Returns:
             The average of all entries in the specified Column, as a float
         """
-        if isinstance(col, str):
-            col = self._enforce_name(col)
-
-        if self.__next == -1 or col < 0 or col >= len(self.__columns):
-            raise DataFrameException("Invalid column index: {}".format(col))
-
+        col = self._resolve(col)
         c = self.__columns[col]
         if not c.is_numeric():
             msg = ("'{}'".format(c._name)
@@ -3010,13 +3211,13 @@ class DataFrame(ABC):
         sum_value = None
         amount = 0
         if self.__is_nullable:
-            array = c._values[c._values != None]
+            array = self._non_null_values(col)
             amount = array.shape[0]
             if amount > 0:
                 sum_value = np.sum(array)
 
         else:
-            sum_value = np.sum(c._values[0:self.__next])
+            sum_value = dataframeutils.blocked_sum(c._values[0:self.__next])
             amount = self.rows()
 
         return sum_value / amount if amount > 0 else float("NaN")
@@ -3035,9 +3236,7 @@ class DataFrame(ABC):
         Returns:
             The median of all entries in the specified Column, as a float
         """
-        if isinstance(col, str):
-            col = self._enforce_name(col)
-
+        col = self._resolve(col)
         c = self.__columns[col]
         if not c.is_numeric():
             msg = ("'{}'".format(c._name)
@@ -3095,12 +3294,7 @@ class DataFrame(ABC):
             rows, ordered ascendingly by the specified Column if the
             'rank' argument is specified
         """
-        if isinstance(col, str):
-            col = self._enforce_name(col)
-
-        if self.__next == -1 or col < 0 or col >= len(self.__columns):
-            raise DataFrameException("Invalid column index: {}".format(col))
-
+        col = self._resolve(col)
         c = self.__columns[col]
         if not c.is_numeric():
             msg = ("'{}'".format(c._name)
@@ -3123,7 +3317,7 @@ class DataFrame(ABC):
 
         min_value = None
         if self.__is_nullable:
-            array = c._values[c._values != None]
+            array = self._non_null_values(col)
             if array.shape[0] == 0:
                 return float("NaN")
 
@@ -3166,12 +3360,7 @@ class DataFrame(ABC):
             rows, ordered descendingly by the specified Column if the
             'rank' argument is specified
         """
-        if isinstance(col, str):
-            col = self._enforce_name(col)
-
-        if self.__next == -1 or col < 0 or col >= len(self.__columns):
-            raise DataFrameException("Invalid column index: {}".format(col))
-
+        col = self._resolve(col)
         c = self.__columns[col]
         if not c.is_numeric():
             msg = ("'{}'".format(c._name)
@@ -3194,7 +3383,7 @@ class DataFrame(ABC):
 
         max_value = None
         if self.__is_nullable:
-            array = c._values[c._values != None]
+            array = self._non_null_values(col)
             if array.shape[0] == 0:
                 return float("NaN")
 
@@ -3220,12 +3409,7 @@ class DataFrame(ABC):
             The sum of all entries in the specified Column, as an int
             or float.
         """
-        if isinstance(col, str):
-            col = self._enforce_name(col)
-
-        if self.__next == -1 or col < 0 or col >= len(self.__columns):
-            raise DataFrameException("Invalid column index: {}".format(col))
-
+        col = self._resolve(col)
         c = self.__columns[col]
         if not c.is_numeric():
             msg = ("'{}'".format(c._name)
@@ -3241,13 +3425,13 @@ class DataFrame(ABC):
 
         sum_value = None
         if self.__is_nullable:
-            array = c._values[c._values != None]
+            array = self._non_null_values(col)
             if array.shape[0] == 0:
                 return float("NaN")
 
             sum_value = np.sum(array)
         else:
-            sum_value = np.sum(c._values[0:self.__next])
+            sum_value = dataframeutils.blocked_sum(c._values[0:self.__next])
 
         return float(sum_value) if dataframeutils.is_numeric_fp(c) else int(sum_value)
 
@@ -3267,12 +3451,7 @@ class DataFrame(ABC):
         Returns:
             This DataFrame instance
         """
-        if isinstance(col, str):
-            col = self._enforce_name(col)
-
-        if self.__next == -1 or col < 0 or col >= len(self.__columns):
-            raise DataFrameException("Invalid column index: {}".format(col))
-
+        col = self._resolve(col)
         c = self.__columns[col]
         if not c.is_numeric():
             msg = ("'{}'".format(c._name)
@@ -3282,7 +3461,7 @@ class DataFrame(ABC):
             raise DataFrameException(("Unable to compute absolutes. "
                                       "Column {} is not numeric").format(msg))
 
-        values = c.as_array()[0:self.__next]
+        values = self._values_view(col, self.__next)
         if self.__is_nullable:
             mask = values != None
             np.absolute(values, out=values, where=mask)
@@ -3308,12 +3487,7 @@ class DataFrame(ABC):
         Returns:
             This DataFrame instance
         """
-        if isinstance(col, str):
-            col = self._enforce_name(col)
-
-        if self.__next == -1 or col < 0 or col >= len(self.__columns):
-            raise DataFrameException("Invalid column index: {}".format(col))
-
+        col = self._resolve(col)
         c = self.__columns[col]
         if not c.is_numeric():
             msg = ("'{}'".format(c._name)
@@ -3323,7 +3497,7 @@ class DataFrame(ABC):
             raise DataFrameException(("Unable to compute ceil values. "
                                       "Column {} is not numeric").format(msg))
 
-        values = c.as_array()[0:self.__next]
+        values = self._values_view(col, self.__next)
         if dataframeutils.is_numeric_fp(c):
             if self.__is_nullable:
                 mask = values != None
@@ -3350,12 +3524,7 @@ class DataFrame(ABC):
         Returns:
             This DataFrame instance
         """
-        if isinstance(col, str):
-            col = self._enforce_name(col)
-
-        if self.__next == -1 or col < 0 or col >= len(self.__columns):
-            raise DataFrameException("Invalid column index: {}".format(col))
-
+        col = self._resolve(col)
         c = self.__columns[col]
         if not c.is_numeric():
             msg = ("'{}'".format(c._name)
@@ -3365,7 +3534,7 @@ class DataFrame(ABC):
             raise DataFrameException(("Unable to compute floor values. "
                                       "Column {} is not numeric").format(msg))
 
-        values = c.as_array()
+        values = self._values_view(col, self.__next)
         if dataframeutils.is_numeric_fp(c):
             if self.__is_nullable:
                 mask = values != None
@@ -3403,12 +3572,7 @@ class DataFrame(ABC):
                 ("Invalid argument 'dec_places'. Expected a "
                  "non-negative int but found {}".format(dec_places)))
 
-        if isinstance(col, str):
-            col = self._enforce_name(col)
-
-        if self.__next == -1 or col < 0 or col >= len(self.__columns):
-            raise DataFrameException("Invalid column index: {}".format(col))
-
+        col = self._resolve(col)
         c = self.__columns[col]
         if not c.is_numeric():
             msg = ("'{}'".format(c._name)
@@ -3418,7 +3582,7 @@ class DataFrame(ABC):
             raise DataFrameException(("Unable to round values. "
                                       "Column {} is not numeric").format(msg))
 
-        values = c.as_array()
+        values = self._values_view(col, self.__next)
         if dataframeutils.is_numeric_fp(c):
             for i in range(self.__next):
                 if values[i] is not None:
@@ -3447,12 +3611,7 @@ class DataFrame(ABC):
         Returns:
             This DataFrame instance
         """
-        if isinstance(col, str):
-            col = self._enforce_name(col)
-
-        if self.__next == -1 or col < 0 or col >= len(self.__columns):
-            raise DataFrameException("Invalid column index: {}".format(col))
-
+        col = self._resolve(col)
         c = self.__columns[col]
         if not c.is_numeric():
             msg = ("'{}'".format(c._name)
@@ -3480,7 +3639,7 @@ class DataFrame(ABC):
                 raise DataFrameException(
                     "Invalid threshold range: low={} high={}".format(low, high))
 
-        values = c.as_array()
+        values = self._values_view(col, self.__next)
         if dataframeutils.is_numeric_fp(c):
             for i in range(0, self.__next, 1):
                 if values[i] is not None:
@@ -3849,6 +4008,8 @@ class DataFrame(ABC):
         if (names1 is None) ^ (names2 is None):
             return False
 
+        types1 = self._type_codes()
+        types2 = df._type_codes()
         for i in range(df.columns()):
             if names1 is not None and names2 is not None:
                 # compare column names
@@ -3856,21 +4017,59 @@ class DataFrame(ABC):
                     return False
 
             # compare column types
-            if self.get_column(i).type_code() != df.get_column(i).type_code():
+            if types1[i] != types2[i]:
                 return False
 
         # ensure both DataFrames have the same capacity
-        self.flush()
-        df.flush()
+        if not self._is_flushed():
+            self._flush_all(0)
+
+        if not df._is_flushed():
+            df._flush_all(0)
         # compare data
-        for i in range(df.columns()):
-            col2 = df.get_column(i)
-            col1 = self.get_column(i)
-            if not col2.equals(col1):
+        pairs = zip(self.__columns, df._internal_columns())
+        if not dataframeutils.use_column_pool(self.__columns, self.__next):
+            for col1, col2 in pairs:
+                if not DataFrame._columns_equal(col1, col2):
+                    return False
+
+            return True
+
+        pool = dataframeutils.column_pool()
+        futures = [pool.submit(DataFrame._columns_equal, col1, col2)
+                   for col1, col2 in pairs]
+
+        for future in concurrent.futures.as_completed(futures):
+            if not future.result():
+                for f in futures:
+                    f.cancel()
+
                 return False
 
         return True
 
+    @staticmethod
+    def _columns_equal(col1, col2):
+        """Indicates whether the specified Columns are equal.
+
+        Args:
+            col1: The first Column to compare
+            col2: The second Column to compare
+
+        Returns:
+            True if both Columns are equal, False otherwise
+        """
+        values1 = col1._values
+        values2 = col2._values
+        if values1.dtype != object and values1.dtype == values2.dtype:
+            # typed arrays are compared by numpy directly
+            if col1._name != col2._name:
+                return False
+
+            return np.array_equal(values1, values2, equal_nan=True)
+
+        return col2.equals(col1)
+
     def memory_usage(self):
         """Indicates the current memory usage of this DataFrame in bytes.
 
@@ -3890,12 +4089,11 @@ class DataFrame(ABC):
         if self.__next == -1:
             return 0
 
-        self.flush()
-        size = 0
-        for col in self.__columns:
-            size += col.memory_usage()
-
-        return size
+        if not self._is_flushed():
+            self._flush_all(0)
+        columns = self.__columns
+        return int(np.fromiter((col.memory_usage() for col in columns),
+                               dtype=np.int64, count=len(columns)).sum())
 
     def clone(self):
         """Creates and returns a copy of this DataFrame.
@@ -3938,18 +4136,49 @@ class DataFrame(ABC):
                 ("Row length does not match number of columns: {} (the DataFrame "
                  "has {} columns)").format(len(row), self.columns()))
 
-        for i in range(len(self.__columns)):
-            try:
-                self.__columns[i]._check_type(row[i])
-            except DataFrameException as ex:
-                s = ("'{}'".format(self.__columns[i]._name)
-                     if (self.__columns[i]._name is not None)
-                     else "at index {}".format(i))
+        checks = self.__check_fns
+        if checks is None:
+            checks = [col._check_type for col in self.__columns]
+            self.__check_fns = checks
 
-                raise DataFrameException(
-                    ("Invalid row item type at position {} for "
-                     "column {}. Expected {} but found {}")
-                    .format(i, s, self.__columns[i].type_name(), type(row[i]))) from ex
+        i = 0
+        try:
+            for i, check in enumerate(checks):
+                check(row[i])
+
+        except DataFrameException as ex:
+            s = ("'{}'".format(self.__columns[i]._name)
+                 if (self.__columns[i]._name is not None)
+                 else "at index {}".format(i))
+
+            raise DataFrameException(
+                ("Invalid row item type at position {} for "
+                 "column {}. Expected {} but found {}")
+                .format(i, s, self.__columns[i].type_name(), type(row[i]))) from ex
+
+    def _resolve(self, col):
+        """Resolves the specified Column index or name to a valid
+        Column index.
+
+        This method raises an exception in the case of failure or returns
+        the index of the Column in the case of success.
+
+        Args:
+            col: The index or name of the Column. Must be an int or str
+
+        Returns:
+            The index of the specified Column
+
+        Raises:
+            DataFrameException: If the specified index or name is invalid
+        """
+        if isinstance(col, str):
+            return self._enforce_name(col)
+
+        if self.__next == -1 or col < 0 or col >= len(self.__columns):
+            raise DataFrameException("Invalid column index: {}".format(col))
+
+        return col
 
     def _enforce_name(self, col):
         """Enforces that all requirements are met in order to access a
@@ -3998,7 +4227,7 @@ class DataFrame(ABC):
         if row < 0 or row >= self.__next:
             raise DataFrameException("Invalid row index: {}".format(row))
 
-        if self.__columns[col].type_code() != typecode:
+        if self._type_codes()[col] != typecode:
             expected = raven.struct.dataframe.column.Column.of_type(typecode)
             msg = ("'{}'".format(self.__columns[col]._name)
                    if (self.__columns[col]._name is not None)
@@ -4034,7 +4263,7 @@ class DataFrame(ABC):
         if row < 0 or row >= self.__next:
             raise DataFrameException("Invalid row index: {}".format(row))
 
-        if self.__columns[col].type_code() != typecode:
+        if self._type_codes()[col] != typecode:
             expected = raven.struct.dataframe.column.Column.of_type(typecode)
             msg = ("'{}'".format(self.__columns[col]._name)
                    if (self.__columns[col]._name is not None)
@@ -4051,12 +4280,23 @@ class DataFrame(ABC):
         self.__columns[col][row] = value
 
     def _resize(self):
-        """Resizes all Columns sequentially."""
-        for col in self.__columns:
-            col._resize()
+        """Resizes all Columns.
+
+        Large DataFrames are resized concurrently in the column pool.
+        """
+        if dataframeutils.use_column_pool(self.__columns, self.__next):
+            pool = dataframeutils.column_pool()
+            futures = [pool.submit(col._resize) for col in self.__columns]
+            for future in futures:
+                future.result()
+        else:
+            for col in self.__columns:
+                col._resize()
 
     def _flush_all(self, buffer):
-        """Sequentially performs a flush operation on all Columns.
+        """Performs a flush operation on all Columns.
+
+        Large DataFrames are flushed concurrently in the column pool.
 
         A buffer can be set to keep some extra space between the current
         entries and the Column capacity.
@@ -4066,25 +4306,67 @@ class DataFrame(ABC):
                 will apply no buffer at all and will shrink each Column
                 to its minimum required length
         """
-        for col in self.__columns:
-            col._match_length(self.__next+buffer)
+        length = self.__next + buffer
+        if dataframeutils.use_column_pool(self.__columns, self.__next):
+            pool = dataframeutils.column_pool()
+            futures = [pool.submit(col._match_length, length) for col in self.__columns]
+            for future in futures:
+                future.result()
+        else:
+            for col in self.__columns:
+                col._match_length(length)
 
     def _internal_hash_code(self):
         """Internally used hash method."""
-        self.flush()
-        h = 0
-        mod = 2**64
+        if not self._is_flushed():
+            self._flush_all(0)
+        if self.__columns is None:
+            return 0
+
+        hashes = self._column_hash_codes()
         names = self.get_column_names()
         if names is not None:
-            for i, col in enumerate(self.__columns):
-                h = (h + hash(names[i])) % mod
-                h = (h + col.type_code()) % mod
+            hashes.extend(hash(name) for name in names)
+            hashes.extend(col.type_code() for col in self.__columns)
+
+        # all terms are summed with uint64 wrap-around, i.e. modulo 2**64
+        h = np.fromiter(hashes, dtype=np.int64, count=len(hashes))
+        return int(h.view(np.uint64).sum())
+
+    def _column_hash_codes(self):
+        """Computes the hash code of each Column.
+
+        Hash codes of Columns backed by typed numpy arrays are memoized.
+        Each memoized hash code is stored together with a fingerprint of
+        the raw array bytes and is reused as long as the Column content
+        is unchanged. Columns are shared by reference and their arrays
+        can be changed directly, so a fingerprint is used instead of
+        invalidating the memoized value on modification.
 
-        if self.__columns is not None:
-            for i, col in enumerate(self.__columns):
-                h = (h + self.__columns[i].hash_code()) % mod
+        Returns:
+            The hash code of each Column, as a list of int
+        """
+        cache = self.__hash_cache if self.__hash_cache is not None else {}
+        memo = {}
+        hashes = []
+        for col in self.__columns:
+            values = col._values
+            if values.dtype == object:
+                hashes.append(col.hash_code())
+                continue
 
-        return h
+            key = (id(col), col._name, values.dtype.str,
+                   values.shape[0], hash(values.tobytes()))
+
+            h = cache.get(key)
+            if h is None:
+                h = col.hash_code()
+
+            memo[key] = h
+            hashes.append(h)
+
+        self.__hash_cache = memo
+        return hashes
 
     def _replace_by_match(self, col, regex, replacement):
         """Replaces all values in the specified Column that match the
@@ -4106,11 +4388,6 @@ class DataFrame(ABC):
         Returns:
             The number of values that were replaced by this operation, as an int
         """
-        # wrapper function if the replacement arg
-        # is a constant value
-        def wrap_fn(replacement_obj):
-            return lambda i, v: replacement_obj
-
         if isinstance(col, str):
             col = self._enforce_name(col)
 
@@ -4125,8 +4402,7 @@ class DataFrame(ABC):
         if replacement is None:
             return 0 #NO-OP
 
-        if not hasattr(replacement, "__call__"): # is not a function
-            replacement = wrap_fn(replacement)
+        is_constant = not hasattr(replacement, "__call__") # is not a function
 
         if not regex:
             regex = ".*" # match everything
@@ -4138,54 +4414,123 @@ class DataFrame(ABC):
             regex = "nan"
 
         column = self.__columns[col]
-        pattern = regex_matcher.compile(regex)
-        replaced = 0
-        argcount = len(inspect.getfullargspec(replacement)[0])
-        for i in range(self.__next):
-            current_value = column.get_value(i)
-            if not pattern.fullmatch(str(current_value)):
-                continue
+        pattern = dataframeutils.compile_pattern(regex)
+        values, matched = self._match_rows(col, pattern, convert=True)
+        indices = np.flatnonzero(matched).tolist()
+        if not indices:
+            return 0
+
+        replaced_indices = []
+        replaced_values = []
+        if is_constant:
+            replaced_indices = [i for i in indices if values[i] != replacement]
+            replaced_values = [replacement] * len(replaced_indices)
+        else:
+            code = getattr(replacement, "__code__", None)
+            argcount = (code.co_argcount
+                        if code is not None
+                        else len(inspect.getfullargspec(replacement)[0]))
+
+            if argcount not in (1, 2):
+                raise DataFrameException(
+                    ("Replacement function has an "
+                     "invalid number of input arguments. "
+                     "Expected 1 or 2 but found {}").format(argcount))
 
-            replacement_value = None
             try:
                 if argcount == 1:
-                    replacement_value = replacement(current_value)
-                elif argcount == 2:
-                    replacement_value = replacement(i, current_value)
+                    for i in indices:
+                        current_value = values[i]
+                        replacement_value = replacement(current_value)
+                        if replacement_value != current_value:
+                            replaced_indices.append(i)
+                            replaced_values.append(replacement_value)
                 else:
-                    raise DataFrameException(
-                        ("Replacement function has an "
-                         "invalid number of input arguments. "
-                         "Expected 1 or 2 but found {}").format(argcount))
+                    for i in indices:
+                        current_value = values[i]
+                        replacement_value = replacement(i, current_value)
+                        if replacement_value != current_value:
+                            replaced_indices.append(i)
+                            replaced_values.append(replacement_value)
 
             except (ValueError, TypeError) as ex:
                 raise DataFrameException(
                     ("Value replacement function "
                      "has raised {}".format(type(ex)))) from ex
 
-            if replacement_value == current_value:
-                continue
+        if not replaced_indices:
+            return 0
 
-            try:
-                column[i] = replacement_value
-            except DataFrameException as ex:
-                msg1 = ("for column '{}'".format(column._name)
-                        if column._name
-                        else "at column index {}".format(col))
-
-                msg2 = (ex.message[18:]
-                        if (ex.message is not None
-                            and ex.message.startswith("Invalid argument.")
-                            and len(ex.message) > 20)
-                        else ex.message)
+        try:
+            if column.type_code() not in (charcolumn.CharColumn.TYPE_CODE,
+                                          charcolumn.NullableCharColumn.TYPE_CODE):
 
-                raise DataFrameException(
-                    ("Invalid replacement type {}. {}").format(
-                        msg1, msg2)) from ex
+                # write all replacements back to the array in bulk
+                for value in replaced_values[:1] if is_constant else replaced_values:
+                    column._check_type(value)
 
-            replaced += 1
+                if column._values.dtype == object:
+                    for i, value in zip(replaced_indices, replaced_values):
+                        column._values[i] = value
+                else:
+                    column._values[replaced_indices] = replaced_values
 
-        return replaced
+            else:
+                for i, value in zip(replaced_indices, replaced_values):
+                    column[i] = value
+
+        except DataFrameException as ex:
+            msg1 = ("for column '{}'".format(column._name)
+                    if column._name
+                    else "at column index {}".format(col))
+
+            msg2 = (ex.message[18:]
+                    if (ex.message is not None
+                        and ex.message.startswith("Invalid argument.")
+                        and len(ex.message) > 20)
+                    else ex.message)
+
+            raise DataFrameException(
+                ("Invalid replacement type {}. {}").format(
+                    msg1, msg2)) from ex
+
+        return len(replaced_indices)
+
+    def _match_rows(self, col, pattern, convert=False):
+        """Matches the string representation of all values in the
+        specified Column against the specified pattern in one sweep.
+
+        Args:
+            col: The index of the Column to match. Must be an int
+            pattern: The compiled regular expression to match
+            convert: A bool indicating whether to match the values as
+                returned by get_value(), i.e. as Python int, float and bool
+                values, instead of the elements of the Column
+
+        Returns:
+            A tuple holding the values of the Column, as a sequence
+            of length rows(), and a bool numpy array which is True
+            for each row whose value matches the pattern
+        """
+        column = self.__columns[col]
+        values = column._values[:self.__next]
+        if column.type_code() in (charcolumn.CharColumn.TYPE_CODE,
+                                  charcolumn.NullableCharColumn.TYPE_CODE):
+
+            values = [column[i] for i in range(self.__next)]
+
+        elif convert:
+            values = values.tolist()
+            if column._values.dtype == object:
+                values = [value.item() if isinstance(value, (np.number, np.bool_)) else value
+                          for value in values]
+
+        fullmatch = pattern.fullmatch
+        matched = np.fromiter(
+            (fullmatch(str(value)) is not None for value in values),
+            dtype=bool, count=self.__next)
+
+        return values, matched
 
     def _minimum_ranked(self, col, rank):
         """Computes the n-minimum entries in the specified Column and returns
@@ -4211,49 +4556,7 @@ class DataFrame(ABC):
         if rank <= 0:
             raise DataFrameException("Invalid argument 'rank': {}".format(rank))
 
-        if rank > self.__next:
-            rank = self.__next
-
-        cols = [None] * len(self.__columns)
-        for i, c in enumerate(self.__columns):
-            cols[i] = raven.struct.dataframe.column.Column.of_type(c.type_code(), rank)
-
-        result = (NullableDataFrame(cols)
-                  if self.__is_nullable
-                  else DefaultDataFrame(cols))
-
-        if self.has_column_names():
-            result.set_column_names(self.get_column_names())
-
-        indices = [-1] * rank
-        column = self.__columns[col]
-        for i in range(rank):
-            first = True
-            min_value = None
-            for j in range(self.__next):
-                value = column.get_value(j)
-                if value is not None and (first or value < min_value):
-                    taken = False
-                    for k in range(rank):
-                        if indices[k] == j:
-                            taken = True
-                            break
-
-                    if not taken:
-                        first = False
-                        min_value = value
-                        indices[i] = j
-
-        removed_offset = 0
-        for i in range(rank):
-            if indices[i] != -1:
-                result.set_row(i, self.get_row(indices[i]))
-            else:
-                result.remove_row(i - removed_offset)
-                removed_offset += 1
-
-        result.flush()
-        return result
+        return self._rows_of(self._ranked_indices(col, rank, False))
 
     def _maximum_ranked(self, col, rank):
         """Computes the n-maximum entries in the specified Column and returns
@@ -4279,12 +4582,65 @@ class DataFrame(ABC):
         if rank <= 0:
             raise DataFrameException("Invalid argument 'rank': {}".format(rank))
 
-        if rank > self.__next:
-            rank = self.__next
+        return self._rows_of(self._ranked_indices(col, rank, True))
+
+    def _ranked_indices(self, col, rank, descending):
+        """Computes the row indices of the n-minimum or n-maximum entries
+        in the specified Column.
+
+        None values are excluded from the computation. A NaN value is
+        neither smaller nor larger than any other value, so it is selected
+        as soon as it is the first remaining entry in row order.
+        Rows with equal values are ordered by their row index.
+
+        Args:
+            col: The index of the Column to rank the entries of
+            rank: The maximum number of indices to return
+            descending: A bool indicating whether to compute the
+                n-maximum instead of the n-minimum entries
 
+        Returns:
+            The row indices of the ranked entries, as a numpy array
+        """
+        column = self.__columns[col]
+        fp = dataframeutils.is_numeric_fp(column)
+        values = column._values[:self.__next]
+        if self.__is_nullable:
+            indices = np.flatnonzero(values != None)
+            values = values[indices].astype(np.float64 if fp else np.int64)
+        else:
+            indices = np.arange(values.shape[0])
+
+        k = min(rank, values.shape[0])
+        if fp:
+            nan = np.isnan(values)
+            if nan.any():
+                valid = np.flatnonzero(~nan)
+                ranked = valid[_ranked_positions(
+                    values[valid], min(k, valid.shape[0]), descending)]
+
+                nans = np.flatnonzero(nan)
+                return indices[_with_nan_positions(ranked, nans, k, values.shape[0])]
+
+        return indices[_ranked_positions(values, k, descending)]
+
+    def _rows_of(self, indices):
+        """Creates a new DataFrame holding the rows at the specified indices.
+
+        Args:
+            indices: The indices of the rows to copy, as a numpy array
+
+        Returns:
+            A DataFrame of the same type as this DataFrame containing
+            the specified rows in the specified order
+        """
+        type_codes = self._type_codes()
         cols = [None] * len(self.__columns)
         for i, c in enumerate(self.__columns):
-            cols[i] = raven.struct.dataframe.column.Column.of_type(c.type_code(), rank)
+            # take the selected entries as the new array directly instead
+            # of filling a new Column with default values first
+            cols[i] = raven.struct.dataframe.column.Column.of_type(type_codes[i])
+            cols[i]._values = c._values.take(indices)
 
         result = (NullableDataFrame(cols)
                   if self.__is_nullable
@@ -4293,34 +4649,6 @@ class DataFrame(ABC):
         if self.has_column_names():
             result.set_column_names(self.get_column_names())
 
-        indices = [-1] * rank
-        column = self.__columns[col]
-        for i in range(rank):
-            first = True
-            max_value = None
-            for j in range(self.__next):
-                value = column.get_value(j)
-                if value is not None and (first or value > max_value):
-                    taken = False
-                    for k in range(rank):
-                        if indices[k] == j:
-                            taken = True
-                            break
-
-                    if not taken:
-                        first = False
-                        max_value = value
-                        indices[i] = j
-
-        removed_offset = 0
-        for i in range(rank):
-            if indices[i] != -1:
-                result.set_row(i, self.get_row(indices[i]))
-            else:
-                result.remove_row(i - removed_offset)
-                removed_offset += 1
-
-        result.flush()
         return result
 
     def _replace_by_datafarame(self, df):
@@ -4361,15 +4689,19 @@ class DataFrame(ABC):
                 ("Cannot replace columns. DataFrames must be both "
                  "either labeled or unlabeled"))
 
-        self.flush()
-        df.flush()
+        if not self._is_flushed():
+            self._flush_all(0)
+
+        if not df._is_flushed():
+            df._flush_all(0)
         replaced = 0
         if self.has_column_names():
-            for i in range(df.columns()):
-                col = df.get_column(i)
-                name = col.get_name()
-                if name and self.has_column(name):
-                    self.set_column(name, col.as_nullable()
+            names = self.__names
+            for col in df._internal_columns():
+                name = col._name
+                index = names.get(name) if name else None
+                if index is not None:
+                    self.set_column(index, col.as_nullable()
                                     if self.__is_nullable
                                     else col)
 
@@ -4406,36 +4738,26 @@ class DataFrame(ABC):
         if regex == "NaN":
             regex = "nan"
 
-        column = self.__columns[col]
-        pattern = regex_matcher.compile(regex)
-        i = 0
-        k = -1
-        removed = 0
-        while i < self.__next:
-            if pattern.fullmatch(str(column[i])):
-                if k == -1:
-                    k = i
-                i += 1
-            else:
-                if k != -1:
-                    self.remove_rows(from_index=k, to_index=i)
-                    rem_range = (i - k)
-                    removed += rem_range
-                    i -= rem_range
-                    k = -1
-                else:
-                    i += 1
+        pattern = dataframeutils.compile_pattern(regex)
+        keep = ~self._match_rows(col, pattern)[1]
+        removed = self.__next - int(np.count_nonzero(keep))
+        if removed == 0:
+            return 0
 
-        if k != -1:
-            self.remove_rows(from_index=k, to_index=i)
-            removed += (i - k)
+        for column in self.__columns:
+            column._retain(keep, self.__next)
 
+        self.__next -= removed
+        self.__pending_shrink = True
         return removed
 
     def _remove_rows_by_range(self, from_index, to_index):
         """Removes all rows from (inclusive) the specified index
         to (exclusive) the specified index.
 
+        The Columns are not shrunk by this method. Callers must
+        call _maybe_shrink() when they are done removing rows.
+
         Args:
             from_index: The index from which all rows should be removed (inclusive).
                 Must be an int
@@ -4449,11 +4771,23 @@ class DataFrame(ABC):
             column._remove(from_index, to_index, self.__next)
 
         self.__next -= (to_index - from_index)
-        if (self.__next * 3) < self.__columns[0].capacity():
-            self._flush_all(4)
-
+        self.__pending_shrink = True
         return self
 
+    def _maybe_shrink(self):
+        """Shrinks all Columns if rows were removed since the last call
+        and the Column capacity has become excessively large.
+
+        Row removal methods only mark the DataFrame as shrinkable. Public
+        operations call this method once when they are done, so that
+        repeated removals within one operation do not shrink and regrow
+        the Columns repeatedly.
+        """
+        if self.__pending_shrink:
+            self.__pending_shrink = False
+            if (self.__next * 3) < self.__columns[0].capacity():
+                self._flush_all(4)
+
     def _ensure_valid_column_set_operation(self, df):
         """Ensures that conditions are met for set-theoretic operations with Columns
 
@@ -4477,11 +4811,11 @@ class DataFrame(ABC):
         if not self.has_column_names() or not df.has_column_names():
             raise DataFrameException("Both DataFrame instances must have labeled columns")
 
-        if self.capacity() != self.rows():
-            self.flush()
+        if not self._is_flushed():
+            self._flush_all(0)
 
-        if df.capacity() != df.rows():
-            df.flush()
+        if not df._is_flushed():
+            df._flush_all(0)
 
     def _ensure_valid_row_set_operation(self, df):
         """Ensures that conditions are met for set-theoretic operations with rows
@@ -4509,156 +4843,149 @@ class DataFrame(ABC):
                 ("Both DataFrame instances must have either labeled "
                  "columns or unlabeled columns"))
 
-    def _internal_next(self):
-        """Internal method providing access to the next counter.
+    def _non_null_values(self, col):
+        """Internal method providing all non-null values of the Column
+        at the specified index.
+
+        If the Column does not contain any None values within the
+        range of used rows, then a view of the underlying array is
+        returned directly instead of a compacted copy.
+
+        Args:
+            col: The index of the Column. Must be an int
 
         Returns:
-            The value of the internally used next index pointer, as an int
+            All values in the Column which are not None, as a numpy array
         """
-        return self.__next
+        values = self.__columns[col]._values[:self.__next]
+        mask = values != None
+        if mask.all():
+            return values
 
-    def _internal_columns(self):
-        """Internal method providing access to the list of columns.
+        return values[mask]
 
-        Changes to the content of the returned list are
-        reflected by this DataFrame and vice versa.
+    def _is_flushed(self):
+        """Indicates whether the capacity of all Columns matches the
+        number of rows in this DataFrame.
 
         Returns:
-            A reference to the internally used list of Column objects, as a list
+            True if a flush operation would not change any Column,
+            False otherwise
         """
-        return self.__columns
+        return self.__next == -1 or self.__next == self.__columns[0].capacity()
 
-    def _presort_nulls(self, unsorted, next_pos):
-        ptr = next_pos - 1
-        i = 0
-        while i < ptr:
-            while unsorted[i] is None:
-                if i == ptr:
-                    break
+    def _type_codes(self):
+        """Internal method providing the type codes of all Columns.
 
-                self._swap(i, ptr)
-                ptr -= 1
+        The list is computed on first access and cached until the
+        Columns of this DataFrame are changed.
 
-            i += 1
+        Returns:
+            The type code of each Column, as a list of int
+        """
+        if self.__type_codes is None:
+            self.__type_codes = ([col.type_code() for col in self.__columns]
+                                 if self.__columns is not None
+                                 else [])
 
-        return ptr - 1 if unsorted[ptr] is None else ptr
+        return self.__type_codes
 
-    def _presort_floats(self, unsorted, right):
-        if right <= -1:
-            return right
+    def _values_view(self, col, n):
+        """Internal method providing a view of the first n values of
+        the Column at the specified index.
 
-        ptr = right
-        i = 0
-        while i < ptr:
-            while np.isnan(unsorted[i]):
-                if i == ptr:
-                    break
+        Changes to the content of the returned array are reflected
+        by the underlying Column and vice versa.
 
-                self._swap(i, ptr)
-                ptr -= 1
+        Args:
+            col: The index of the Column. Must be an int
+            n: The number of values to include in the view. Must be an int
 
-            i += 1
+        Returns:
+            A view of the internally used array of the Column, as a numpy array
+        """
+        return self.__columns[col]._values[:n]
 
-        return ptr - 1 if np.isnan(unsorted[ptr]) else ptr
+    def _internal_next(self):
+        """Internal method providing access to the next counter.
 
-    def _sort_quicksort(self, col, ascend):
-        col = self.__columns[col]
-        left = 0
-        right = self.__next - 1
-        if self.is_nullable(): # NullableDataFrame
-            right = self._presort_nulls(col.as_array(), self.__next)
-            if col.type_code() == binarycolumn.NullableBinaryColumn.TYPE_CODE:
-                self._sort_quicksort_binary_impl(col.as_array(), left, right, ascend)
-            else:
-                self._sort_quicksort_impl0(col, left, right, ascend)
-        else: # DefaultDataFrame
-            if col.type_code() == binarycolumn.BinaryColumn.TYPE_CODE:
-                self._sort_quicksort_binary_impl(col.as_array(), left, right, ascend)
-            else:
-                self._sort_quicksort_impl0(col, left, right, ascend)
+        Returns:
+            The value of the internally used next index pointer, as an int
+        """
+        return self.__next
 
-    def _sort_quicksort_impl0(self, col, left, right, ascend):
-        if self.is_nullable(): # NullableDataFrame
-            if col.type_code() in (floatcolumn.NullableFloatColumn.TYPE_CODE,
-                                   doublecolumn.NullableDoubleColumn.TYPE_CODE):
+    def _internal_columns(self):
+        """Internal method providing access to the list of columns.
 
-                right = self._presort_floats(col.as_array(), right)
-        else: # DefaultDataFrame
-            if col.type_code() in (floatcolumn.FloatColumn.TYPE_CODE,
-                                   doublecolumn.DoubleColumn.TYPE_CODE):
+        Changes to the content of the returned list are
+        reflected by this DataFrame and vice versa.
 
-                right = self._presort_floats(col.as_array(), right)
+        Returns:
+            A reference to the internally used list of Column objects, as a list
+        """
+        return self.__columns
 
-        self._sort_quicksort_impl1(col.as_array(), left, right, ascend)
+    def _partition_nans(self, col, n):
+        """Moves all None and NaN values in the specified Column to the end.
 
-    def _sort_quicksort_impl1(self, unsorted, left, right, ascend):
-        if right <= -1:
-            return
+        All rows are reordered such that rows with a valid value in the
+        specified Column come first, followed by rows with a NaN value and
+        finally rows with a None value. The relative order of rows within
+        each group is preserved.
 
-        lr_range = left + right
-        mid = unsorted[int(lr_range/2)]
-        l = left
-        r = right
-        while l < r:
-            if ascend:
-                while unsorted[l] < mid:
-                    l += 1
-                while unsorted[r] > mid:
-                    r -= 1
-            else:
-                while unsorted[l] > mid:
-                    l += 1
-                while unsorted[r] < mid:
-                    r -= 1
+        Args:
+            col: The index of the Column to partition by
+            n: The number of rows to partition
 
-            if l <= r:
-                self._swap(l, r)
-                l += 1
-                r -= 1
+        Returns:
+            The index of the last row with a valid value, as an int
+        """
+        column = self.__columns[col]
+        values = column._values[:n]
+        notnull = (values != None
+                   if self.__is_nullable
+                   else np.ones(n, dtype=bool))
 
-        if left < r:
-            self._sort_quicksort_impl1(unsorted, left, r, ascend)
+        valid = notnull
+        if dataframeutils.is_numeric_fp(column):
+            valid = notnull.copy()
+            valid[notnull] = ~np.isnan(values[notnull].astype(np.float64))
 
-        if right > l:
-            self._sort_quicksort_impl1(unsorted, l, right, ascend)
+        right = int(np.count_nonzero(valid)) - 1
+        if right < n - 1:
+            self._permute(np.concatenate((np.flatnonzero(valid),
+                                          np.flatnonzero(notnull & ~valid),
+                                          np.flatnonzero(~notnull))), 0)
 
-    def _sort_quicksort_binary_impl(self, unsorted, left, right, ascend):
-        if right <= -1:
-            return
+        return right
 
-        lr_range = left + right
-        mid = unsorted[int(lr_range/2)]
-        l = left
-        r = right
-        while l < r:
-            if ascend:
-                while len(unsorted[l]) < len(mid):
-                    l += 1
-                while len(unsorted[r]) > len(mid):
-                    r -= 1
-            else:
-                while len(unsorted[l]) > len(mid):
-                    l += 1
-                while len(unsorted[r]) < len(mid):
-                    r -= 1
+    def _sort_quicksort(self, col, ascend):
+        right = self._partition_nans(col, self.__next)
+        if right <= 0:
+            return
 
-            if l <= r:
-                self._swap(l, r)
-                l += 1
-                r -= 1
+        column = self.__columns[col]
+        keys = dataframeutils.sort_keys(column, column._values[:right+1])
+        if ascend:
+            perm = np.argsort(keys, kind="stable")
+        else:
+            # sort the reversed keys so that equal values keep their order
+            perm = right - np.argsort(keys[::-1], kind="stable")[::-1]
 
-        if left < r:
-            self._sort_quicksort_binary_impl(unsorted, left, r, ascend)
+        self._permute(perm, 0)
 
-        if right > l:
-            self._sort_quicksort_binary_impl(unsorted, l, right, ascend)
+    def _permute(self, perm, offset):
+        """Reorders the rows of all Columns according to the
+        specified permutation.
 
-    def _swap(self, i, j):
+        Args:
+            perm: The row indices in their new order, as a numpy array
+            offset: The index of the first row to be reordered
+        """
+        end = offset + perm.shape[0]
         for col in self.__columns:
-            array = col.as_array()
-            cache = array[i]
-            array[i] = array[j]
-            array[j] = cache
+            array = col._values
+            array[offset:end] = array[perm]
 
     @staticmethod
     def Default(*columns):
@@ -4703,365 +5030,29 @@ class DataFrame(ABC):
         """
         return NullableDataFrame(*columns)
 
-    @staticmethod
-    def ByteColumn(name=None, values=None):
-        """Constructs a new ByteColumn.
-
-        The constructed Column will have the specified name or is unlabeled
-        if the specified name is None or empty.
-        The constructed Column has the content of the specified list
-        or numpy array. If the argument specifying the Column values is
-        an int, then the constructed Column is initialized with the given
-        length and all Column entries are set to default values.
-
-        Args:
-            name: The name of the ByteColumn as a string
-            values: The content of the ByteColumn.
-                Must be a list or numpy array with dtype int8, or an int
-        """
-        return bytecolumn.ByteColumn(name, values)
-
-    @staticmethod
-    def ShortColumn(name=None, values=None):
-        """Constructs a new ShortColumn.
-
-        The constructed Column will have the specified name or is unlabeled
-        if the specified name is None or empty.
-        The constructed Column has the content of the specified list
-        or numpy array. If the argument specifying the Column values is
-        an int, then the constructed Column is initialized with the given
-        length and all Column entries are set to default values.
-
-        Args:
-            name: The name of the ShortColumn as a string
-            values: The content of the ShortColumn.
-                Must be a list or numpy array with dtype int16, or an int
-        """
-        return shortcolumn.ShortColumn(name, values)
-
-    @staticmethod
-    def IntColumn(name=None, values=None):
-        """Constructs a new IntColumn.
-
-        The constructed Column will have the specified name or is unlabeled
-        if the specified name is None or empty.
-        The constructed Column has the content of the specified list
-        or numpy array. If the argument specifying the Column values is
-        an int, then the constructed Column is initialized with the given
-        length and all Column entries are set to default values.
-
-        Args:
-            name: The name of the IntColumn as a string
-            values: The content of the IntColumn.
-                Must be a list or numpy array with dtype int32, or an int
-        """
-        return intcolumn.IntColumn(name, values)
-
-    @staticmethod
-    def LongColumn(name=None, values=None):
-        """Constructs a new LongColumn.
-
-        The constructed Column will have the specified name or is unlabeled
-        if the specified name is None or empty.
-        The constructed Column has the content of the specified list
-        or numpy array. If the argument specifying the Column values is
-        an int, then the constructed Column is initialized with the given
-        length and all Column entries are set to default values.
-
-        Args:
-            name: The name of the LongColumn as a string
-            values: The content of the LongColumn.
-                Must be a list or numpy array with dtype int64, or an int
-        """
-        return longcolumn.LongColumn(name, values)
-
-    @staticmethod
-    def StringColumn(name=None, values=None):
-        """Constructs a new StringColumn.
-
-        The constructed Column will have the specified name or is unlabeled
-        if the specified name is None or empty.
-        The constructed Column has the content of the specified list
-        or numpy array. If the argument specifying the Column values is
-        an int, then the constructed Column is initialized with the given
-        length and all Column entries are set to default values.
-
-        Args:
-            name: The name of the StringColumn as a string
-            values: The content of the StringColumn.
-                Must be a list or numpy array with dtype object, or an int
-        """
-        return stringcolumn.StringColumn(name, values)
-
-    @staticmethod
-    def FloatColumn(name=None, values=None):
-        """Constructs a new FloatColumn.
-
-        The constructed Column will have the specified name or is unlabeled
-        if the specified name is None or empty.
-        The constructed Column has the content of the specified list
-        or numpy array. If the argument specifying the Column values is
-        an int, then the constructed Column is initialized with the given
-        length and all Column entries are set to default values.
-
-        Args:
-            name: The name of the FloatColumn as a string
-            values: The content of the FloatColumn.
-                Must be a list or numpy array with dtype float32, or an int
-        """
-        return floatcolumn.FloatColumn(name, values)
-
-    @staticmethod
-    def DoubleColumn(name=None, values=None):
-        """Constructs a new DoubleColumn.
-
-        The constructed Column will have the specified name or is unlabeled
-        if the specified name is None or empty.
-        The constructed Column has the content of the specified list
-        or numpy array. If the argument specifying the Column values is
-        an int, then the constructed Column is initialized with the given
-        length and all Column entries are set to default values.
-
-        Args:
-            name: The name of the DoubleColumn as a string
-            values: The content of the DoubleColumn.
-                Must be a list or numpy array with dtype float64, or an int
-        """
-        return doublecolumn.DoubleColumn(name, values)
-
-    @staticmethod
-    def CharColumn(name=None, values=None):
-        """Constructs a new CharColumn.
-
-        The constructed Column will have the specified name or is unlabeled
-        if the specified name is None or empty.
-        The constructed Column has the content of the specified list
-        or numpy array. If the argument specifying the Column values is
-        an int, then the constructed Column is initialized with the given
-        length and all Column entries are set to default values.
-
-        Args:
-            name: The name of the CharColumn as a string
-            values: The content of the CharColumn.
-                Must be a list or numpy array with dtype uint8, or an int
-        """
-        return charcolumn.CharColumn(name, values)
-
-    @staticmethod
-    def BooleanColumn(name=None, values=None):
-        """Constructs a new BooleanColumn.
-
-        The constructed Column will have the specified name or is unlabeled
-        if the specified name is None or empty.
-        The constructed Column has the content of the specified list
-        or numpy array. If the argument specifying the Column values is
-        an int, then the constructed Column is initialized with the given
-        length and all Column entries are set to default values.
-
-        Args:
-            name: The name of the BooleanColumn as a string
-            values: The content of the BooleanColumn.
-                Must be a list or numpy array with dtype bool, or an int
-        """
-        return booleancolumn.BooleanColumn(name, values)
-
-    @staticmethod
-    def BinaryColumn(name=None, values=None):
-        """Constructs a new BinaryColumn.
-
-        The constructed Column will have the specified name or is unlabeled
-        if the specified name is None or empty.
-        The constructed Column has the content of the specified list
-        or numpy array. If the argument specifying the Column values is
-        an int, then the constructed Column is initialized with the given
-        length and all Column entries are set to default values.
-
-        Args:
-            name: The name of the BinaryColumn as a string
-            values: The content of the BinaryColumn.
-                Must be a list or numpy array with dtype object, or an int
-        """
-        return binarycolumn.BinaryColumn(name, values)
-
-    @staticmethod
-    def NullableByteColumn(name=None, values=None):
-        """Constructs a new NullableByteColumn.
-
-        The constructed Column will have the specified name or is unlabeled
-        if the specified name is None or empty.
-        The constructed Column has the content of the specified list
-        or numpy array. If the argument specifying the Column values is
-        an int, then the constructed Column is initialized with the given
-        length and all Column entries are set to default values.
-
-        Args:
-            name: The name of the NullableByteColumn as a string
-            values: The content of the NullableByteColumn.
-                Must be a list or numpy array with dtype object, or an int
-        """
-        return bytecolumn.NullableByteColumn(name, values)
-
-    @staticmethod
-    def NullableShortColumn(name=None, values=None):
-        """Constructs a new NullableShortColumn.
-
-        The constructed Column will have the specified name or is unlabeled
-        if the specified name is None or empty.
-        The constructed Column has the content of the specified list
-        or numpy array. If the argument specifying the Column values is
-        an int, then the constructed Column is initialized with the given
-        length and all Column entries are set to default values.
-
-        Args:
-            name: The name of the NullableShortColumn as a string
-            values: The content of the NullableShortColumn.
-                Must be a list or numpy array with dtype object, or an int
-        """
-        return shortcolumn.NullableShortColumn(name, values)
-
-    @staticmethod
-    def NullableIntColumn(name=None, values=None):
-        """Constructs a new NullableIntColumn.
-
-        The constructed Column will have the specified name or is unlabeled
-        if the specified name is None or empty.
-        The constructed Column has the content of the specified list
-        or numpy array. If the argument specifying the Column values is
-        an int, then the constructed Column is initialized with the given
-        length and all Column entries are set to default values.
-
-        Args:
-            name: The name of the NullableIntColumn as a string
-            values: The content of the NullableIntColumn.
-                Must be a list or numpy array with dtype object, or an int
-        """
-        return intcolumn.NullableIntColumn(name, values)
-
-    @staticmethod
-    def NullableLongColumn(name=None, values=None):
-        """Constructs a new NullableLongColumn.
-
-        The constructed Column will have the specified name or is unlabeled
-        if the specified name is None or empty.
-        The constructed Column has the content of the specified list
-        or numpy array. If the argument specifying the Column values is
-        an int, then the constructed Column is initialized with the given
-        length and all Column entries are set to default values.
-
-        Args:
-            name: The name of the NullableLongColumn as a string
-            values: The content of the NullableLongColumn.
-                Must be a list or numpy array with dtype object, or an int
-        """
-        return longcolumn.NullableLongColumn(name, values)
-
-    @staticmethod
-    def NullableStringColumn(name=None, values=None):
-        """Constructs a new NullableStringColumn.
-
-        The constructed Column will have the specified name or is unlabeled
-        if the specified name is None or empty.
-        The constructed Column has the content of the specified list
-        or numpy array. If the argument specifying the Column values is
-        an int, then the constructed Column is initialized with the given
-        length and all Column entries are set to default values.
-
-        Args:
-            name: The name of the NullableStringColumn as a string
-            values: The content of the NullableStringColumn.
-                Must be a list or numpy array with dtype object, or an int
-        """
-        return stringcolumn.NullableStringColumn(name, values)
-
-    @staticmethod
-    def NullableFloatColumn(name=None, values=None):
-        """Constructs a new NullableFloatColumn.
-
-        The constructed Column will have the specified name or is unlabeled
-        if the specified name is None or empty.
-        The constructed Column has the content of the specified list
-        or numpy array. If the argument specifying the Column values is
-        an int, then the constructed Column is initialized with the given
-        length and all Column entries are set to default values.
-
-        Args:
-            name: The name of the NullableFloatColumn as a string
-            values: The content of the NullableFloatColumn.
-                Must be a list or numpy array with dtype object, or an int
-        """
-        return floatcolumn.NullableFloatColumn(name, values)
-
-    @staticmethod
-    def NullableDoubleColumn(name=None, values=None):
-        """Constructs a new NullableDoubleColumn.
-
-        The constructed Column will have the specified name or is unlabeled
-        if the specified name is None or empty.
-        The constructed Column has the content of the specified list
-        or numpy array. If the argument specifying the Column values is
-        an int, then the constructed Column is initialized with the given
-        length and all Column entries are set to default values.
-
-        Args:
-            name: The name of the NullableDoubleColumn as a string
-            values: The content of the NullableDoubleColumn.
-                Must be a list or numpy array with dtype object, or an int
-        """
-        return doublecolumn.NullableDoubleColumn(name, values)
-
-    @staticmethod
-    def NullableCharColumn(name=None, values=None):
-        """Constructs a new NullableCharColumn.
-
-        The constructed Column will have the specified name or is unlabeled
-        if the specified name is None or empty.
-        The constructed Column has the content of the specified list
-        or numpy array. If the argument specifying the Column values is
-        an int, then the constructed Column is initialized with the given
-        length and all Column entries are set to default values.
-
-        Args:
-            name: The name of the NullableCharColumn as a string
-            values: The content of the NullableCharColumn.
-                Must be a list or numpy array with dtype object, or an int
-        """
-        return charcolumn.NullableCharColumn(name, values)
-
-    @staticmethod
-    def NullableBooleanColumn(name=None, values=None):
-        """Constructs a new NullableBooleanColumn.
-
-        The constructed Column will have the specified name or is unlabeled
-        if the specified name is None or empty.
-        The constructed Column has the content of the specified list
-        or numpy array. If the argument specifying the Column values is
-        an int, then the constructed Column is initialized with the given
-        length and all Column entries are set to default values.
-
-        Args:
-            name: The name of the NullableBooleanColumn as a string
-            values: The content of the NullableBooleanColumn.
-                Must be a list or numpy array with dtype object, or an int
-        """
-        return booleancolumn.NullableBooleanColumn(name, values)
-
-    @staticmethod
-    def NullableBinaryColumn(name=None, values=None):
-        """Constructs a new NullableBinaryColumn.
-
-        The constructed Column will have the specified name or is unlabeled
-        if the specified name is None or empty.
-        The constructed Column has the content of the specified list
-        or numpy array. If the argument specifying the Column values is
-        an int, then the constructed Column is initialized with the given
-        length and all Column entries are set to default values.
-
-        Args:
-            name: The name of the NullableBinaryColumn as a string
-            values: The content of the NullableBinaryColumn.
-                Must be a list or numpy array with dtype object, or an int
-        """
-        return binarycolumn.NullableBinaryColumn(name, values)
+    # The Column factories are the Column classes themselves, so that
+    # constructing a Column through the DataFrame class does not add
+    # another call. Their documentation is that of the constructors.
+    ByteColumn = _ByteColumn
+    ShortColumn = _ShortColumn
+    IntColumn = _IntColumn
+    LongColumn = _LongColumn
+    StringColumn = _StringColumn
+    FloatColumn = _FloatColumn
+    DoubleColumn = _DoubleColumn
+    CharColumn = _CharColumn
+    BooleanColumn = _BooleanColumn
+    BinaryColumn = _BinaryColumn
+    NullableByteColumn = _NullableByteColumn
+    NullableShortColumn = _NullableShortColumn
+    NullableIntColumn = _NullableIntColumn
+    NullableLongColumn = _NullableLongColumn
+    NullableStringColumn = _NullableStringColumn
+    NullableFloatColumn = _NullableFloatColumn
+    NullableDoubleColumn = _NullableDoubleColumn
+    NullableCharColumn = _NullableCharColumn
+    NullableBooleanColumn = _NullableBooleanColumn
+    NullableBinaryColumn = _NullableBinaryColumn
 
     @staticmethod
     def copy(df):
@@ -5109,11 +5100,11 @@ class DataFrame(ABC):
         DataFrame arguments are converted to their corresponding
         nullable equivalent.
 
-        If Columns should be independent from their origin, then simply pass
-        a clone (copy) of each DataFrame argument to this method.
+        If Columns should be independent from their origin, then use
+        the merge_copy() method instead.
 
         Example:
-            merged = DataFrame.merge(DataFrame.copy(df1), DataFrame.copy(df2))
+            merged = DataFrame.merge(df1, df2)
 
         Args:
             dataframes: The DataFrames to be merged
@@ -5123,6 +5114,29 @@ class DataFrame(ABC):
         """
         return dataframeutils.merge(*dataframes)
 
+    @staticmethod
+    def merge_copy(*dataframes):
+        """Merges copies of all given DataFrame instances into one DataFrame.
+
+        This method behaves like merge() except that all Columns of the
+        returned DataFrame are independent from their origin, which means that
+        changes to the original DataFrame are not reflected in the merged
+        DataFrame and vice versa. Each Column is copied exactly once, so
+        this method should be preferred over merging copies of DataFrames.
+        Only passing one DataFrame to this method will return a copy
+        of that instance.
+
+        Example:
+            merged = DataFrame.merge_copy(df1, df2)
+
+        Args:
+            dataframes: The DataFrames to be merged
+
+        Returns:
+            A DataFrame composed of copies of all Columns of the given DataFrames
+        """
+        return dataframeutils.merge_copy(*dataframes)
+
     @staticmethod
     def convert_to(df, target_type):
         """Converts the given DataFrame from a DefaultDataFrame to a NullableDataFrame
@@ -5365,6 +5379,40 @@ class DataFrame(ABC):
         """
         return raven.io.dataframe.csvfiles.write(filepath, df, separator, header, encoding)
 
+    @staticmethod
+    def read_parquet(filepath, columns=None):
+        """Reads the Parquet file denoted by the specified file path and returns
+        a DataFrame representing its content.
+
+        The element type of each Column is derived from the type of the
+        corresponding Parquet column. If any column in the specified file
+        contains null values, then the returned DataFrame is a NullableDataFrame.
+
+        This method requires the optional 'pyarrow' package.
+
+        For example:
+
+          >>> from raven.struct.dataframe import DataFrame
+          >>> df = DataFrame.read_parquet("myfile.parquet", columns=["col1", "col2"])
+
+        Args:
+            filepath: The Parquet file to read. Must be a str representing
+                the path to the file to read
+            columns: The names of the columns to read, as a list of str.
+                May be None to read all columns
+
+        Returns:
+            A DataFrame representing the content of the specified Parquet file
+
+        Raises:
+            ImportError: If the 'pyarrow' package is not installed
+            ValueError: If an argument is invalid
+            PermissionError: If the permission for reading the specified
+                file was denied
+            IOError: If any errors occur during reading
+        """
+        return raven.io.dataframe.parquetfiles.read(filepath, columns)
+
 
 class DefaultDataFrame(DataFrame):
     """A default DataFrame implementation.
@@ -5374,6 +5422,8 @@ class DefaultDataFrame(DataFrame):
     This implementation is NOT thread-safe.
     """
 
+    __slots__ = ()
+
     def __init__(self, *columns):
         """Constructs a new DefaultDataFrame with the specified columns.
 
@@ -5404,6 +5454,8 @@ class NullableDataFrame(DataFrame):
     This implementation is NOT thread-safe.
     """
 
+    __slots__ = ()
+
     def __init__(self, *columns):
         """Constructs a new NullableDataFrame with the specified columns.
 
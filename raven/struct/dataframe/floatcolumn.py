@@ -16,7 +16,7 @@
 Provides an implementation for FloatColumn and NullableFloatColumn
 """
 
-from struct import pack
+from struct import Struct
 
 import numpy as np
 
@@ -24,6 +24,13 @@ import raven.struct.dataframe.core as dataframe
 import raven.struct.dataframe.column as column
 import raven.struct.dataframe._columnutils as utils
 
+# The precompiled big-endian format of float values
+_FLOAT = Struct(">f")
+
+# The types of values which are valid without any further checks
+_FLOAT_TYPES = frozenset((float, np.float32))
+_NULLABLE_FLOAT_TYPES = frozenset((float, np.float32, type(None)))
+
 class FloatColumn(column.Column):
     """A Column holding float values (float32).
     This implementation DOES NOT support null values.
@@ -31,6 +38,8 @@ class FloatColumn(column.Column):
 
     TYPE_CODE = 6
 
+    __slots__ = ()
+
     def __init__(self, name=None, values=None):
         """Constructs a new FloatColumn.
 
@@ -50,10 +59,13 @@ class FloatColumn(column.Column):
             values = np.empty(0, dtype=np.float32)
 
         if isinstance(values, list):
-            for value in values:
-                self._check_type(value)
+            # only check each value individually if
+            # not all of them are plain float objects
+            if not set(map(type, values)) <= _FLOAT_TYPES:
+                for value in values:
+                    self._check_type(value)
 
-            values = np.array(values, dtype=np.float32)
+            values = np.fromiter(values, dtype=np.float32, count=len(values))
 
         elif isinstance(values, np.ndarray):
             if values.dtype != "float32":
@@ -76,7 +88,7 @@ class FloatColumn(column.Column):
                 ("Invalid argument. "
                  "FloatColumn cannot use None values"))
 
-        if not isinstance(value, float) and not isinstance(value, np.float32):
+        if not isinstance(value, (float, np.float32)):
             raise dataframe.DataFrameException(
                 ("Invalid argument. Expected "
                  "float (float32) but found {}".format(type(value))))
@@ -111,91 +123,79 @@ class FloatColumn(column.Column):
     def get_default_value(self):
         return 0.0
 
-    # pylint: disable=too-many-branches
-    # pylint: disable=too-many-statements
-    # pylint: disable=invalid-name
-    def convert_to(self, typecode):
-        converted = None
-        if typecode == utils.type_code_byte_column():
-            converted = dataframe.DataFrame.ByteColumn(values=self._values.astype(np.int8))
-        elif typecode == utils.type_code_short_column():
-            converted = dataframe.DataFrame.ShortColumn(values=self._values.astype(np.int16))
-        elif typecode == utils.type_code_int_column():
-            converted = dataframe.DataFrame.IntColumn(values=self._values.astype(np.int32))
-        elif typecode == utils.type_code_long_column():
-            converted = dataframe.DataFrame.LongColumn(values=self._values.astype(np.int64))
-        elif typecode == utils.type_code_string_column():
-            vals = self._values.astype(object)
-            for i, x in np.ndenumerate(vals):
-                vals[i] = str(x)
-
-            converted = dataframe.DataFrame.StringColumn(values=vals)
-        elif typecode == FloatColumn.TYPE_CODE:
-            converted = self.clone()
-        elif typecode == utils.type_code_double_column():
-            converted = dataframe.DataFrame.DoubleColumn(values=self._values.astype(np.float64))
-        elif typecode == utils.type_code_char_column():
-            vals = self._values.astype(np.uint8)
-            for i, x in np.ndenumerate(vals):
-                vals[i] = ord(str(x)[0])
-
-            converted = dataframe.DataFrame.CharColumn(values=vals)
-        elif typecode == utils.type_code_boolean_column():
-            converted = dataframe.DataFrame.BooleanColumn(values=self._values.astype(bool))
-        elif typecode == utils.type_code_binary_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = bytearray(pack(">f", x))
-
-            converted = dataframe.DataFrame.BinaryColumn(values=vals)
-        elif typecode == utils.type_code_nullable_byte_column():
-            vals = self._values.astype(np.int8)
-            converted = dataframe.DataFrame.NullableByteColumn(values=vals.astype(object))
-        elif typecode == utils.type_code_nullable_short_column():
-            vals = self._values.astype(np.int16)
-            converted = dataframe.DataFrame.NullableShortColumn(values=vals.astype(object))
-        elif typecode == utils.type_code_nullable_int_column():
-            vals = self._values.astype(np.int32)
-            converted = dataframe.DataFrame.NullableIntColumn(values=vals.astype(object))
-        elif typecode == utils.type_code_nullable_long_column():
-            vals = self._values.astype(np.int64)
-            converted = dataframe.DataFrame.NullableLongColumn(values=vals.astype(object))
-        elif typecode == utils.type_code_nullable_string_column():
-            vals = self._values.astype(object)
-            for i, x in np.ndenumerate(vals):
-                vals[i] = str(x)
-
-            converted = dataframe.DataFrame.NullableStringColumn(values=vals)
-        elif typecode == NullableFloatColumn.TYPE_CODE:
-            vals = self._values.astype(object)
-            converted = NullableFloatColumn(values=vals)
-        elif typecode == utils.type_code_nullable_double_column():
-            vals = self._values.astype(np.float64)
-            vals = vals.astype(object)
-            converted = dataframe.DataFrame.NullableDoubleColumn(values=vals)
-        elif typecode == utils.type_code_nullable_char_column():
-            vals = self._values.astype(object)
-            for i, x in np.ndenumerate(vals):
-                vals[i] = ord(str(x)[0])
-
-            converted = dataframe.DataFrame.NullableCharColumn(values=vals)
-        elif typecode == utils.type_code_nullable_boolean_column():
-            vals = self._values.astype(bool)
-            vals = vals.astype(object)
-            converted = dataframe.DataFrame.NullableBooleanColumn(values=vals)
-        elif typecode == utils.type_code_nullable_binary_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = bytearray(pack(">f", x))
-
-            converted = dataframe.DataFrame.NullableBinaryColumn(values=vals)
-        else:
-            raise dataframe.DataFrameException(
-                "Unknown column type code: {}".format(typecode))
+    def _to_byte(self):
+        return dataframe.DataFrame.ByteColumn(values=self._values.astype(np.int8))
+
+    def _to_short(self):
+        return dataframe.DataFrame.ShortColumn(values=self._values.astype(np.int16))
+
+    def _to_int(self):
+        return dataframe.DataFrame.IntColumn(values=self._values.astype(np.int32))
+
+    def _to_long(self):
+        return dataframe.DataFrame.LongColumn(values=self._values.astype(np.int64))
+
+    def _to_string(self):
+        # tolist() yields the Python floats which define the format
+        vals = np.array([str(x) for x in self._values.tolist()], dtype=object)
+        return dataframe.DataFrame.StringColumn(values=vals)
+
+    def _to_float(self):
+        return self.clone()
+
+    def _to_double(self):
+        return dataframe.DataFrame.DoubleColumn(values=self._values.astype(np.float64))
+
+    def _to_char(self):
+        vals = utils.leading_chars(self._values.astype(np.uint8))
+        return dataframe.DataFrame.CharColumn(values=vals)
+
+    def _to_boolean(self):
+        return dataframe.DataFrame.BooleanColumn(values=self._values.astype(bool))
+
+    def _to_binary(self):
+        vals = utils.to_bytearrays(self._values, ">f4")
+        return dataframe.DataFrame.BinaryColumn(values=vals)
+
+    def _to_nullable_byte(self):
+        vals = self._values.astype(np.int8)
+        return dataframe.DataFrame.NullableByteColumn(values=utils.to_objects(vals))
+
+    def _to_nullable_short(self):
+        vals = self._values.astype(np.int16)
+        return dataframe.DataFrame.NullableShortColumn(values=utils.to_objects(vals))
 
-        # pylint: disable=protected-access
-        converted._name = self._name
-        return converted
+    def _to_nullable_int(self):
+        vals = self._values.astype(np.int32)
+        return dataframe.DataFrame.NullableIntColumn(values=utils.to_objects(vals))
+
+    def _to_nullable_long(self):
+        vals = self._values.astype(np.int64)
+        return dataframe.DataFrame.NullableLongColumn(values=utils.to_objects(vals))
+
+    def _to_nullable_string(self):
+        # tolist() yields the Python floats which define the format
+        vals = np.array([str(x) for x in self._values.tolist()], dtype=object)
+        return dataframe.DataFrame.NullableStringColumn(values=vals)
+
+    def _to_nullable_float(self):
+        return NullableFloatColumn(values=utils.to_objects(self._values))
+
+    def _to_nullable_double(self):
+        vals = utils.to_objects(self._values.astype(np.float64))
+        return dataframe.DataFrame.NullableDoubleColumn(values=vals)
+
+    def _to_nullable_char(self):
+        vals = utils.to_objects(_leading_chars(self._values.astype(np.float64)))
+        return dataframe.DataFrame.NullableCharColumn(values=vals)
+
+    def _to_nullable_boolean(self):
+        vals = utils.to_objects(self._values.astype(bool))
+        return dataframe.DataFrame.NullableBooleanColumn(values=vals)
+
+    def _to_nullable_binary(self):
+        vals = utils.to_bytearrays(self._values, ">f4")
+        return dataframe.DataFrame.NullableBinaryColumn(values=vals)
 
     def _create_array(self, size=0):
         return np.zeros(size, dtype=np.float32)
@@ -207,6 +207,8 @@ class NullableFloatColumn(column.Column):
 
     TYPE_CODE = 15
 
+    __slots__ = ()
+
     def __init__(self, name=None, values=None):
         """Constructs a new NullableFloatColumn.
 
@@ -226,10 +228,12 @@ class NullableFloatColumn(column.Column):
             values = np.empty(0, dtype=object)
 
         if isinstance(values, list):
-            for value in values:
-                self._check_type(value)
+            if not set(map(type, values)) <= _NULLABLE_FLOAT_TYPES:
+                for value in values:
+                    self._check_type(value)
 
-            values = np.array(values, dtype=object)
+            # a single pass over the list as the length is known
+            values = np.fromiter(values, dtype=object, count=len(values))
 
         elif isinstance(values, np.ndarray):
             if values.dtype != "object":
@@ -237,8 +241,9 @@ class NullableFloatColumn(column.Column):
                     ("Invalid argument array. Expected "
                      "float array (object) but found {}".format(values.dtype)))
 
-            for value in values:
-                self._check_type(value)
+            if not set(map(type, values)) <= _NULLABLE_FLOAT_TYPES:
+                for value in values:
+                    self._check_type(value)
 
         elif isinstance(values, int):
             values = np.empty(values, dtype=object)
@@ -251,7 +256,7 @@ class NullableFloatColumn(column.Column):
 
     def _check_type(self, value):
         if value is not None:
-            if not isinstance(value, float) and not isinstance(value, np.float32):
+            if not isinstance(value, (float, np.float32)):
                 raise dataframe.DataFrameException(
                     ("Invalid argument. Expected "
                      "float (float32) but found {}".format(type(value))))
@@ -290,180 +295,162 @@ class NullableFloatColumn(column.Column):
     def get_default_value(self):
         return None
 
-    # pylint: disable=too-many-branches
-    # pylint: disable=too-many-statements
-    # pylint: disable=invalid-name
-    def convert_to(self, typecode):
-        converted = None
-        if typecode == utils.type_code_byte_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int8)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = int(np.int8(x))
-                else:
-                    vals[i] = 0
-
-            converted = dataframe.DataFrame.ByteColumn(values=vals)
-        elif typecode == utils.type_code_short_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int16)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = int(np.int16(x))
-                else:
-                    vals[i] = 0
-
-            converted = dataframe.DataFrame.ShortColumn(values=vals)
-        elif typecode == utils.type_code_int_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int32)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = int(np.int32(x))
-                else:
-                    vals[i] = 0
-
-            converted = dataframe.DataFrame.IntColumn(values=vals)
-        elif typecode == utils.type_code_long_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int64)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = int(np.int64(x))
-                else:
-                    vals[i] = 0
-
-            converted = dataframe.DataFrame.LongColumn(values=vals)
-        elif typecode == utils.type_code_string_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = str(x)
-                else:
-                    vals[i] = utils.default_value_string_column()
-
-            converted = dataframe.DataFrame.StringColumn(values=vals)
-        elif typecode == FloatColumn.TYPE_CODE:
-            vals = np.empty([self._values.shape[0]], dtype=np.float32)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = float(np.float32(x))
-                else:
-                    vals[i] = 0.0
-
-            converted = FloatColumn(values=vals)
-        elif typecode == utils.type_code_double_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.float64)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = float(np.float64(x))
-                else:
-                    vals[i] = 0.0
-
-            converted = dataframe.DataFrame.DoubleColumn(values=vals)
-        elif typecode == utils.type_code_char_column():
-            vals = np.zeros([self._values.shape[0]], dtype=np.uint8)
-            ord_default = ord(utils.default_value_char_column())
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = ord(str(x)[0])
-                else:
-                    vals[i] = ord_default
-
-            converted = dataframe.DataFrame.CharColumn(values=vals)
-        elif typecode == utils.type_code_boolean_column():
-            vals = np.empty([self._values.shape[0]], dtype=bool)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = (x != 0.0)
-                else:
-                    vals[i] = False
-
-            converted = dataframe.DataFrame.BooleanColumn(values=vals)
-        elif typecode == utils.type_code_binary_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = bytearray(pack(">f", x))
-                else:
-                    vals[i] = bytearray(pack(">f", 0.0))
-
-            converted = dataframe.DataFrame.BinaryColumn(values=vals)
-        elif typecode == utils.type_code_nullable_byte_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(np.int8(x)) if x is not None else None
-
-            converted = dataframe.DataFrame.NullableByteColumn(values=vals)
-        elif typecode == utils.type_code_nullable_short_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(np.int16(x)) if x is not None else None
-
-            converted = dataframe.DataFrame.NullableShortColumn(values=vals)
-        elif typecode == utils.type_code_nullable_int_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(np.int32(x)) if x is not None else None
-
-            converted = dataframe.DataFrame.NullableIntColumn(values=vals)
-        elif typecode == utils.type_code_nullable_long_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(np.int64(x)) if x is not None else None
-
-            converted = dataframe.DataFrame.NullableLongColumn(values=vals)
-        elif typecode == utils.type_code_nullable_string_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = str(x)
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableStringColumn(values=vals)
-        elif typecode == NullableFloatColumn.TYPE_CODE:
-            converted = self.clone()
-        elif typecode == utils.type_code_nullable_double_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = float(np.float64(x))
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableDoubleColumn(values=vals)
-        elif typecode == utils.type_code_nullable_char_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = ord(str(x)[0])
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableCharColumn(values=vals)
-        elif typecode == utils.type_code_nullable_boolean_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = (x != 0.0)
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableBooleanColumn(values=vals)
-        elif typecode == utils.type_code_nullable_binary_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = bytearray(pack(">f", x))
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableBinaryColumn(values=vals)
-        else:
-            raise dataframe.DataFrameException(
-                "Unknown column type code: {}".format(typecode))
+    def _to_byte(self):
+        _, data = self._densify()
+        vals = utils.cast_integers(self._values, data, np.int8)
+        return dataframe.DataFrame.ByteColumn(values=vals)
+
+    def _to_short(self):
+        _, data = self._densify()
+        vals = utils.cast_integers(self._values, data, np.int16)
+        return dataframe.DataFrame.ShortColumn(values=vals)
+
+    def _to_int(self):
+        _, data = self._densify()
+        vals = utils.cast_integers(self._values, data, np.int32)
+        return dataframe.DataFrame.IntColumn(values=vals)
+
+    def _to_long(self):
+        _, data = self._densify()
+        vals = utils.cast_integers(self._values, data, np.int64)
+        return dataframe.DataFrame.LongColumn(values=vals)
+
+    def _to_string(self):
+        default = utils.default_value_string_column()
+        vals = np.array([str(x) if x is not None else default
+                         for x in self._values], dtype=object)
+        return dataframe.DataFrame.StringColumn(values=vals)
+
+    def _to_float(self):
+        _, data = self._densify()
+        return FloatColumn(values=data.astype(np.float32))
+
+    def _to_double(self):
+        _, data = self._densify()
+        return dataframe.DataFrame.DoubleColumn(values=data)
+
+    def _to_char(self):
+        mask, data = self._densify()
+        vals = _leading_chars(data, self._values)
+        vals[mask] = ord(utils.default_value_char_column())
+        return dataframe.DataFrame.CharColumn(values=vals)
+
+    def _to_boolean(self):
+        _, data = self._densify()
+        return dataframe.DataFrame.BooleanColumn(values=(data != 0.0))
+
+    def _to_binary(self):
+        _, data = self._densify()
+        vals = _to_float32_bytearrays(self._values, data)
+        return dataframe.DataFrame.BinaryColumn(values=vals)
+
+    def _to_nullable_byte(self):
+        mask, data = self._densify()
+        vals = utils.to_objects(utils.cast_integers(self._values, data, np.int8))
+        vals[mask] = None
+        return dataframe.DataFrame.NullableByteColumn(values=vals)
+
+    def _to_nullable_short(self):
+        mask, data = self._densify()
+        vals = utils.to_objects(utils.cast_integers(self._values, data, np.int16))
+        vals[mask] = None
+        return dataframe.DataFrame.NullableShortColumn(values=vals)
+
+    def _to_nullable_int(self):
+        mask, data = self._densify()
+        vals = utils.to_objects(utils.cast_integers(self._values, data, np.int32))
+        vals[mask] = None
+        return dataframe.DataFrame.NullableIntColumn(values=vals)
+
+    def _to_nullable_long(self):
+        mask, data = self._densify()
+        vals = utils.to_objects(utils.cast_integers(self._values, data, np.int64))
+        vals[mask] = None
+        return dataframe.DataFrame.NullableLongColumn(values=vals)
+
+    def _to_nullable_string(self):
+        vals = np.array([str(x) if x is not None else None
+                         for x in self._values], dtype=object)
+        return dataframe.DataFrame.NullableStringColumn(values=vals)
+
+    def _to_nullable_float(self):
+        return self.clone()
+
+    def _to_nullable_double(self):
+        mask, data = self._densify()
+        vals = utils.to_objects(data)
+        vals[mask] = None
+        return dataframe.DataFrame.NullableDoubleColumn(values=vals)
+
+    def _to_nullable_char(self):
+        mask, data = self._densify()
+        vals = utils.to_objects(_leading_chars(data, self._values))
+        vals[mask] = None
+        return dataframe.DataFrame.NullableCharColumn(values=vals)
+
+    def _to_nullable_boolean(self):
+        mask, data = self._densify()
+        vals = utils.to_objects(data != 0.0)
+        vals[mask] = None
+        return dataframe.DataFrame.NullableBooleanColumn(values=vals)
+
+    def _to_nullable_binary(self):
+        mask, data = self._densify()
+        vals = _to_float32_bytearrays(self._values, data)
+        vals[mask] = None
+        return dataframe.DataFrame.NullableBinaryColumn(values=vals)
+
+    def _densify(self):
+        """Splits the values of this column into a null mask and a float64
+        array in which all null values are replaced by zero.
 
-        # pylint: disable=protected-access
-        converted._name = self._name
-        return converted
+        Returns:
+            A tuple holding the boolean mask which is True at all indices
+            of null values, and the float64 array of the values
+        """
+        return utils.densify(self._values, np.float64)
 
     def _create_array(self, size=0):
         return np.empty(size, dtype=object)
+
+def _to_float32_bytearrays(values, data):
+    """Converts the specified float64 array to an object array holding
+    the big-endian float32 bytes of each value as a bytearray.
+
+    Like packing a single value, this raises an OverflowError for
+    finite values which are out of range of float32.
+    """
+    with np.errstate(over="ignore"):
+        overflow = np.isinf(data.astype(np.float32)) & np.isfinite(data)
+
+    if overflow.any():
+        # let packing the value raise the corresponding error
+        _FLOAT.pack(values[np.argmax(overflow)])
+
+    return utils.to_bytearrays(data, ">f4")
+
+def _leading_chars(data, values=None):
+    """Computes the ASCII code of the first character of the string
+    representation of each value in the specified float64 array.
+
+    Python formats all values within [1e-4, 1e16) positionally, so the
+    first character of such a value is the sign or its leading integer
+    digit, which is computed arithmetically. All other values are
+    formatted individually. If the original values of a nullable Column
+    are specified, then all np.float32 objects among them are formatted
+    individually as well, since their string representation is shorter
+    than that of the equivalent Python float.
+    """
+    magnitude = np.abs(data)
+    positional = ((magnitude >= 1e-4) & (magnitude < 1e16)) | (magnitude == 0.0)
+    chars = utils.leading_chars(np.where(positional, magnitude, 0.0).astype(np.int64))
+    chars[np.signbit(data)] = ord("-")
+    for i in np.flatnonzero(~positional):
+        chars[i] = ord(str(float(data[i]))[0])
+
+    if values is not None and np.float32 in set(map(type, values)):
+        for i, x in enumerate(values):
+            if isinstance(x, np.float32):
+                chars[i] = ord(str(x)[0])
+
+    return chars
@@ -28,6 +28,8 @@ class StringColumn(column.Column):
     """
 
     TYPE_CODE = 5
+
+    __slots__ = ()
     DEFAULT_VALUE = "n/a"
 
     def __init__(self, name=None, values=None):
@@ -72,9 +74,7 @@ class StringColumn(column.Column):
                     values[i] = StringColumn.DEFAULT_VALUE
 
         elif isinstance(values, int):
-            values = np.empty(values, dtype=object)
-            for i in range(values.shape[0]):
-                values[i] = StringColumn.DEFAULT_VALUE
+            values = np.full(values, StringColumn.DEFAULT_VALUE, dtype=object)
 
         else:
             raise dataframe.DataFrameException(
@@ -123,188 +123,195 @@ class StringColumn(column.Column):
     def get_default_value(self):
         return StringColumn.DEFAULT_VALUE
 
-    # pylint: disable=too-many-branches
-    # pylint: disable=too-many-statements
-    # pylint: disable=invalid-name
-    def convert_to(self, typecode):
-        converted = None
-        if typecode == utils.type_code_byte_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int8)
-            for i, x in np.ndenumerate(self._values):
+    def _to_byte(self):
+        vals = np.empty(self._values.shape[0], dtype=np.int8)
+        for i, x in enumerate(self._values):
+            vals[i] = int(np.int8(x))
+
+        return dataframe.DataFrame.ByteColumn(values=vals)
+
+    def _to_short(self):
+        vals = np.empty(self._values.shape[0], dtype=np.int16)
+        for i, x in enumerate(self._values):
+            vals[i] = int(np.int16(x))
+
+        return dataframe.DataFrame.ShortColumn(values=vals)
+
+    def _to_int(self):
+        vals = np.empty(self._values.shape[0], dtype=np.int32)
+        for i, x in enumerate(self._values):
+            vals[i] = int(np.int32(x))
+
+        return dataframe.DataFrame.IntColumn(values=vals)
+
+    def _to_long(self):
+        vals = np.empty(self._values.shape[0], dtype=np.int64)
+        for i, x in enumerate(self._values):
+            vals[i] = int(np.int64(x))
+
+        return dataframe.DataFrame.LongColumn(values=vals)
+
+    def _to_string(self):
+        return self.clone()
+
+    def _to_float(self):
+        vals = np.empty(self._values.shape[0], dtype=np.float32)
+        for i, x in enumerate(self._values):
+            vals[i] = float(np.float32(x))
+
+        return dataframe.DataFrame.FloatColumn(values=vals)
+
+    def _to_double(self):
+        vals = np.empty(self._values.shape[0], dtype=np.float64)
+        for i, x in enumerate(self._values):
+            vals[i] = float(np.float64(x))
+
+        return dataframe.DataFrame.DoubleColumn(values=vals)
+
+    def _to_char(self):
+        vals = np.empty(self._values.shape[0], dtype=np.uint8)
+        for i, x in enumerate(self._values):
+            if x is not None:
+                vals[i] = ord(x[0])
+            else:
+                vals[i] = utils.default_value_char_column()
+
+        return dataframe.DataFrame.CharColumn(values=vals)
+
+    def _to_boolean(self):
+        values_true = {"true", "t", "1", "yes", "y", "on"}
+        values_false = {"false", "f", "0", "no", "n", "off"}
+        vals = np.empty(self._values.shape[0], dtype=bool)
+        for i, x in enumerate(self._values):
+            if x is not None:
+                x = x.lower()
+                is_true = x in values_true
+                is_false = x in values_false
+                if not is_true and not is_false:
+                    raise dataframe.DataFrameException(
+                        ("Invalid boolean string: '{}'".format(self._values[i])))
+
+                vals[i] = is_true
+            else:
+                vals[i] = False
+
+        return dataframe.DataFrame.BooleanColumn(values=vals)
+
+    def _to_binary(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None:
+                vals[i] = bytearray.fromhex(x)
+            else:
+                vals[i] = bytearray(b'\x00')
+
+        return dataframe.DataFrame.BinaryColumn(values=vals)
+
+    def _to_nullable_byte(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None:
                 vals[i] = int(np.int8(x))
+            else:
+                vals[i] = None
 
-            converted = dataframe.DataFrame.ByteColumn(values=vals)
-        elif typecode == utils.type_code_short_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int16)
-            for i, x in np.ndenumerate(self._values):
+        return dataframe.DataFrame.NullableByteColumn(values=vals)
+
+    def _to_nullable_short(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None:
                 vals[i] = int(np.int16(x))
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableShortColumn(values=vals)
 
-            converted = dataframe.DataFrame.ShortColumn(values=vals)
-        elif typecode == utils.type_code_int_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int32)
-            for i, x in np.ndenumerate(self._values):
+    def _to_nullable_int(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None:
                 vals[i] = int(np.int32(x))
+            else:
+                vals[i] = None
 
-            converted = dataframe.DataFrame.IntColumn(values=vals)
-        elif typecode == utils.type_code_long_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int64)
-            for i, x in np.ndenumerate(self._values):
+        return dataframe.DataFrame.NullableIntColumn(values=vals)
+
+    def _to_nullable_long(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None:
                 vals[i] = int(np.int64(x))
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableLongColumn(values=vals)
+
+    def _to_nullable_string(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(vals):
+            vals[i] = x
 
-            converted = dataframe.DataFrame.LongColumn(values=vals)
-        elif typecode == StringColumn.TYPE_CODE:
-            converted = self.clone()
-        elif typecode == utils.type_code_float_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.float32)
-            for i, x in np.ndenumerate(self._values):
+        return NullableStringColumn(values=vals)
+
+    def _to_nullable_float(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None:
                 vals[i] = float(np.float32(x))
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableFloatColumn(values=vals)
 
-            converted = dataframe.DataFrame.FloatColumn(values=vals)
-        elif typecode == utils.type_code_double_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.float64)
-            for i, x in np.ndenumerate(self._values):
+    def _to_nullable_double(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None:
                 vals[i] = float(np.float64(x))
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableDoubleColumn(values=vals)
+
+    def _to_nullable_char(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None:
+                vals[i] = ord(x[0])
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableCharColumn(values=vals)
+
+    def _to_nullable_boolean(self):
+        values_true = {"true", "t", "1", "yes", "y", "on"}
+        values_false = {"false", "f", "0", "no", "n", "off"}
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None:
+                x = x.lower()
+                is_true = x in values_true
+                is_false = x in values_false
+                if not is_true and not is_false:
+                    raise dataframe.DataFrameException(
+                        ("Invalid boolean string: '{}'".format(self._values[i])))
 
-            converted = dataframe.DataFrame.DoubleColumn(values=vals)
-        elif typecode == utils.type_code_char_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.uint8)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = ord(x[0])
-                else:
-                    vals[i] = utils.default_value_char_column()
-
-            converted = dataframe.DataFrame.CharColumn(values=vals)
-        elif typecode == utils.type_code_boolean_column():
-            values_true = {"true", "t", "1", "yes", "y", "on"}
-            values_false = {"false", "f", "0", "no", "n", "off"}
-            vals = np.empty([self._values.shape[0]], dtype=bool)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    x = x.lower()
-                    is_true = x in values_true
-                    is_false = x in values_false
-                    if not is_true and not is_false:
-                        raise dataframe.DataFrameException(
-                            ("Invalid boolean string: '{}'".format(self._values[i])))
-
-                    vals[i] = is_true
-                else:
-                    vals[i] = False
-
-            converted = dataframe.DataFrame.BooleanColumn(values=vals)
-        elif typecode == utils.type_code_binary_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = bytearray.fromhex(x)
-                else:
-                    vals[i] = bytearray(b'\x00')
-
-            converted = dataframe.DataFrame.BinaryColumn(values=vals)
-        elif typecode == utils.type_code_nullable_byte_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = int(np.int8(x))
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableByteColumn(values=vals)
-        elif typecode == utils.type_code_nullable_short_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = int(np.int16(x))
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableShortColumn(values=vals)
-        elif typecode == utils.type_code_nullable_int_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = int(np.int32(x))
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableIntColumn(values=vals)
-        elif typecode == utils.type_code_nullable_long_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = int(np.int64(x))
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableLongColumn(values=vals)
-        elif typecode == NullableStringColumn.TYPE_CODE:
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(vals):
-                vals[i] = x
-
-            converted = NullableStringColumn(values=vals)
-        elif typecode == utils.type_code_nullable_float_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = float(np.float32(x))
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableFloatColumn(values=vals)
-        elif typecode == utils.type_code_nullable_double_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = float(np.float64(x))
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableDoubleColumn(values=vals)
-        elif typecode == utils.type_code_nullable_char_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = ord(x[0])
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableCharColumn(values=vals)
-        elif typecode == utils.type_code_nullable_boolean_column():
-            values_true = {"true", "t", "1", "yes", "y", "on"}
-            values_false = {"false", "f", "0", "no", "n", "off"}
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    x = x.lower()
-                    is_true = x in values_true
-                    is_false = x in values_false
-                    if not is_true and not is_false:
-                        raise dataframe.DataFrameException(
-                            ("Invalid boolean string: '{}'".format(self._values[i])))
-
-                    vals[i] = is_true
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableBooleanColumn(values=vals)
-        elif typecode == utils.type_code_nullable_binary_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = bytearray.fromhex(x)
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableBinaryColumn(values=vals)
-        else:
-            raise dataframe.DataFrameException(
-                "Unknown column type code: {}".format(typecode))
+                vals[i] = is_true
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableBooleanColumn(values=vals)
+
+    def _to_nullable_binary(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None:
+                vals[i] = bytearray.fromhex(x)
+            else:
+                vals[i] = None
 
-        # pylint: disable=protected-access
-        converted._name = self._name
-        return converted
+        return dataframe.DataFrame.NullableBinaryColumn(values=vals)
 
     def _create_array(self, size=0):
         return np.empty(size, dtype=object)
@@ -316,6 +323,8 @@ class NullableStringColumn(column.Column):
 
     TYPE_CODE = 14
 
+    __slots__ = ()
+
     def __init__(self, name=None, values=None):
         """Constructs a new NullableStringColumn.
 
@@ -380,198 +389,205 @@ class NullableStringColumn(column.Column):
     def get_default_value(self):
         return None
 
-    # pylint: disable=too-many-branches
-    # pylint: disable=too-many-statements
-    # pylint: disable=invalid-name
-    def convert_to(self, typecode):
-        converted = None
-        if typecode == utils.type_code_byte_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int8)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = int(np.int8(x))
-                else:
-                    vals[i] = 0
-
-            converted = dataframe.DataFrame.ByteColumn(values=vals)
-        elif typecode == utils.type_code_short_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int16)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = int(np.int16(x))
-                else:
-                    vals[i] = 0
-
-            converted = dataframe.DataFrame.ShortColumn(values=vals)
-        elif typecode == utils.type_code_int_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int32)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = int(np.int32(x))
-                else:
-                    vals[i] = 0
-
-            converted = dataframe.DataFrame.IntColumn(values=vals)
-        elif typecode == utils.type_code_long_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.int64)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = int(np.int64(x))
-                else:
-                    vals[i] = 0
-
-            converted = dataframe.DataFrame.LongColumn(values=vals)
-        elif typecode == StringColumn.TYPE_CODE:
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = str(x)
-                else:
-                    vals[i] = StringColumn.DEFAULT_VALUE
-
-            converted = StringColumn(values=vals)
-        elif typecode == utils.type_code_float_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.float32)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = float(np.float32(x))
-                else:
-                    vals[i] = 0.0
-
-            converted = dataframe.DataFrame.FloatColumn(values=vals)
-        elif typecode == utils.type_code_double_column():
-            vals = np.empty([self._values.shape[0]], dtype=np.float64)
-            for i, x in np.ndenumerate(self._values):
-                if x is not None:
-                    vals[i] = float(np.float64(x))
-                else:
-                    vals[i] = 0.0
-
-            converted = dataframe.DataFrame.DoubleColumn(values=vals)
-        elif typecode == utils.type_code_char_column():
-            vals = np.zeros([self._values.shape[0]], dtype=np.uint8)
-            ord_default = ord(utils.default_value_char_column())
-            for i, x in np.ndenumerate(self._values):
-                if x:
-                    vals[i] = ord(x[0])
-                else:
-                    vals[i] = ord_default
-
-            converted = dataframe.DataFrame.CharColumn(values=vals)
-        elif typecode == utils.type_code_boolean_column():
-            values_true = {"true", "t", "1", "yes", "y", "on"}
-            values_false = {"false", "f", "0", "no", "n", "off"}
-            vals = np.empty([self._values.shape[0]], dtype=bool)
-            for i, x in np.ndenumerate(self._values):
-                if x:
-                    x = x.lower()
-                    is_true = x in values_true
-                    is_false = x in values_false
-                    if not is_true and not is_false:
-                        raise dataframe.DataFrameException(
-                            ("Invalid boolean string: '{}'".format(self._values[i])))
-
-                    vals[i] = is_true
-                else:
-                    vals[i] = False
-
-            converted = dataframe.DataFrame.BooleanColumn(values=vals)
-        elif typecode == utils.type_code_binary_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x:
-                    vals[i] = bytearray.fromhex(x)
-                else:
-                    vals[i] = bytearray(b'\x00')
-
-            converted = dataframe.DataFrame.BinaryColumn(values=vals)
-        elif typecode == utils.type_code_nullable_byte_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(np.int8(x)) if x is not None else None
-
-            converted = dataframe.DataFrame.NullableByteColumn(values=vals)
-        elif typecode == utils.type_code_nullable_short_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(np.int16(x)) if x is not None else None
-
-            converted = dataframe.DataFrame.NullableShortColumn(values=vals)
-        elif typecode == utils.type_code_nullable_int_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(np.int32(x)) if x is not None else None
-
-            converted = dataframe.DataFrame.NullableIntColumn(values=vals)
-        elif typecode == utils.type_code_nullable_long_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                vals[i] = int(np.int64(x)) if x is not None else None
-
-            converted = dataframe.DataFrame.NullableLongColumn(values=vals)
-        elif typecode == NullableStringColumn.TYPE_CODE:
-            converted = self.clone()
-        elif typecode == utils.type_code_nullable_float_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x:
-                    vals[i] = float(np.float32(x))
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableFloatColumn(values=vals)
-        elif typecode == utils.type_code_nullable_double_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x:
-                    vals[i] = float(np.float64(x))
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableDoubleColumn(values=vals)
-        elif typecode == utils.type_code_nullable_char_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x:
-                    vals[i] = str(x)[0]
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableCharColumn(values=vals)
-        elif typecode == utils.type_code_nullable_boolean_column():
-            values_true = {"true", "t", "1", "yes", "y", "on"}
-            values_false = {"false", "f", "0", "no", "n", "off"}
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x:
-                    x = x.lower()
-                    is_true = x in values_true
-                    is_false = x in values_false
-                    if not is_true and not is_false:
-                        raise dataframe.DataFrameException(
-                            ("Invalid boolean string: '{}'".format(self._values[i])))
-
-                    vals[i] = is_true
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableBooleanColumn(values=vals)
-        elif typecode == utils.type_code_nullable_binary_column():
-            vals = np.empty([self._values.shape[0]], dtype=object)
-            for i, x in np.ndenumerate(self._values):
-                if x:
-                    vals[i] = bytearray.fromhex(x)
-                else:
-                    vals[i] = None
-
-            converted = dataframe.DataFrame.NullableBinaryColumn(values=vals)
-        else:
-            raise dataframe.DataFrameException(
-                "Unknown column type code: {}".format(typecode))
+    def _to_byte(self):
+        vals = np.empty(self._values.shape[0], dtype=np.int8)
+        for i, x in enumerate(self._values):
+            if x is not None:
+                vals[i] = int(np.int8(x))
+            else:
+                vals[i] = 0
+
+        return dataframe.DataFrame.ByteColumn(values=vals)
+
+    def _to_short(self):
+        vals = np.empty(self._values.shape[0], dtype=np.int16)
+        for i, x in enumerate(self._values):
+            if x is not None:
+                vals[i] = int(np.int16(x))
+            else:
+                vals[i] = 0
+
+        return dataframe.DataFrame.ShortColumn(values=vals)
+
+    def _to_int(self):
+        vals = np.empty(self._values.shape[0], dtype=np.int32)
+        for i, x in enumerate(self._values):
+            if x is not None:
+                vals[i] = int(np.int32(x))
+            else:
+                vals[i] = 0
+
+        return dataframe.DataFrame.IntColumn(values=vals)
+
+    def _to_long(self):
+        vals = np.empty(self._values.shape[0], dtype=np.int64)
+        for i, x in enumerate(self._values):
+            if x is not None:
+                vals[i] = int(np.int64(x))
+            else:
+                vals[i] = 0
+
+        return dataframe.DataFrame.LongColumn(values=vals)
+
+    def _to_string(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x is not None:
+                vals[i] = str(x)
+            else:
+                vals[i] = StringColumn.DEFAULT_VALUE
+
+        return StringColumn(values=vals)
+
+    def _to_float(self):
+        vals = np.empty(self._values.shape[0], dtype=np.float32)
+        for i, x in enumerate(self._values):
+            if x is not None:
+                vals[i] = float(np.float32(x))
+            else:
+                vals[i] = 0.0
+
+        return dataframe.DataFrame.FloatColumn(values=vals)
+
+    def _to_double(self):
+        vals = np.empty(self._values.shape[0], dtype=np.float64)
+        for i, x in enumerate(self._values):
+            if x is not None:
+                vals[i] = float(np.float64(x))
+            else:
+                vals[i] = 0.0
+
+        return dataframe.DataFrame.DoubleColumn(values=vals)
+
+    def _to_char(self):
+        vals = np.zeros(self._values.shape[0], dtype=np.uint8)
+        ord_default = ord(utils.default_value_char_column())
+        for i, x in enumerate(self._values):
+            if x:
+                vals[i] = ord(x[0])
+            else:
+                vals[i] = ord_default
+
+        return dataframe.DataFrame.CharColumn(values=vals)
+
+    def _to_boolean(self):
+        values_true = {"true", "t", "1", "yes", "y", "on"}
+        values_false = {"false", "f", "0", "no", "n", "off"}
+        vals = np.empty(self._values.shape[0], dtype=bool)
+        for i, x in enumerate(self._values):
+            if x:
+                x = x.lower()
+                is_true = x in values_true
+                is_false = x in values_false
+                if not is_true and not is_false:
+                    raise dataframe.DataFrameException(
+                        ("Invalid boolean string: '{}'".format(self._values[i])))
+
+                vals[i] = is_true
+            else:
+                vals[i] = False
+
+        return dataframe.DataFrame.BooleanColumn(values=vals)
+
+    def _to_binary(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x:
+                vals[i] = bytearray.fromhex(x)
+            else:
+                vals[i] = bytearray(b'\x00')
+
+        return dataframe.DataFrame.BinaryColumn(values=vals)
+
+    def _to_nullable_byte(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = int(np.int8(x)) if x is not None else None
+
+        return dataframe.DataFrame.NullableByteColumn(values=vals)
+
+    def _to_nullable_short(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = int(np.int16(x)) if x is not None else None
+
+        return dataframe.DataFrame.NullableShortColumn(values=vals)
+
+    def _to_nullable_int(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = int(np.int32(x)) if x is not None else None
+
+        return dataframe.DataFrame.NullableIntColumn(values=vals)
+
+    def _to_nullable_long(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            vals[i] = int(np.int64(x)) if x is not None else None
+
+        return dataframe.DataFrame.NullableLongColumn(values=vals)
+
+    def _to_nullable_string(self):
+        return self.clone()
+
+    def _to_nullable_float(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x:
+                vals[i] = float(np.float32(x))
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableFloatColumn(values=vals)
+
+    def _to_nullable_double(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x:
+                vals[i] = float(np.float64(x))
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableDoubleColumn(values=vals)
+
+    def _to_nullable_char(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x:
+                vals[i] = str(x)[0]
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableCharColumn(values=vals)
+
+    def _to_nullable_boolean(self):
+        values_true = {"true", "t", "1", "yes", "y", "on"}
+        values_false = {"false", "f", "0", "no", "n", "off"}
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x:
+                x = x.lower()
+                is_true = x in values_true
+                is_false = x in values_false
+                if not is_true and not is_false:
+                    raise dataframe.DataFrameException(
+                        ("Invalid boolean string: '{}'".format(self._values[i])))
+
+                vals[i] = is_true
+            else:
+                vals[i] = None
+
+        return dataframe.DataFrame.NullableBooleanColumn(values=vals)
+
+    def _to_nullable_binary(self):
+        vals = np.empty(self._values.shape[0], dtype=object)
+        for i, x in enumerate(self._values):
+            if x:
+                vals[i] = bytearray.fromhex(x)
+            else:
+                vals[i] = None
 
-        # pylint: disable=protected-access
-        converted._name = self._name
-        return converted
+        return dataframe.DataFrame.NullableBinaryColumn(values=vals)
 
     def _create_array(self, size=0):
         return np.empty(size, dtype=object)
@@ -36,6 +36,7 @@ class TestCSV(unittest.TestCase):
     FILE_NOHEADER      = os.path.join(os.path.dirname(__file__), "test_noheader.csv")
     FILE_MALFORMED     = os.path.join(os.path.dirname(__file__), "test_nullable_malformed.csv")
     FILE_EMPTY_LINES   = os.path.join(os.path.dirname(__file__), "test_empty_lines.csv")
+    FILE_INVALID       = os.path.join(os.path.dirname(__file__), "test_invalid.csv")
 
     DF_DEFAULT             = None
     DF_DEFAULT_AS_STRING   = None
@@ -163,6 +164,17 @@ class TestCSV(unittest.TestCase):
 
         self.assertTrue(truth == df, "DataFrames do not match")
 
+    def test_file_read_with_types_invalid_value(self):
+        if not os.path.exists(TestCSV.FILE_INVALID):
+            self.fail("Test resource '{}' was not found".format(TestCSV.FILE_INVALID))
+
+        with self.assertRaisesRegex(IOError, "at line: 3"):
+            csv.read(TestCSV.FILE_INVALID, types=("int", "double", "string"))
+
+        # the row at line 5 has more fields than the header
+        with self.assertRaisesRegex(IOError, "at line: 5"):
+            csv.read(TestCSV.FILE_INVALID, types=("double", "double", "string"))
+
 
 if __name__ == "__main__":
     unittest.main()
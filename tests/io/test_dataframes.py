@@ -17,6 +17,7 @@ Tests for DataFrame serialization and file I/O implementation.
 """
 
 import os
+import tempfile
 
 import unittest
 
@@ -308,6 +309,15 @@ class TestDataFramesIO(unittest.TestCase):
         res = DataFrame.deserialize(b)
         self.assertTrue(res.equals(TestDataFramesIO.df_nullable), "DataFrames are not equal")
 
+    def test_deserialization_compressed_keeps_argument(self):
+        b = DataFrame.serialize(TestDataFramesIO.df_default, compress=True)
+        original = bytearray(b)
+        res = DataFrame.deserialize(b)
+        self.assertTrue(res.equals(TestDataFramesIO.df_default), "DataFrames are not equal")
+        self.assertTrue(b == original, "Argument bytearray should not be modified")
+        res = DataFrame.deserialize(b)
+        self.assertTrue(res.equals(TestDataFramesIO.df_default), "DataFrames are not equal")
+
     def stress_test_default(self):
         df = DataFrame.copy(TestDataFramesIO.df_default)
         for _ in range(df.columns()):
@@ -379,6 +389,26 @@ class TestDataFramesIO(unittest.TestCase):
             files["test_nullable"].equals(DataFrame.read(TestDataFramesIO.FILE_NULLABLE)),
             "DataFrames do not match")
 
+    def test_file_write_multiple_files_in_dir(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            DataFrame.write(tmpdir, {"default": TestDataFramesIO.df_default,
+                                     "nullable.df": TestDataFramesIO.df_nullable,
+                                     "default_again": TestDataFramesIO.df_default})
+
+            files = DataFrame.read(tmpdir)
+            self.assertTrue(len(files) == 3, "Returned dict should have 3 elements")
+            self.assertTrue(
+                files["default"].equals(TestDataFramesIO.df_default),
+                "DataFrames do not match")
+
+            self.assertTrue(
+                files["nullable"].equals(TestDataFramesIO.df_nullable),
+                "DataFrames do not match")
+
+            self.assertTrue(
+                files["default_again"].equals(TestDataFramesIO.df_default),
+                "DataFrames do not match")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,107 @@
+# Copyright (C) 2023 Raven Computing
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Tests reading of Parquet files.
+"""
+
+import os
+import tempfile
+
+import unittest
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+from raven.struct.dataframe import (DataFrame,
+                                    DefaultDataFrame,
+                                    NullableDataFrame)
+
+
+@unittest.skipIf(pyarrow is None, "requires the 'pyarrow' package")
+class TestParquet(unittest.TestCase):
+    """Tests reading of Parquet files."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.file = os.path.join(self.tmpdir.name, "test.parquet")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write_table(self, columns):
+        table = pyarrow.table(columns)
+        pyarrow.parquet.write_table(table, self.file)
+
+    def test_file_read(self):
+        self.write_table({
+            "byteCol": pyarrow.array([1, 2, 3], pyarrow.int8()),
+            "shortCol": pyarrow.array([1, 2, 3], pyarrow.int16()),
+            "intCol": pyarrow.array([1, 2, 3], pyarrow.int32()),
+            "longCol": pyarrow.array([1, 2, 3], pyarrow.int64()),
+            "floatCol": pyarrow.array([1.5, 2.5, 3.5], pyarrow.float32()),
+            "doubleCol": pyarrow.array([1.1, 2.2, 3.3], pyarrow.float64()),
+            "stringCol": pyarrow.array(["a", "b", "c"], pyarrow.string()),
+            "booleanCol": pyarrow.array([True, False, True], pyarrow.bool_()),
+            "binaryCol": pyarrow.array([b"\x01", b"\x02", b"\x03"], pyarrow.binary())})
+
+        truth = DefaultDataFrame(
+            DataFrame.ByteColumn("byteCol", [1, 2, 3]),
+            DataFrame.ShortColumn("shortCol", [1, 2, 3]),
+            DataFrame.IntColumn("intCol", [1, 2, 3]),
+            DataFrame.LongColumn("longCol", [1, 2, 3]),
+            DataFrame.FloatColumn("floatCol", [1.5, 2.5, 3.5]),
+            DataFrame.DoubleColumn("doubleCol", [1.1, 2.2, 3.3]),
+            DataFrame.StringColumn("stringCol", ["a", "b", "c"]),
+            DataFrame.BooleanColumn("booleanCol", [True, False, True]),
+            DataFrame.BinaryColumn("binaryCol", [bytearray.fromhex("01"),
+                                                 bytearray.fromhex("02"),
+                                                 bytearray.fromhex("03")]))
+
+        df = DataFrame.read_parquet(self.file)
+        self.assertTrue(truth == df, "DataFrames do not match")
+        df.set_int("intCol", 0, 42)
+        self.assertTrue(df.get_int("intCol", 0) == 42, "Column values should be modifiable")
+
+    def test_file_read_nullable(self):
+        self.write_table({
+            "intCol": pyarrow.array([1, None, 3], pyarrow.int32()),
+            "stringCol": pyarrow.array(["a", "b", None], pyarrow.string())})
+
+        truth = NullableDataFrame(
+            DataFrame.NullableIntColumn("intCol", [1, None, 3]),
+            DataFrame.NullableStringColumn("stringCol", ["a", "b", None]))
+
+        df = DataFrame.read_parquet(self.file)
+        self.assertTrue(truth == df, "DataFrames do not match")
+
+    def test_file_read_selected_columns(self):
+        self.write_table({
+            "intCol": pyarrow.array([1, 2, 3], pyarrow.int32()),
+            "stringCol": pyarrow.array(["a", "b", "c"], pyarrow.string())})
+
+        df = DataFrame.read_parquet(self.file, columns=["stringCol"])
+        truth = DefaultDataFrame(DataFrame.StringColumn("stringCol", ["a", "b", "c"]))
+        self.assertTrue(truth == df, "DataFrames do not match")
+
+    def test_file_read_unsupported_type(self):
+        self.write_table({"uintCol": pyarrow.array([1, 2, 3], pyarrow.uint32())})
+        self.assertRaises(IOError, DataFrame.read_parquet, self.file)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -20,6 +20,7 @@ import unittest
 
 import numpy as np
 
+from raven.struct.dataframe.core import DataFrameException
 from raven.struct.dataframe.bytecolumn import ByteColumn, NullableByteColumn
 from raven.struct.dataframe.shortcolumn import ShortColumn, NullableShortColumn
 from raven.struct.dataframe.intcolumn import IntColumn, NullableIntColumn
@@ -592,6 +593,24 @@ class TestColumn(unittest.TestCase):
         self.assertTrue(col.get_name() == "colname")
         self.assertTrue(col.capacity() == 5)
 
+    def test_construct_named_numpy_uint8_nullablecharcolumn(self):
+        # specify as ASCII-values
+        #                   A   B   C   D   E
+        values = np.array([65, 66, 67, 68, 69], dtype=np.uint8)
+        col = NullableCharColumn("colname", values)
+        self.assertTrue(col.type_code() == NullableCharColumn.TYPE_CODE)
+        self.assertTrue(col.capacity() == 5)
+        self.assertTrue(col.as_array().dtype == "object")
+        self.assertTrue([col[i] for i in range(5)] == ["A", "B", "C", "D", "E"])
+
+    def test_construct_numpy_charcolumn_invalid_value(self):
+        values = np.array([65, 66, 10, 68, 69], dtype=np.uint8)
+        self.assertRaisesRegex(
+            DataFrameException, "at index 2", CharColumn, "colname", values)
+
+        self.assertRaisesRegex(
+            DataFrameException, "at index 2", NullableCharColumn, "colname", values)
+
     def test_construct_nullablebooleancolumn(self):
         col = NullableBooleanColumn(values=[True, None, None, False, True])
         self.assertTrue(col.type_code() == NullableBooleanColumn.TYPE_CODE)
@@ -1324,6 +1343,122 @@ class TestColumn(unittest.TestCase):
 
             self.assertTrue(isinstance(converted, col_class))
 
+    def test_convert_nullable_double_column_to_integer_out_of_range(self):
+        col = NullableDoubleColumn("col", [300.0, None, -129.0])
+        self.assertRaises(OverflowError, col.convert_to, ByteColumn.TYPE_CODE)
+        self.assertRaises(OverflowError, col.convert_to, NullableByteColumn.TYPE_CODE)
+        converted = col.convert_to(ShortColumn.TYPE_CODE)
+        self.assertEqual(converted.as_array().tolist(), [300, 0, -129])
+        converted = col.convert_to(NullableIntColumn.TYPE_CODE)
+        self.assertEqual(converted.as_array().tolist(), [300, None, -129])
+
+        col = NullableDoubleColumn("col", [1.0, None, 2.0**40])
+        for col_class in (ByteColumn, ShortColumn, IntColumn,
+                          NullableByteColumn, NullableShortColumn, NullableIntColumn):
+            self.assertRaises(OverflowError, col.convert_to, col_class.TYPE_CODE)
+
+        col = NullableDoubleColumn("col", [1.0, None, float("inf")])
+        for col_class in (ByteColumn, ShortColumn, IntColumn,
+                          NullableByteColumn, NullableShortColumn, NullableIntColumn):
+            self.assertRaises(OverflowError, col.convert_to, col_class.TYPE_CODE)
+
+        col = NullableDoubleColumn("col", [1.0, None, float("nan")])
+        for col_class in (ByteColumn, ShortColumn, IntColumn,
+                          NullableByteColumn, NullableShortColumn, NullableIntColumn):
+            self.assertRaises(ValueError, col.convert_to, col_class.TYPE_CODE)
+
+
+    def test_convert_nullable_float_column_to_integer_out_of_range(self):
+        col = NullableFloatColumn("col", [300.0, None, -129.0])
+        self.assertRaises(OverflowError, col.convert_to, ByteColumn.TYPE_CODE)
+        self.assertRaises(OverflowError, col.convert_to, NullableByteColumn.TYPE_CODE)
+        converted = col.convert_to(ShortColumn.TYPE_CODE)
+        self.assertEqual(converted.as_array().tolist(), [300, 0, -129])
+        converted = col.convert_to(NullableIntColumn.TYPE_CODE)
+        self.assertEqual(converted.as_array().tolist(), [300, None, -129])
+
+        col = NullableFloatColumn("col", [1.0, None, 2.0**40])
+        for col_class in (ByteColumn, ShortColumn, IntColumn,
+                          NullableByteColumn, NullableShortColumn, NullableIntColumn):
+            self.assertRaises(OverflowError, col.convert_to, col_class.TYPE_CODE)
+
+        col = NullableFloatColumn("col", [1.0, None, float("inf")])
+        for col_class in (ByteColumn, ShortColumn, IntColumn,
+                          NullableByteColumn, NullableShortColumn, NullableIntColumn):
+            self.assertRaises(OverflowError, col.convert_to, col_class.TYPE_CODE)
+
+        col = NullableFloatColumn("col", [1.0, None, float("nan")])
+        for col_class in (ByteColumn, ShortColumn, IntColumn,
+                          NullableByteColumn, NullableShortColumn, NullableIntColumn):
+            self.assertRaises(ValueError, col.convert_to, col_class.TYPE_CODE)
+
+    def test_convert_float_column_to_char(self):
+        col = FloatColumn("col", [1e-05, 1e16, -0.0, float("nan"), float("inf"),
+                                  -float("inf"), 123.5, 0.5, -2.5e-7, 3e20])
+
+        converted = col.convert_to(NullableCharColumn.TYPE_CODE)
+        self.assertEqual([converted[i] for i in range(converted.capacity())],
+                         ["9", "1", "-", "n", "i", "-", "1", "0", "-", "3"])
+
+    def test_convert_nullable_float_column_to_char(self):
+        col = NullableFloatColumn("col", [1e-05, 1e16, -0.0, float("nan"), float("inf"),
+                                          -float("inf"), 123.5, 0.5, -2.5e-7, 3e20, None,
+                                          np.float32(1e-4), np.float32(-1e-4)])
+
+        converted = col.convert_to(CharColumn.TYPE_CODE)
+        self.assertEqual([converted[i] for i in range(converted.capacity())],
+                         ["1", "1", "-", "n", "i", "-", "1", "0", "-", "3", "?", "1", "-"])
+
+        converted = col.convert_to(NullableCharColumn.TYPE_CODE)
+        self.assertEqual([converted[i] for i in range(converted.capacity())],
+                         ["1", "1", "-", "n", "i", "-", "1", "0", "-", "3", None, "1", "-"])
+
+    def test_convert_nullable_float_column_to_binary_out_of_range(self):
+        col = NullableFloatColumn("col", [1.0, None, 1e39])
+        self.assertRaises(OverflowError, col.convert_to, BinaryColumn.TYPE_CODE)
+        self.assertRaises(OverflowError, col.convert_to, NullableBinaryColumn.TYPE_CODE)
+
+        col = NullableFloatColumn("col", [1.0, None, -1e39])
+        self.assertRaises(OverflowError, col.convert_to, BinaryColumn.TYPE_CODE)
+        self.assertRaises(OverflowError, col.convert_to, NullableBinaryColumn.TYPE_CODE)
+
+        col = NullableFloatColumn("col", [1.0, None, float("inf")])
+        converted = col.convert_to(NullableBinaryColumn.TYPE_CODE)
+        self.assertEqual(converted.as_array().tolist(),
+                         [bytearray.fromhex("3f800000"), None,
+                          bytearray.fromhex("7f800000")])
+
+    def test_convert_nullable_long_column_to_integer_out_of_range(self):
+        col = NullableLongColumn("col", [300, None, -129])
+        self.assertRaises(OverflowError, col.convert_to, ByteColumn.TYPE_CODE)
+        self.assertRaises(OverflowError, col.convert_to, NullableByteColumn.TYPE_CODE)
+        converted = col.convert_to(ShortColumn.TYPE_CODE)
+        self.assertEqual(converted.as_array().tolist(), [300, 0, -129])
+        converted = col.convert_to(NullableIntColumn.TYPE_CODE)
+        self.assertEqual(converted.as_array().tolist(), [300, None, -129])
+
+        col = NullableLongColumn("col", [1, None, 2**40])
+        for col_class in (ByteColumn, ShortColumn, IntColumn,
+                          NullableByteColumn, NullableShortColumn, NullableIntColumn):
+            self.assertRaises(OverflowError, col.convert_to, col_class.TYPE_CODE)
+
+    def test_convert_nullable_int_column_to_integer_out_of_range(self):
+        col = NullableIntColumn("col", [300, None, -129])
+        self.assertRaises(OverflowError, col.convert_to, ByteColumn.TYPE_CODE)
+        self.assertRaises(OverflowError, col.convert_to, NullableByteColumn.TYPE_CODE)
+        converted = col.convert_to(ShortColumn.TYPE_CODE)
+        self.assertEqual(converted.as_array().tolist(), [300, 0, -129])
+        converted = col.convert_to(NullableShortColumn.TYPE_CODE)
+        self.assertEqual(converted.as_array().tolist(), [300, None, -129])
+
+        col = NullableIntColumn("col", [1, None, 40000])
+        for col_class in (ByteColumn, ShortColumn,
+                          NullableByteColumn, NullableShortColumn):
+            self.assertRaises(OverflowError, col.convert_to, col_class.TYPE_CODE)
+
+        converted = col.convert_to(IntColumn.TYPE_CODE)
+        self.assertEqual(converted.as_array().tolist(), [1, 0, 40000])
+
 
 
     #********************************************#
@@ -878,6 +878,47 @@ class TestDataFrameUtils(unittest.TestCase):
         self.assertRaises(
             DataFrameException, DataFrame.merge, df1, df2, None)
 
+    def test_merge_copy(self):
+        df1 = DefaultDataFrame(
+            StringColumn("A", ["AAA", "AAB", "AAC"]),
+            BinaryColumn("B", [bytearray.fromhex("01"),
+                               bytearray.fromhex("02"),
+                               bytearray.fromhex("03")]))
+
+        df2 = NullableDataFrame(
+            NullableIntColumn("A", [0, None, 2]),
+            NullableFloatColumn("D", [0.1, 0.2, None]))
+
+        truth = DataFrame.merge(DataFrame.copy(df1), DataFrame.copy(df2))
+        res = DataFrame.merge_copy(df1, df2)
+        self.assertTrue(
+            isinstance(res, NullableDataFrame),
+            "DataFrame should be of type NullableDataFrame")
+
+        self.assertTrue(res == truth, "DataFrames do not match")
+        self.assertTrue(
+            ["A", "B"] == df1.get_column_names(),
+            "Column names of the origin should not change")
+
+        df1.get_binary("B", 0)[0] = 0x7f
+        df2.set_int("A", 0, 42)
+        self.assertTrue(
+            res.get_binary("B", 0) == bytearray.fromhex("01"),
+            "Merged Column should be independent from its origin")
+
+        self.assertTrue(
+            res.get_int("A_1", 0) == 0,
+            "Merged Column should be independent from its origin")
+
+    def test_merge_copy_one_arg(self):
+        df1 = DefaultDataFrame(
+            StringColumn("A", ["AAA", "AAB", "AAC"]),
+            FloatColumn("B", [11.11, 22.22, 33.33]))
+
+        res = DataFrame.merge_copy(df1)
+        self.assertTrue(res is not df1, "DataFrame should be a copy")
+        self.assertTrue(res == df1, "DataFrames do not match")
+
 
 
     #***************************************#
@@ -902,6 +943,21 @@ class TestDataFrameUtils(unittest.TestCase):
         self.assertTrue(self.df.get_row(1) == conv.get_row(1), "Rows do not match")
         self.assertTrue(self.df.get_row(2) == conv.get_row(2), "Rows do not match")
 
+    def test_convert_from_default_to_nullable_with_buffer(self):
+        self.df.add_row(self.df.get_row(0))
+        conv = DataFrame.convert_to(self.df, "NullableDataFrame")
+        self.assertTrue(conv.rows() == 4, "DataFrame should have 4 rows")
+        self.assertTrue(conv.capacity() == 4, "DataFrame should have a capacity of 4")
+        self.assertTrue(self.df.get_row(3) == conv.get_row(3), "Rows do not match")
+        conv.set_row(0, [None] * 10)
+        self.assertTrue(
+            self.df.get_row(0) == conv.get_row(3),
+            "Source DataFrame should not be changed")
+
+        self.assertTrue(
+            conv.get_row(0) == [None] * 10,
+            "Converted DataFrame should accept None values")
+
     def test_convert_from_nullable_to_default(self):
         conv = DataFrame.convert_to(self.nulldf, "DefaultDataFrame")
         self.assertTrue(
@@ -921,6 +977,26 @@ class TestDataFrameUtils(unittest.TestCase):
                     obj[i][j] is not None,
                     "Converted DataFrame should not contain any None values")
 
+    def test_convert_large(self):
+        n = 20000
+        df = NullableDataFrame(
+            NullableIntColumn("A", [None if i % 3 == 0 else i for i in range(n)]),
+            NullableDoubleColumn("B", [None if i % 5 == 0 else float(i) for i in range(n)]),
+            NullableStringColumn("C", [None if i % 2 == 0 else str(i) for i in range(n)]),
+            NullableBooleanColumn("D", [None if i % 7 == 0 else i % 2 == 0 for i in range(n)]))
+
+        conv = DataFrame.convert_to(df, "default")
+        self.assertTrue(isinstance(conv, DefaultDataFrame), "DataFrame should be a DefaultDataFrame")
+        self.assertTrue(conv.get_column_names() == ["A", "B", "C", "D"], "Column names should match")
+        self.assertTrue(conv.rows() == n, "DataFrame should have {} rows".format(n))
+        self.assertTrue(conv.get_row(0) == [0, 0.0, "n/a", False], "Null values should be replaced")
+        self.assertTrue(conv.get_row(1) == [1, 1.0, "1", False], "Row does not match")
+
+        back = DataFrame.convert_to(conv, "nullable")
+        self.assertTrue(isinstance(back, NullableDataFrame), "DataFrame should be a NullableDataFrame")
+        self.assertTrue(back.get_column_names() == ["A", "B", "C", "D"], "Column names should match")
+        self.assertTrue(back.get_row(n - 1) == conv.get_row(n - 1), "Row does not match")
+
 
 
     #*********************************************#
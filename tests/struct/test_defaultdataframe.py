@@ -19,6 +19,7 @@ Tests for DefaultDataFrame implementation.
 import unittest
 import math
 import struct
+import sys
 
 from raven.struct.dataframe.core import (DataFrame,
                                          DefaultDataFrame,
@@ -447,6 +448,13 @@ class TestDefaultDataFrame(unittest.TestCase):
             col = self.df.get_column(i)
             self.assertEqual(names[i], col.get_name(), "Column name does not match")
 
+    def test_set_column_names_interned(self):
+        names = ["".join(["col", str(i)]) for i in range(self.df.columns())]
+        self.df.set_column_names(names)
+        for i, name in enumerate(self.df.get_column_names()):
+            self.assertTrue(
+                name is sys.intern("col" + str(i)), "Column name should be interned")
+
     def test_set_column_names_varargs(self):
         names = ["A","B","C","D","E","F","G","H","I","J"]
         self.df.set_column_names("A","B","C","D","E","F","G","H","I","J")
@@ -519,6 +527,16 @@ class TestDefaultDataFrame(unittest.TestCase):
             (20,21,22,23,"20","b",20.2,21.2,False,bytearray.fromhex("0060")),
             row, "Row does not match set values")
 
+    def test_iter_rows(self):
+        rows = list(self.df.iter_rows(buffer_size=2))
+        self.assertTrue(len(rows) == self.df.rows(), "Iterator should yield all rows")
+        for i, row in enumerate(rows):
+            self.assertTrue(isinstance(row, tuple), "Row should be a tuple")
+            self.assertSequenceAlmostEqual(
+                self.df.get_row(i), row, "Row does not match get_row()")
+
+        self.assertRaises(DataFrameException, self.df.iter_rows, 0)
+
     def test_get_rows(self):
         res = self.df.get_rows(1, 3)
         self.assertTrue(res.rows() == 2, "DataFrame should have 2 rows")
@@ -1612,6 +1630,32 @@ class TestDefaultDataFrame(unittest.TestCase):
             DataFrameException,
             self.df.replace, "longCol", "(1|2|3)3", lambda i, v: "NOT_A_LONG")
 
+    def test_replace_lambda_fail_out_of_range(self):
+        self.assertRaises(
+            DataFrameException, self.df.replace, "byteCol", "30", lambda v: v * 100)
+        self.assertRaises(
+            DataFrameException, self.df.replace, "intCol", None, lambda v: v * 2**30)
+        self.assertRaises(
+            DataFrameException, self.df.replace, "intCol", None, lambda v: v + 2**31)
+        self.assertTrue(self.df.get_byte("byteCol", 2) == 30, "Value should not be replaced")
+        self.assertTrue(self.df.get_int("intCol", 0) == 12, "Value should not be replaced")
+
+    def test_replace_lambda_python_types(self):
+        types = set()
+        self.df.replace("byteCol", None, lambda v: types.add(type(v)) or v)
+        self.df.replace("intCol", None, lambda v: types.add(type(v)) or v)
+        self.df.replace("longCol", None, lambda i, v: types.add(type(v)) or v)
+        types.discard(type(None))
+        self.assertTrue(types == {int}, "Function should receive int values")
+        types = set()
+        self.df.replace("floatCol", None, lambda v: types.add(type(v)) or v)
+        self.df.replace("doubleCol", None, lambda i, v: types.add(type(v)) or v)
+        types.discard(type(None))
+        self.assertTrue(types == {float}, "Function should receive float values")
+        # float values are matched by their representation as a Python float
+        count = self.df.replace("floatCol", "10\\.1", 9.0)
+        self.assertTrue(count == 0, "Replacement count should be zero")
+
     def test_replace_identity(self):
         count = self.df.replace(3, replacement=lambda i, v: v)
         self.assertTrue(count == 0, "Replacement count should be zero")
@@ -2724,6 +2768,21 @@ class TestDefaultDataFrame(unittest.TestCase):
         self.df.clear()
         self.assertTrue(math.isnan(self.df.sum("byteCol")), "Computed sum should be NaN")
 
+    def test_sum_large(self):
+        n = 100003
+        df2 = DefaultDataFrame(
+            ByteColumn("bytes", [1] * n),
+            LongColumn("longs", list(range(n))),
+            DoubleColumn("doubles", [0.5] * n))
+
+        self.assertTrue(df2.sum("bytes") == n, "Computed sum should be {}".format(n))
+        self.assertTrue(
+            df2.sum("longs") == (n * (n - 1)) // 2, "Computed sum does not match")
+        self.assertAlmostEqual(
+            n * 0.5, df2.sum("doubles"), places=5, msg="Computed sum does not match")
+        self.assertAlmostEqual(
+            0.5, df2.average("doubles"), places=5, msg="Computed average should be 0.5")
+
     def test_minimum_rank(self):
         res1 = self.toBeSorted.minimum(0, 1)
         res2 = self.toBeSorted.minimum(1, 1)
@@ -2998,6 +3057,39 @@ class TestDefaultDataFrame(unittest.TestCase):
             self.toBeSorted.get_column_names(),
             "Column names should be equal")
 
+    def test_minimum_rank_with_nan(self):
+        df = DefaultDataFrame(
+            IntColumn("id", [0, 1, 2, 3, 4, 5]),
+            FloatColumn("floats", [3.0, float("nan"), 1.0, 2.0, float("nan"), 5.0]),
+            DoubleColumn("doubles", [3.0, float("nan"), 1.0, 2.0, float("nan"), 5.0]))
+
+        # NaN values are taken as soon as they are the
+        # first remaining entry in row order
+        for col in ("floats", "doubles"):
+            res = df.minimum(col, 10)
+            self.assertTrue(res.rows() == 6, "DataFrame should have 6 rows")
+            self.assertTrue(
+                [res.get_int("id", i) for i in range(res.rows())] == [2, 3, 0, 1, 4, 5],
+                "Rows should be ordered by minimum")
+
+    def test_maximum_rank_with_nan(self):
+        df = DefaultDataFrame(
+            IntColumn("id", [0, 1, 2, 3, 4, 5]),
+            FloatColumn("floats", [3.0, float("nan"), 1.0, 2.0, float("nan"), 5.0]),
+            DoubleColumn("doubles", [3.0, float("nan"), 1.0, 2.0, float("nan"), 5.0]))
+
+        for col in ("floats", "doubles"):
+            res = df.maximum(col, 3)
+            self.assertTrue(res.rows() == 3, "DataFrame should have 3 rows")
+            self.assertTrue(
+                [res.get_int("id", i) for i in range(res.rows())] == [5, 0, 1],
+                "Rows should be ordered by maximum")
+
+            res = df.maximum(col, 2)
+            self.assertTrue(
+                [res.get_int("id", i) for i in range(res.rows())] == [5, 0],
+                "Rows should be ordered by maximum")
+
     def test_minimum_exception(self):
         self.assertRaises(DataFrameException, self.df.minimum, "stringCol")
         self.assertRaises(DataFrameException, self.df.minimum, "binaryCol")
@@ -3412,6 +3504,31 @@ class TestDefaultDataFrame(unittest.TestCase):
         for val in vals:
             self.assertTrue(math.isnan(val), "DataFrame is not sorted correctly")
 
+    def test_sort_is_stable(self):
+        df = DefaultDataFrame(
+            DataFrame.IntColumn("A", [2, 1, 2, 1, 2]),
+            DataFrame.StringColumn("B", ["a", "b", "c", "d", "e"]),
+            DataFrame.BinaryColumn("C", [bytearray.fromhex("01"),
+                                         bytearray.fromhex("0203"),
+                                         bytearray.fromhex("04"),
+                                         bytearray.fromhex("0506"),
+                                         bytearray.fromhex("07")]))
+
+        df.sort_ascending_by("A")
+        self.assertTrue(
+            df.get_column("B").as_array().tolist() == ["b", "d", "a", "c", "e"],
+            "DataFrame is not sorted stably")
+
+        df.sort_descending_by("A")
+        self.assertTrue(
+            df.get_column("B").as_array().tolist() == ["a", "c", "e", "b", "d"],
+            "DataFrame is not sorted stably")
+
+        df.sort_descending_by("C")
+        self.assertTrue(
+            df.get_column("B").as_array().tolist() == ["b", "d", "a", "c", "e"],
+            "DataFrame is not sorted stably")
+
 
 
     #***************************************#
@@ -3514,6 +3631,23 @@ class TestDefaultDataFrame(unittest.TestCase):
         self.assertFalse(test1.equals(test2), "Equals method should return false")
         self.assertFalse(test1 == test2, "DataFrames should not be equal")
 
+    def test_equals_large(self):
+        n = 20000
+        test1 = DefaultDataFrame(
+            IntColumn("A", list(range(n))),
+            LongColumn("B", list(range(n))),
+            DoubleColumn("C", [float(i) for i in range(n)]),
+            StringColumn("D", [str(i) for i in range(n)]),
+            BooleanColumn("E", [i % 2 == 0 for i in range(n)]))
+
+        test2 = test1.clone()
+        self.assertTrue(test1.equals(test2), "Equals method should return true")
+        test2.set_double("C", n - 1, 0.5)
+        self.assertFalse(test1.equals(test2), "Equals method should return false")
+        test2 = test1.clone()
+        test2.set_string("D", 0, "X")
+        self.assertFalse(test1.equals(test2), "Equals method should return false")
+
     def test_equals_hash_code_contract_after_io(self):
         test1 = self.df.clone()
         test2 = test1
@@ -522,6 +522,16 @@ class TestNullableDataFrame(unittest.TestCase):
             (None,None,None,None,None,None,None,None,None,None),
             row, "Row does not match set values")
 
+    def test_iter_rows(self):
+        rows = list(self.df.iter_rows(buffer_size=2))
+        self.assertTrue(len(rows) == self.df.rows(), "Iterator should yield all rows")
+        for i, row in enumerate(rows):
+            self.assertTrue(isinstance(row, tuple), "Row should be a tuple")
+            self.assertSequenceAlmostEqual(
+                self.df.get_row(i), row, "Row does not match get_row()")
+
+        self.assertRaises(DataFrameException, self.df.iter_rows, 0)
+
     def test_get_rows(self):
         res = self.df.get_rows(1, 3)
         self.assertTrue(res.rows() == 2, "DataFrame should have 2 rows")
@@ -1729,6 +1739,29 @@ class TestNullableDataFrame(unittest.TestCase):
             DataFrameException,
             self.df.replace, "longCol", "(1|2|3)3", lambda i, v: "NOT_A_LONG")
 
+    def test_replace_lambda_fail_out_of_range(self):
+        self.assertRaises(
+            DataFrameException, self.df.replace, "byteCol", "30", lambda v: v * 100)
+        self.assertRaises(
+            DataFrameException, self.df.replace, "intCol", "12", lambda v: v * 2**30)
+        self.assertRaises(
+            DataFrameException, self.df.replace, "intCol", "12", lambda v: v + 2**31)
+        self.assertTrue(self.df.get_byte("byteCol", 2) == 30, "Value should not be replaced")
+        self.assertTrue(self.df.get_int("intCol", 0) == 12, "Value should not be replaced")
+
+    def test_replace_lambda_python_types(self):
+        types = set()
+        self.df.replace("byteCol", None, lambda v: types.add(type(v)) or v)
+        self.df.replace("intCol", None, lambda v: types.add(type(v)) or v)
+        self.df.replace("longCol", None, lambda i, v: types.add(type(v)) or v)
+        types.discard(type(None))
+        self.assertTrue(types == {int}, "Function should receive int values")
+        types = set()
+        self.df.replace("floatCol", None, lambda v: types.add(type(v)) or v)
+        self.df.replace("doubleCol", None, lambda i, v: types.add(type(v)) or v)
+        types.discard(type(None))
+        self.assertTrue(types == {float}, "Function should receive float values")
+
     def test_replace_identity(self):
         count = self.df.replace(3, replacement=lambda i, v: v)
         self.assertTrue(count == 0, "Replacement count should be zero")
@@ -3017,6 +3050,21 @@ class TestNullableDataFrame(unittest.TestCase):
         self.assertTrue(math.isnan(df2.sum("floats")), "Computed sum should be NaN")
         self.assertTrue(math.isnan(df2.sum("doubles")), "Computed sum should be NaN")
 
+    def test_sum_without_nulls(self):
+        df2 = NullableDataFrame(
+            NullableIntColumn("ints", [1, 2, 3, 4]),
+            NullableDoubleColumn("doubles", [1.5, 2.5, -3.0, 4.0]))
+
+        self.assertTrue(df2.sum("ints") == 10, "Computed sum should be 10")
+        self.assertAlmostEqual(
+            5.0, df2.sum("doubles"), places=5, msg="Computed sum should be 5.0")
+        self.assertTrue(df2.minimum("ints") == 1, "Computed minimum should be 1")
+        self.assertTrue(df2.maximum("ints") == 4, "Computed maximum should be 4")
+        self.assertAlmostEqual(
+            -3.0, df2.minimum("doubles"), places=5, msg="Computed minimum should be -3.0")
+        self.assertAlmostEqual(
+            1.25, df2.average("doubles"), places=5, msg="Computed average should be 1.25")
+
     def test_minimum_rank(self):
         res1 = self.toBeSorted.minimum(0, 1)
         res2 = self.toBeSorted.minimum(1, 1)
@@ -3287,6 +3335,39 @@ class TestNullableDataFrame(unittest.TestCase):
             self.toBeSorted.get_column_names(),
             "Column names should be equal")
 
+    def test_minimum_rank_with_nan(self):
+        df = NullableDataFrame(
+            NullableIntColumn("id", [0, 1, 2, 3, 4, 5, 6]),
+            NullableFloatColumn("floats", [3.0, float("nan"), None, 1.0, 2.0, float("nan"), 5.0]),
+            NullableDoubleColumn("doubles", [3.0, float("nan"), None, 1.0, 2.0, float("nan"), 5.0]))
+
+        # None values are excluded whereas NaN values are taken as soon
+        # as they are the first remaining entry in row order
+        for col in ("floats", "doubles"):
+            res = df.minimum(col, 10)
+            self.assertTrue(res.rows() == 6, "DataFrame should have 6 rows")
+            self.assertTrue(
+                [res.get_int("id", i) for i in range(res.rows())] == [3, 4, 0, 1, 5, 6],
+                "Rows should be ordered by minimum")
+
+    def test_maximum_rank_with_nan(self):
+        df = NullableDataFrame(
+            NullableIntColumn("id", [0, 1, 2, 3, 4, 5, 6]),
+            NullableFloatColumn("floats", [3.0, float("nan"), None, 1.0, 2.0, float("nan"), 5.0]),
+            NullableDoubleColumn("doubles", [3.0, float("nan"), None, 1.0, 2.0, float("nan"), 5.0]))
+
+        for col in ("floats", "doubles"):
+            res = df.maximum(col, 3)
+            self.assertTrue(res.rows() == 3, "DataFrame should have 3 rows")
+            self.assertTrue(
+                [res.get_int("id", i) for i in range(res.rows())] == [6, 0, 1],
+                "Rows should be ordered by maximum")
+
+            res = df.maximum(col, 2)
+            self.assertTrue(
+                [res.get_int("id", i) for i in range(res.rows())] == [6, 0],
+                "Rows should be ordered by maximum")
+
     def test_minimum_exception(self):
         self.assertRaises(DataFrameException, self.df.minimum, "stringCol")
         self.assertRaises(DataFrameException, self.df.minimum, "binaryCol")